@@ -0,0 +1,128 @@
+"""
+Measure group membership insert throughput for each bulk insert path.
+
+Run against a disposable, migrated database::
+
+    python -m benchmarks.bulk_insert_members --members 1000000 --mode copy
+    python -m benchmarks.bulk_insert_members --members 1000000 --mode executemany
+    python -m benchmarks.bulk_insert_members --members 1000000 --mode values \
+        --chunk-size 4000
+
+The script seeds enough users and groups for ``--members`` distinct
+memberships, then inserts the memberships inside a transaction that is
+rolled back afterwards, so every mode runs on the same data. ``copy`` is
+``bulk_persist`` on asyncpg, ``executemany`` is its fallback for other
+drivers and ``values`` calls ``persist_many`` with chunks of ``--chunk-size``
+models, the multi-row ``INSERT ... VALUES ... RETURNING`` used before. A
+membership has seven columns and Postgres takes at most 32767 parameters per
+statement, so ``values`` needs ``--chunk-size 4681`` or less. The script
+prints the elapsed time and rows per second.
+"""
+import argparse
+import asyncio
+import itertools
+import math
+import time
+import uuid
+from datetime import date
+from typing import Iterator
+
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+from src.core.models.group import Group, GroupMember
+from src.core.models.user import User
+from src.infrastructure.repositories.group import GroupMemberRepository, GroupRepository
+from src.infrastructure.repositories.user import UserRepository
+from src.settings import settings
+
+DEFAULT_MEMBERS = 1000000
+
+
+async def _seed(
+    conn: AsyncConnection,
+    members: int,
+) -> tuple[list[uuid.UUID], list[uuid.UUID]]:
+    side = math.isqrt(members - 1) + 1
+    users = [
+        User(
+            email=f"{uuid.uuid4().hex}@example.com",
+            password_hash="",
+            date_of_birth=date.fromisoformat("1990-01-01"),
+        )
+        for _ in range(side)
+    ]
+    groups = [Group(name=uuid.uuid4().hex) for _ in range(side)]
+    await UserRepository(conn).bulk_persist(users)
+    await GroupRepository(conn).bulk_persist(groups)
+    return [user.id for user in users], [group.id for group in groups]
+
+
+def _members(
+    user_ids: list[uuid.UUID],
+    group_ids: list[uuid.UUID],
+    count: int,
+) -> Iterator[GroupMember]:
+    pairs = itertools.product(user_ids, group_ids)
+    yield from (
+        GroupMember(user_id=user_id, group_id=group_id)
+        for user_id, group_id in itertools.islice(pairs, count)
+    )
+
+
+async def _insert(
+    conn: AsyncConnection,
+    mode: str,
+    members: Iterator[GroupMember],
+    chunk_size: int,
+) -> int:
+    repository = GroupMemberRepository(conn)
+    if mode == "copy":
+        return await repository.bulk_persist(members, chunk_size=chunk_size)
+    if mode == "executemany":
+        return await repository._insert_chunks(members, chunk_size)  # noqa: WPS437
+
+    count = 0
+    while True:
+        chunk = list(itertools.islice(members, chunk_size))
+        if not chunk:
+            return count
+        await repository.persist_many(chunk)
+        count += len(chunk)
+
+
+async def main(args: argparse.Namespace) -> None:
+    engine = create_async_engine(settings.postgres_url)
+    try:  # noqa: WPS501
+        async with engine.begin() as conn:
+            user_ids, group_ids = await _seed(conn, args.members)
+
+        async with engine.connect() as conn:
+            async with conn.begin() as transaction:
+                members = _members(user_ids, group_ids, args.members)
+                started_at = time.perf_counter()
+                count = await _insert(conn, args.mode, members, args.chunk_size)
+                elapsed = time.perf_counter() - started_at
+                await transaction.rollback()
+    finally:
+        await engine.dispose()
+
+    print(  # noqa: WPS421
+        f"{args.mode}: {count} rows in {elapsed:.2f}s "
+        f"({count / elapsed:,.0f} rows/s)",
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--members", type=int, default=DEFAULT_MEMBERS)
+    parser.add_argument(
+        "--mode",
+        choices=["copy", "executemany", "values"],
+        default="copy",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=settings.BULK_INSERT_CHUNK_SIZE,
+    )
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,89 @@
+"""
+Measure the per-request cost of applying a filter set.
+
+No database is needed::
+
+    python -m benchmarks.filter_plan --iterations 100000
+
+``legacy`` is how ``SQLAlchemyRepository`` used to build its criteria: dump
+the filter set, split every key on ``__``, look up the operator, build a
+``Filter`` and convert it to a ``SQLAlchemyFilter``. ``plan`` applies the plan
+compiled when the filter set class was defined. Both build the same criteria
+for a ``GroupMemberFilterSet`` with every field set, and both are also timed
+matching a single in-memory member, which is what the test fakes do. The
+script prints the mean time per call.
+"""
+import argparse
+import operator
+import timeit
+import uuid
+
+from sqlalchemy import ColumnElement
+
+from src.core.filters.base import Filter, FilterSet, SQLAlchemyFilter
+from src.core.filters.group import GroupMemberFilterSet
+from src.core.models.group import GroupMember
+from src.infrastructure.database.tables.group import group_member_table
+
+MICROSECONDS = 1000000
+DEFAULT_ITERATIONS = 100000
+
+LEGACY_OPERATORS = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "lt": operator.lt,
+    "le": operator.le,
+    "gt": operator.gt,
+    "ge": operator.ge,
+}
+
+
+def _legacy_filters(filter_set: FilterSet) -> list[Filter]:
+    filters = []
+    for key, value in filter_set.model_dump(
+        exclude_none=True,
+        exclude_unset=True,
+    ).items():
+        field, operator_ = key.split("__")
+        filters.append(
+            Filter(field=field, operator=LEGACY_OPERATORS[operator_], value=value),
+        )
+    return filters
+
+
+def _legacy_expressions(filter_set: FilterSet) -> list[ColumnElement[bool]]:
+    return [
+        SQLAlchemyFilter.from_filter(filter_)(group_member_table)
+        for filter_ in _legacy_filters(filter_set)
+    ]
+
+
+def _legacy_matches(filter_set: FilterSet, item: GroupMember) -> bool:
+    return all(filter_(item) for filter_ in _legacy_filters(filter_set))
+
+
+def main(args: argparse.Namespace) -> None:
+    member = GroupMember(user_id=uuid.uuid4(), group_id=uuid.uuid4())
+    filter_set = GroupMemberFilterSet(
+        group_id__eq=member.group_id,
+        user_id__eq=member.user_id,
+        is_admin__eq=False,
+        is_owner__eq=False,
+    )
+    cases = {
+        "legacy sql": lambda: _legacy_expressions(filter_set),
+        "plan sql": lambda: filter_set.get_expressions(group_member_table),
+        "legacy match": lambda: _legacy_matches(filter_set, member),
+        "plan match": lambda: filter_set.matches(member),
+    }
+    for label, case in cases.items():
+        elapsed = timeit.timeit(case, number=args.iterations)
+        print(  # noqa: WPS421
+            f"{label:>12}: {elapsed / args.iterations * MICROSECONDS:.2f}us per call",
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    main(parser.parse_args())
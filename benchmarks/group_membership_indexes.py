@@ -0,0 +1,183 @@
+"""
+Compare membership lookup plans with and without the group membership indexes.
+
+The indexes are the ones added in migration ``b72e4d1a9c05``.
+
+Run against a disposable, migrated database::
+
+    python -m benchmarks.group_membership_indexes --seed --users 20000 --groups 2000
+    python -m benchmarks.group_membership_indexes --without-indexes
+    python -m benchmarks.group_membership_indexes
+
+``--seed`` fills the group tables with random memberships and requests.
+``--without-indexes`` drops the membership indexes inside a transaction that
+is rolled back afterwards, so the "before" numbers can be taken on the same
+data. For each query the script prints the ``EXPLAIN ANALYZE`` plan and
+p50/p99 latency over ``--samples`` executions.
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+from datetime import date
+
+from sqlalchemy import Select, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+from src.core.enums.group import GroupRequestStatus
+from src.infrastructure.database.tables.group import (
+    group_member_table,
+    group_request_table,
+    group_table,
+)
+from src.infrastructure.database.tables.user import user_table
+from src.settings import settings
+
+INDEXES = (
+    "ix_group_member_group_id_user_id",
+    "ix_group_member_user_id",
+    "ix_group_request_pending_user_id_group_id",
+)
+P50 = 49
+P99 = 98
+GROUPS_PAGE_SIZE = 50
+DATE_OF_BIRTH = date.fromisoformat("1990-01-01")
+DEFAULT_USERS = 20000
+DEFAULT_GROUPS = 2000
+DEFAULT_SAMPLES = 500
+
+
+async def _seed(conn: AsyncConnection, users: int, groups: int, per_user: int) -> None:
+    user_ids = [uuid.uuid4() for _ in range(users)]
+    group_ids = [uuid.uuid4() for _ in range(groups)]
+    await conn.execute(
+        insert(user_table),
+        [
+            {
+                "id": user_id,
+                "email": f"{user_id.hex}@example.com",
+                "password_hash": "",  # noqa: S105
+                "date_of_birth": DATE_OF_BIRTH,
+                "is_active": True,
+            }
+            for user_id in user_ids
+        ],
+    )
+    await conn.execute(
+        insert(group_table),
+        [{"id": group_id, "name": group_id.hex} for group_id in group_ids],
+    )
+
+    members, requests = [], []
+    for user_id in user_ids:
+        joined = random.sample(group_ids, per_user * 2)  # noqa: S311
+        members += [
+            {"id": uuid.uuid4(), "user_id": user_id, "group_id": group_id}
+            for group_id in joined[:per_user]
+        ]
+        requests += [
+            {
+                "id": uuid.uuid4(),
+                "user_id": user_id,
+                "group_id": group_id,
+                "status": random.choice(list(GroupRequestStatus)),  # noqa: S311
+            }
+            for group_id in joined[per_user:]
+        ]
+    await conn.execute(insert(group_member_table), members)
+    await conn.execute(insert(group_request_table), requests)
+
+
+async def _sample_pair(conn: AsyncConnection) -> tuple[uuid.UUID, uuid.UUID]:
+    stmt = select(group_member_table.c.user_id, group_member_table.c.group_id)
+    row = (await conn.execute(stmt.order_by(text("random()")).limit(1))).one()
+    return row.user_id, row.group_id
+
+
+def _queries(user_id: uuid.UUID, group_id: uuid.UUID) -> dict[str, Select]:
+    return {
+        "member by user and group": select(group_member_table)
+        .where(
+            group_member_table.c.user_id == user_id,
+            group_member_table.c.group_id == group_id,
+        )
+        .limit(1),
+        "membership flags": select(
+            group_member_table.c.is_admin,
+            group_member_table.c.is_owner,
+        ).where(
+            group_member_table.c.group_id == group_id,
+            group_member_table.c.user_id == user_id,
+        ),
+        "pending request": select(group_request_table)
+        .where(
+            group_request_table.c.user_id == user_id,
+            group_request_table.c.group_id == group_id,
+            group_request_table.c.status == GroupRequestStatus.PENDING,
+        )
+        .limit(1),
+        "groups for user": select(group_table)
+        .join(group_member_table)
+        .where(group_member_table.c.user_id == user_id)
+        .order_by(group_table.c.created_at, group_table.c.id)
+        .limit(GROUPS_PAGE_SIZE),
+    }
+
+
+async def _measure(conn: AsyncConnection, stmt: Select, samples: int) -> list[float]:
+    latencies = []
+    for _ in range(samples):
+        started_at = time.perf_counter()
+        (await conn.execute(stmt)).all()
+        latencies.append(time.perf_counter() - started_at)
+    return latencies
+
+
+async def _drop_indexes(conn: AsyncConnection) -> None:
+    for index in INDEXES:
+        await conn.execute(text(f"DROP INDEX IF EXISTS {index}"))
+
+
+async def _report(conn: AsyncConnection, samples: int, without_indexes: bool) -> None:
+    if without_indexes:
+        await _drop_indexes(conn)
+    await conn.execute(text('ANALYZE group_member, group_request, "group"'))
+    user_id, group_id = await _sample_pair(conn)
+    for label, stmt in _queries(user_id, group_id).items():
+        compiled = stmt.compile(conn.engine, compile_kwargs={"literal_binds": True})
+        plan = await conn.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {compiled}"))
+        latencies = await _measure(conn, stmt, samples)
+        quantiles = statistics.quantiles(latencies, n=100)
+        print(f"-- {label}")  # noqa: WPS421
+        print("\n".join(row[0] for row in plan))  # noqa: WPS421
+        print(  # noqa: WPS421
+            f"p50={quantiles[P50] * 1000:.3f}ms p99={quantiles[P99] * 1000:.3f}ms\n",
+        )
+
+
+async def main(args: argparse.Namespace) -> None:
+    engine = create_async_engine(settings.postgres_url)
+    try:  # noqa: WPS501
+        if args.seed:
+            async with engine.begin() as seed_conn:
+                await _seed(seed_conn, args.users, args.groups, args.groups_per_user)
+
+        async with engine.connect() as conn:
+            transaction = await conn.begin()
+            await _report(conn, args.samples, without_indexes=args.without_indexes)
+            await transaction.rollback()
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seed", action="store_true")
+    parser.add_argument("--users", type=int, default=DEFAULT_USERS)
+    parser.add_argument("--groups", type=int, default=DEFAULT_GROUPS)
+    parser.add_argument("--groups-per-user", type=int, default=5)
+    parser.add_argument("--without-indexes", action="store_true")
+    parser.add_argument("--samples", type=int, default=DEFAULT_SAMPLES)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,104 @@
+"""
+Measure ``GET /groups/`` latency while a login storm is running.
+
+Run against a live server with an existing, active user::
+
+    python -m benchmarks.login_storm --email user@example.com --password password123
+
+The script first samples ``/groups/`` latency on an idle worker, then repeats
+the measurement while ``--logins`` concurrent clients keep hitting
+``/auth/login/`` and prints p50/p99 for both phases.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+P50 = 49
+P99 = 98
+DEFAULT_LOGINS = 32
+DEFAULT_SAMPLES = 200
+
+
+async def _login(client: httpx.AsyncClient, email: str, password: str) -> str:
+    response = await client.post(
+        "/auth/login/",
+        data={"username": email, "password": password},
+    )
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+async def _login_storm(
+    client: httpx.AsyncClient,
+    email: str,
+    password: str,
+    stop: asyncio.Event,
+) -> None:
+    while not stop.is_set():
+        await client.post(
+            "/auth/login/",
+            data={"username": email, "password": password},
+        )
+
+
+async def _sample_groups_latency(
+    client: httpx.AsyncClient,
+    access_token: str,
+    samples: int,
+) -> list[float]:
+    headers = {"Authorization": f"Bearer {access_token}"}
+    latencies = []
+    for _ in range(samples):
+        started_at = time.perf_counter()
+        response = await client.get("/groups/", headers=headers)
+        latencies.append(time.perf_counter() - started_at)
+        response.raise_for_status()
+    return latencies
+
+
+def _report(label: str, latencies: list[float]) -> None:
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(  # noqa: WPS421
+        f"{label:>12}: p50={quantiles[P50] * 1000:.1f}ms "
+        f"p99={quantiles[P99] * 1000:.1f}ms max={max(latencies) * 1000:.1f}ms",
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    limits = httpx.Limits(max_connections=args.logins + 1)
+    async with httpx.AsyncClient(
+        base_url=args.base_url,
+        limits=limits,
+        timeout=httpx.Timeout(None),
+    ) as client:
+        access_token = await _login(client, args.email, args.password)
+        _report(
+            "idle",
+            await _sample_groups_latency(client, access_token, args.samples),
+        )
+
+        stop = asyncio.Event()
+        storm = [
+            asyncio.create_task(_login_storm(client, args.email, args.password, stop))
+            for _ in range(args.logins)
+        ]
+        try:  # noqa: WPS501
+            latencies = await _sample_groups_latency(client, access_token, args.samples)
+        finally:
+            stop.set()
+            await asyncio.gather(*storm)
+
+        _report("login storm", latencies)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000/api/v1")
+    parser.add_argument("--email", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--logins", type=int, default=DEFAULT_LOGINS)
+    parser.add_argument("--samples", type=int, default=DEFAULT_SAMPLES)
+    asyncio.run(main(parser.parse_args()))
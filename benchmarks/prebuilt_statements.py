@@ -0,0 +1,150 @@
+"""
+Measure the Python overhead of issuing the hot repository queries.
+
+The queries are timed both with and without the prebuilt statements.
+
+No database is needed::
+
+    python -m benchmarks.prebuilt_statements --iterations 20000
+
+For every query the script does what SQLAlchemy does before a statement is
+sent to asyncpg: build the cache key, look the compiled form up in a warm
+compiled cache and collect the parameters. ``inline`` builds a new
+``select()`` with literal values on every call, like the repositories used
+to. ``prebuilt`` reuses the statement cached by the repository and passes the
+values as parameters. The script prints the mean time per call.
+"""
+import argparse
+import asyncio
+import timeit
+import uuid
+from typing import Any, Awaitable, Callable, TypeAlias
+
+from sqlalchemy import ARRAY, Executable, IteratorResult, any_, bindparam, select
+from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
+from sqlalchemy.engine.result import SimpleResultMetaData
+
+from src.core.exceptions import DoesNotExistError
+from src.infrastructure.database.tables.group import group_member_table
+from src.infrastructure.database.tables.user import user_table
+from src.infrastructure.repositories.group import GroupMemberRepository
+from src.infrastructure.repositories.user import UserRepository
+
+MICROSECONDS = 1000000
+DEFAULT_ITERATIONS = 20000
+
+Case: TypeAlias = tuple[Callable[[], Any], Callable[[], Any]]
+
+_dialect = PGDialect_asyncpg()
+_compiled_cache: dict[Any, Any] = {}
+
+
+def _prepare(stmt: Executable, params: dict[str, Any]) -> dict[str, Any]:
+    # The step SQLAlchemy runs before every execution, it has no public
+    # entry point.
+    compiled, extracted, _ = stmt._compile_w_cache(  # type: ignore # noqa: WPS437
+        _dialect,
+        compiled_cache=_compiled_cache,
+        column_keys=sorted(params),
+        for_executemany=False,
+        schema_translate_map=None,
+    )
+    return compiled.construct_params(
+        params,
+        extracted_parameters=extracted,
+        escape_names=False,
+    )
+
+
+class _CapturingConnection:
+    """Records the statements a repository executes and finds no rows."""
+
+    def __init__(self) -> None:
+        self.statements: list[Executable] = []
+
+    async def execute(self, stmt: Executable, *args: Any) -> Any:
+        self.statements.append(stmt)
+        return IteratorResult(SimpleResultMetaData([]), iter([]))
+
+
+async def _capture(call: Callable[[Any], Awaitable[Any]]) -> Executable:
+    conn = _CapturingConnection()
+    try:
+        await call(conn)
+    except DoesNotExistError:
+        pass
+    return conn.statements[-1]
+
+
+async def _cases() -> dict[str, Case]:
+    user_id, group_id, email = uuid.uuid4(), uuid.uuid4(), "user@example.com"
+    get_by_ids = await _capture(lambda conn: UserRepository(conn).get(user_id))
+    get_by_email = await _capture(
+        lambda conn: UserRepository(conn).get_by_email(email),
+    )
+    get_member = await _capture(
+        lambda conn: GroupMemberRepository(conn).get_by_user_and_group_id(
+            user_id,
+            group_id,
+        ),
+    )
+    return {
+        "get": (
+            lambda: _prepare(
+                select(user_table).where(
+                    user_table.c.id
+                    == any_(
+                        bindparam("ids", [user_id], type_=ARRAY(user_table.c.id.type)),
+                    ),
+                    user_table.c.deleting_at.is_(None),
+                ),
+                {},
+            ),
+            lambda: _prepare(get_by_ids, {"ids": [user_id]}),
+        ),
+        "get_by_email": (
+            lambda: _prepare(
+                select(user_table)
+                .where(
+                    user_table.c.email == email,
+                    user_table.c.deleting_at.is_(None),
+                )
+                .limit(1),
+                {},
+            ),
+            lambda: _prepare(get_by_email, {"email": email}),
+        ),
+        "get_by_user_and_group_id": (
+            lambda: _prepare(
+                select(group_member_table)
+                .where(
+                    group_member_table.c.user_id == user_id,
+                    group_member_table.c.group_id == group_id,
+                )
+                .limit(1),
+                {},
+            ),
+            lambda: _prepare(get_member, {"user_id": user_id, "group_id": group_id}),
+        ),
+    }
+
+
+def main(args: argparse.Namespace) -> None:
+    for label, (inline, prebuilt) in asyncio.run(_cases()).items():
+        # Warm the compiled cache.
+        inline()
+        prebuilt()
+        timings = [
+            timeit.timeit(case, number=args.iterations) / args.iterations
+            for case in (inline, prebuilt)
+        ]
+        print(  # noqa: WPS421
+            f"{label:>24}: inline={timings[0] * MICROSECONDS:.2f}us "
+            f"prebuilt={timings[1] * MICROSECONDS:.2f}us",
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    main(parser.parse_args())
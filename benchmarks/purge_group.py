@@ -0,0 +1,178 @@
+"""
+Compare deleting a large group inline with deleting it through a purge job.
+
+Run against a disposable, migrated database::
+
+    python -m benchmarks.purge_group --members 100000
+    python -m benchmarks.purge_group --members 100000 --inline
+
+Each run seeds a group with ``--members`` members (and as many users) and
+deletes it. ``--inline`` deletes all members, requests and the group in one
+transaction, like ``GroupService.delete_group`` used to. Otherwise the group
+is marked as deleting, which is all the request has to wait for, and the
+purge job then removes the rows in batches of ``--batch-size``. The script
+prints how long the request-facing part took, the total time and the longest
+single transaction, which bounds how long any row lock is held.
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import date
+
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.core.enums.purge import PurgeEntity
+from src.core.models.purge import PurgeJob
+from src.core.services.purge import PurgeJobRunner
+from src.infrastructure.database.tables.group import (
+    group_member_table,
+    group_request_table,
+    group_table,
+)
+from src.infrastructure.database.tables.user import user_table
+from src.infrastructure.repositories.group import (
+    GroupMemberRepository,
+    GroupRepository,
+    GroupRequestRepository,
+)
+from src.infrastructure.repositories.purge import PurgeJobRepository
+from src.infrastructure.repositories.user import UserRepository
+from src.settings import settings
+
+SEED_CHUNK_SIZE = 10000
+DEFAULT_MEMBERS = 100000
+DATE_OF_BIRTH = date.fromisoformat("1990-01-01")
+
+
+async def _seed(engine: AsyncEngine, members: int) -> uuid.UUID:
+    group_id = uuid.uuid4()
+    async with engine.begin() as conn:
+        await conn.execute(
+            insert(group_table),
+            [{"id": group_id, "name": group_id.hex}],
+        )
+        for offset in range(0, members, SEED_CHUNK_SIZE):
+            user_ids = [
+                uuid.uuid4() for _ in range(min(SEED_CHUNK_SIZE, members - offset))
+            ]
+            await conn.execute(
+                insert(user_table),
+                [
+                    {
+                        "id": user_id,
+                        "email": f"{user_id.hex}@example.com",
+                        "password_hash": "",  # noqa: S105
+                        "date_of_birth": DATE_OF_BIRTH,
+                    }
+                    for user_id in user_ids
+                ],
+            )
+            await conn.execute(
+                insert(group_member_table),
+                [
+                    {"id": uuid.uuid4(), "user_id": user_id, "group_id": group_id}
+                    for user_id in user_ids
+                ],
+            )
+    return group_id
+
+
+async def _delete_inline(engine: AsyncEngine, group_id: uuid.UUID) -> float:
+    started_at = time.perf_counter()
+    async with engine.begin() as conn:
+        await conn.execute(
+            delete(group_member_table).where(group_member_table.c.group_id == group_id),
+        )
+        await conn.execute(
+            delete(group_request_table).where(
+                group_request_table.c.group_id == group_id,
+            ),
+        )
+        await conn.execute(delete(group_table).where(group_table.c.id == group_id))
+    return time.perf_counter() - started_at
+
+
+class _TimedPurgeJobRepository(PurgeJobRepository):
+    """Records the time between progress updates, i.e. the length of each batch."""
+
+    batches: list[float]
+
+    async def update(self, *args, **kwargs) -> None:
+        now = time.perf_counter()
+        self.batches.append(now - self._last_update)
+        self._last_update = now
+        await super().update(*args, **kwargs)
+
+    def start(self) -> None:
+        self.batches = []
+        self._last_update = time.perf_counter()
+
+
+async def _delete_with_purge(
+    engine: AsyncEngine,
+    group_id: uuid.UUID,
+    batch_size: int,
+) -> tuple[float, float, float]:
+    autocommit_engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+    async with autocommit_engine.connect() as conn:
+        job_repository = _TimedPurgeJobRepository(conn)
+        job = PurgeJob(entity=PurgeEntity.GROUP, entity_id=group_id)
+
+        started_at = time.perf_counter()
+        await GroupRepository(conn).mark_deleting(group_id)
+        await job_repository.persist(job)
+        marked_at = time.perf_counter()
+
+        runner = PurgeJobRunner(
+            job_repository,
+            UserRepository(conn),
+            GroupRepository(conn),
+            GroupMemberRepository(conn),
+            GroupRequestRepository(conn),
+            batch_size=batch_size,
+        )
+        job_repository.start()
+        await runner.run(job.id)
+        finished_at = time.perf_counter()
+
+    return (
+        marked_at - started_at,
+        finished_at - started_at,
+        max(job_repository.batches),
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    engine = create_async_engine(settings.postgres_url)
+    try:  # noqa: WPS501
+        group_id = await _seed(engine, args.members)
+        if args.inline:
+            elapsed = await _delete_inline(engine, group_id)
+            print(  # noqa: WPS421
+                f"inline: request={elapsed * 1000:.1f}ms "
+                f"total={elapsed * 1000:.1f}ms "
+                f"longest transaction={elapsed * 1000:.1f}ms",
+            )
+            return
+
+        marked, total, longest = await _delete_with_purge(
+            engine,
+            group_id,
+            args.batch_size,
+        )
+        print(  # noqa: WPS421
+            f"purge: request={marked * 1000:.1f}ms total={total * 1000:.1f}ms "
+            f"longest transaction={longest * 1000:.1f}ms",
+        )
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--members", type=int, default=DEFAULT_MEMBERS)
+    parser.add_argument("--batch-size", type=int, default=settings.PURGE_BATCH_SIZE)
+    parser.add_argument("--inline", action="store_true")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,90 @@
+"""
+Compare the Core and raw asyncpg paths of the hottest repository lookups.
+
+Run against a migrated database with at least one group member::
+
+    python -m benchmarks.raw_queries --samples 10000
+
+For ``UserRepository.get`` and ``GroupMemberRepository.get_by_user_and_group_id``
+the script runs ``--samples`` lookups of an existing row through the Core
+repository and through its raw counterpart, on the same pooled connection,
+and prints p50/p99 latency and the process CPU time spent per lookup. CPU
+time leaves out waiting on Postgres, so it shows the client-side overhead
+each path adds.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+from src.infrastructure.database.tables.group import group_member_table
+from src.infrastructure.repositories.group import GroupMemberRepository
+from src.infrastructure.repositories.raw import (
+    RawGroupMemberRepository,
+    RawUserRepository,
+)
+from src.infrastructure.repositories.user import UserRepository
+from src.settings import settings
+
+P50 = 49
+P99 = 98
+MICROSECONDS = 1000000
+DEFAULT_SAMPLES = 10000
+
+
+async def _measure(
+    lookup: Callable[[], Awaitable[Any]],
+    samples: int,
+) -> tuple[list[float], float]:
+    await lookup()  # prepare the statement on this connection
+    latencies = []
+    cpu_started_at = time.process_time()
+    for _ in range(samples):
+        started_at = time.perf_counter()
+        await lookup()
+        latencies.append(time.perf_counter() - started_at)
+    return latencies, (time.process_time() - cpu_started_at) / samples
+
+
+def _report(label: str, latencies: list[float], cpu: float) -> None:
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(  # noqa: WPS421
+        f"{label:>32}: p50={quantiles[P50] * MICROSECONDS:.0f}us "
+        f"p99={quantiles[P99] * MICROSECONDS:.0f}us "
+        f"cpu={cpu * MICROSECONDS:.0f}us",
+    )
+
+
+async def _run(conn: AsyncConnection, samples: int) -> None:
+    member = (await conn.execute(select(group_member_table).limit(1))).one()
+    cases = {
+        "core get": lambda: UserRepository(conn).get(member.user_id),
+        "raw get": lambda: RawUserRepository(conn).get(member.user_id),
+        "core get_by_user_and_group_id": lambda: GroupMemberRepository(
+            conn,
+        ).get_by_user_and_group_id(member.user_id, member.group_id),
+        "raw get_by_user_and_group_id": lambda: RawGroupMemberRepository(
+            conn,
+        ).get_by_user_and_group_id(member.user_id, member.group_id),
+    }
+    for label, lookup in cases.items():
+        _report(label, *await _measure(lookup, samples))
+
+
+async def main(args: argparse.Namespace) -> None:
+    engine = create_async_engine(settings.postgres_url)
+    try:  # noqa: WPS501
+        async with engine.connect() as conn:
+            await _run(conn, args.samples)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--samples", type=int, default=DEFAULT_SAMPLES)
+    asyncio.run(main(parser.parse_args()))
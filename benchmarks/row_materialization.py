@@ -0,0 +1,74 @@
+"""
+Compare building models from database rows with and without validation.
+
+No database is needed::
+
+    python -m benchmarks.row_materialization --rows 10000
+
+The script builds ``--rows`` SQLAlchemy rows of the ``user`` table holding
+the values asyncpg decodes (UUIDs, datetimes, dates) and turns them into
+``User`` models: with ``User.model_validate``, which repositories used to
+call for every row, with ``User.model_construct``, and with
+``User.from_trusted``. It prints the best of ``--repeat`` runs for each.
+"""
+import argparse
+import timeit
+import uuid
+from datetime import date, datetime
+
+from sqlalchemy.engine.result import IteratorResult, SimpleResultMetaData
+
+from src.core.models.user import User
+from src.infrastructure.database.tables.user import user_table
+
+DEFAULT_ROWS = 10000
+DEFAULT_REPEAT = 5
+
+_row_values = {
+    "email": "user@example.com",
+    "password_hash": "hash",  # noqa: S105
+    "first_name": "First",
+    "last_name": "Last",
+    "date_of_birth": date.fromisoformat("1990-01-01"),
+    "email_confirmation_token": None,  # noqa: S105
+    "password_reset_token": None,  # noqa: S105
+    "password_reset_token_expires_at": None,  # noqa: S105
+    "is_active": True,
+    "is_superuser": False,
+    "deleting_at": None,
+}
+
+
+def _result(count: int) -> IteratorResult:
+    now = datetime.now()
+    values = {**_row_values, "created_at": now, "updated_at": now}
+    keys = [column.name for column in user_table.c]
+    raw = [
+        tuple(uuid.uuid4() if key == "id" else values[key] for key in keys)
+        for _ in range(count)
+    ]
+    return IteratorResult(SimpleResultMetaData(keys), iter(raw))
+
+
+def main(args: argparse.Namespace) -> None:
+    rows = _result(args.rows).all()
+    mappings = _result(args.rows).mappings().all()
+    cases = {
+        "model_validate": lambda: [User.model_validate(row) for row in rows],
+        "model_construct": lambda: [
+            User.model_construct(None, **mapping) for mapping in mappings
+        ],
+        "from_trusted": lambda: [User.from_trusted(mapping) for mapping in mappings],
+    }
+    for label, case in cases.items():
+        elapsed = min(timeit.repeat(case, number=1, repeat=args.repeat))
+        print(  # noqa: WPS421
+            f"{label:>15}: {elapsed * 1000:.1f}ms for {args.rows} rows",
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    main(parser.parse_args())
@@ -11,5 +11,10 @@ class AppConstants(BaseSettings):
     MAX_GROUP_DESCRIPTION_LENGTH: int = 1000
     MAX_GROUP_REQUEST_MESSAGE_LENGTH: int = 250
 
+    DEFAULT_PAGE_SIZE: int = 50
+    MAX_PAGE_SIZE: int = 500
+
+    MAX_BULK_IDS: int = 500
+
 
 constants = AppConstants()
@@ -0,0 +1,110 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+from src.core.exceptions import LoginThrottledError
+from src.core.metrics import Histogram
+from src.settings import settings
+
+
+class AdmissionController:
+    """
+    Caps concurrent executions of an expensive operation within a worker.
+
+    Callers above ``max_concurrency`` wait in a FIFO queue of at most
+    ``max_queue`` entries. When the queue is full, or a caller waits longer
+    than ``queue_timeout`` seconds, ``LoginThrottledError`` is raised
+    so the request can be rejected immediately instead of piling up.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        max_queue: int,
+        queue_timeout: float,
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.admitted = 0
+        self.rejected = 0
+        self.wait_time = Histogram()
+        self._active = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        await self._acquire()
+        try:
+            yield
+        finally:
+            self._release()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "active": self.active,
+            "queue_depth": self.queue_depth,
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "wait_time": self.wait_time.snapshot(),
+        }
+
+    async def _acquire(self) -> None:
+        started_at = time.perf_counter()
+
+        if self._active < self.max_concurrency and not self._waiters:
+            self._active += 1
+        elif len(self._waiters) >= self.max_queue:
+            self.rejected += 1
+            raise LoginThrottledError("Too many concurrent logins")
+        else:
+            await self._wait_for_slot()
+
+        self.admitted += 1
+        self.wait_time.observe(time.perf_counter() - started_at)
+
+    async def _wait_for_slot(self) -> None:
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, self.queue_timeout)
+        except TimeoutError:
+            self.rejected += 1
+            raise LoginThrottledError("Timed out waiting for a login slot")
+        except asyncio.CancelledError:
+            # The slot may have been handed over right before cancellation.
+            if waiter.done() and not waiter.cancelled():
+                self._release()
+            raise
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+
+    def _release(self) -> None:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                # Hand the slot over to the next waiter without freeing it.
+                waiter.set_result(None)
+                return
+
+        self._active -= 1
+
+
+login_admission = AdmissionController(
+    max_concurrency=settings.LOGIN_MAX_CONCURRENCY,
+    max_queue=settings.LOGIN_MAX_QUEUE,
+    queue_timeout=settings.LOGIN_QUEUE_TIMEOUT,
+)
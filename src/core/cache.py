@@ -0,0 +1,134 @@
+import hashlib
+import time
+from collections import OrderedDict
+from datetime import timezone
+from typing import Callable, Generic, NamedTuple, TypeVar
+from uuid import UUID
+
+from src.core.models.user import User
+from src.core.schemas.jwt import JWTPayload
+from src.settings import settings
+
+Key = TypeVar("Key")
+Value = TypeVar("Value")
+
+
+class TTLCache(Generic[Key, Value]):
+    """
+    In-process LRU cache whose entries expire after a time-to-live.
+
+    A cache with ``maxsize`` or ``ttl`` lower than or equal to zero stores nothing.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._timer = timer
+        self._data: OrderedDict[Key, tuple[float, Value]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Key) -> Value | None:
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= self._timer():
+            del self._data[key]
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Key, value: Value, ttl: float | None = None) -> None:
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if self.maxsize <= 0 or ttl <= 0:
+            return
+
+        self._data[key] = (self._timer() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: Key) -> None:
+        self._data.pop(key, None)
+
+    def discard_where(self, predicate: Callable[[Value], bool]) -> None:
+        for key, (_, value) in list(self._data.items()):
+            if predicate(value):
+                del self._data[key]
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+class CachedAccessToken(NamedTuple):
+    payload: JWTPayload
+    user: User
+
+
+class AccessTokenCache:
+    """
+    Cache of verified access tokens keyed by the token's SHA-256 digest.
+
+    Entries never outlive the token itself, and every entry belonging to a user
+    has to be invalidated whenever that user changes.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._cache: TTLCache[str, CachedAccessToken] = TTLCache(maxsize, ttl)
+
+    def get(self, token: str) -> CachedAccessToken | None:
+        cached = self._cache.get(self._key(token))
+        if cached is None:
+            return None
+
+        return CachedAccessToken(cached.payload, cached.user.model_copy())
+
+    def set(self, token: str, payload: JWTPayload, user: User) -> None:
+        expires_at = payload.exp
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+
+        expires_in = expires_at.timestamp() - time.time()
+        self._cache.set(
+            self._key(token),
+            CachedAccessToken(payload, user.model_copy()),
+            ttl=expires_in,
+        )
+
+    def invalidate_user(self, user_id: UUID) -> None:
+        self._cache.discard_where(lambda cached: cached.user.id == user_id)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._cache),
+            "maxsize": self._cache.maxsize,
+            "hits": self._cache.hits,
+            "misses": self._cache.misses,
+        }
+
+    @classmethod
+    def _key(cls, token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+
+access_token_cache = AccessTokenCache(
+    maxsize=settings.ACCESS_TOKEN_CACHE_SIZE,
+    ttl=settings.ACCESS_TOKEN_CACHE_TTL,
+)
@@ -5,3 +5,26 @@ class GroupRequestStatus(StrEnum):
     PENDING = "pending"
     ACCEPTED = "accepted"
     DECLINED = "declined"
+
+
+class JoinGroupResult(StrEnum):
+    CREATED = "created"
+    GROUP_DOES_NOT_EXIST = "group_does_not_exist"
+    ALREADY_A_MEMBER = "already_a_member"
+    ALREADY_REQUESTED = "already_requested"
+
+
+class ReviewGroupRequestResult(StrEnum):
+    REVIEWED = "reviewed"
+    REQUEST_DOES_NOT_EXIST = "request_does_not_exist"
+    NOT_A_MEMBER = "not_a_member"
+    NOT_A_GROUP_OWNER_OR_ADMIN = "not_a_group_owner_or_admin"
+    NOT_PENDING = "not_pending"
+    ALREADY_A_MEMBER = "already_a_member"
+
+
+class RemoveGroupMemberResult(StrEnum):
+    REMOVED = "removed"
+    MEMBER_DOES_NOT_EXIST = "member_does_not_exist"
+    CANNOT_DELETE_A_GROUP_OWNER = "cannot_delete_a_group_owner"
+    NOT_A_GROUP_OWNER = "not_a_group_owner"
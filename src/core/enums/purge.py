@@ -0,0 +1,12 @@
+from enum import StrEnum
+
+
+class PurgeEntity(StrEnum):
+    GROUP = "group"
+    USER = "user"
+
+
+class PurgeStatus(StrEnum):
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
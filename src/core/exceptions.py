@@ -84,3 +84,19 @@ class RequestNotPendingError(ApplicationError):
 
 class NotARequestOwnerError(ApplicationError):
     """Raised when a user is not the owner of a request."""
+
+
+class InvalidCursorError(ApplicationError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+class ServiceOverloadedError(Exception):
+    """Base class for errors raised when the service sheds load."""
+
+
+class PasswordHashingOverloadedError(ServiceOverloadedError):
+    """Raised when the password hashing queue is full."""
+
+
+class LoginThrottledError(ServiceOverloadedError):
+    """Raised when the login admission queue is full."""
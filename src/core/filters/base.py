@@ -1,16 +1,14 @@
 import operator
-from typing import Callable, Self
-from uuid import UUID
+from typing import Any, Callable, ClassVar, NamedTuple, Self
 
 from pydantic import BaseModel
-from pydantic.fields import ModelPrivateAttr
-from sqlalchemy import Table
+from sqlalchemy import ColumnElement, Table
 
 
 class Filter(BaseModel):
     field: str
     operator: Callable
-    value: UUID | int | float | bool | str
+    value: Any
 
     def __call__(self, item):
         return self.operator(getattr(item, self.field), self.value)
@@ -30,40 +28,121 @@ class SQLAlchemyFilter(Filter):
         )
 
 
+class FilterOperator(NamedTuple):
+    """
+    An operator in both of the forms a filter can be applied in.
+
+    ``python`` tests an attribute value of an in-memory item, ``sql`` builds
+    the matching criterion for a column.
+    """
+
+    python: Callable[[Any, Any], bool]
+    sql: Callable[[Any, Any], ColumnElement[bool]]
+
+
+# NULL never matches in SQL, mirror that in memory instead of raising.
+def _ilike(attr: Any, value: str) -> bool:
+    return attr is not None and value.casefold() in attr.casefold()
+
+
+def _prefix(attr: Any, value: str) -> bool:
+    return attr is not None and attr.startswith(value)
+
+
+def _isnull(attr: Any, value: bool) -> bool:
+    return value == (attr is None)
+
+
+OPERATORS: dict[str, FilterOperator] = {
+    "eq": FilterOperator(python=operator.eq, sql=operator.eq),
+    "ne": FilterOperator(python=operator.ne, sql=operator.ne),
+    "lt": FilterOperator(python=operator.lt, sql=operator.lt),
+    "le": FilterOperator(python=operator.le, sql=operator.le),
+    "gt": FilterOperator(python=operator.gt, sql=operator.gt),
+    "ge": FilterOperator(python=operator.ge, sql=operator.ge),
+    "in": FilterOperator(
+        python=lambda attr, values: attr in values,
+        sql=lambda column, values: column.in_(values),
+    ),
+    "between": FilterOperator(
+        python=lambda attr, bounds: attr is not None and bounds[0] <= attr <= bounds[1],
+        sql=lambda column, bounds: column.between(*bounds),
+    ),
+    "ilike": FilterOperator(
+        python=_ilike,
+        sql=lambda column, value: column.icontains(value, autoescape=True),
+    ),
+    "prefix": FilterOperator(
+        python=_prefix,
+        sql=lambda column, value: column.startswith(value, autoescape=True),
+    ),
+    "isnull": FilterOperator(
+        python=_isnull,
+        sql=lambda column, value: column.is_(None) if value else column.is_not(None),
+    ),
+}
+
+
+class CompiledFilter(NamedTuple):
+    name: str
+    field: str
+    operator: FilterOperator
+
+
 class FilterSet(BaseModel):
-    _operators_mapping = ModelPrivateAttr(
-        default={
-            "eq": operator.eq,
-            "ne": operator.ne,
-            "lt": operator.lt,
-            "le": operator.le,
-            "gt": operator.gt,
-            "ge": operator.ge,
-        },
-    )
+    """
+    Filters named ``<field>__<operator>``, e.g. ``name__ilike``.
+
+    Field names are parsed once, when the class is defined, into ``_plan``.
+    Applying a filter set only walks that plan for the fields that were set.
+    ``ilike`` matches a case-insensitive substring and ``prefix`` a
+    case-sensitive prefix, wildcards in the value are matched literally.
+    """
+
+    _plan: ClassVar[tuple[CompiledFilter, ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._plan = tuple(cls._compile(name) for name in cls.model_fields)
+
+    def is_empty(self) -> bool:
+        return not self._get_active()
 
     def get_filters(self) -> list[Filter]:
-        filters = []
-        for key, value in self.model_dump(
-            exclude_none=True,
-            exclude_unset=True,
-        ).items():
-            field, operator_ = key.split("__")
-            try:
-                operator_func = self._get_operator(operator_)
-            except KeyError:
-                raise ValueError(f"Invalid operator: {operator_}")
-
-            filters.append(
-                Filter(
-                    field=field,
-                    operator=operator_func,
-                    value=value,
-                ),
-            )
-
-        return filters
+        return [
+            Filter(field=filter_.field, operator=filter_.operator.python, value=value)
+            for filter_, value in self._get_active()
+        ]
+
+    def get_expressions(self, table: Table) -> list[ColumnElement[bool]]:
+        return [
+            filter_.operator.sql(table.c[filter_.field], value)
+            for filter_, value in self._get_active()
+        ]
+
+    def matches(self, item: Any) -> bool:
+        return all(
+            filter_.operator.python(getattr(item, filter_.field), value)
+            for filter_, value in self._get_active()
+        )
+
+    def _get_active(self) -> list[tuple[CompiledFilter, Any]]:
+        fields_set = self.model_fields_set
+        active = []
+        for filter_ in self._plan:
+            if filter_.name not in fields_set:
+                continue
+            filter_value = getattr(self, filter_.name)
+            if filter_value is not None:
+                active.append((filter_, filter_value))
+        return active
 
     @classmethod
-    def _get_operator(cls, operator_name: str) -> Callable:
-        return cls._operators_mapping.default[operator_name]
+    def _compile(cls, name: str) -> CompiledFilter:
+        field, _, operator_name = name.rpartition("__")
+        try:
+            operator_ = OPERATORS[operator_name]
+        except KeyError:
+            raise ValueError(f"Invalid operator: {operator_name}")
+        return CompiledFilter(name=name, field=field, operator=operator_)
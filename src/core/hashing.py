@@ -0,0 +1,72 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from src.core.exceptions import PasswordHashingOverloadedError
+from src.core.utils import get_password_hash, verify_password
+from src.settings import settings
+
+Result = TypeVar("Result")
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt hashing and verification off the event loop.
+
+    Work is executed on a lazily created process pool, so a single login
+    does not block every other request handled by the worker. The number of
+    calls waiting for or running on the pool is bounded by ``max_pending``;
+    once the limit is reached new calls fail fast.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int) -> None:
+        self._max_workers = max_workers
+        self._max_pending = max_pending
+        self._pending = 0
+        self._executor: Executor | None = None
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    async def hash(self, password: str) -> str:
+        return await self._run(get_password_hash, password)
+
+    async def verify(self, plain_password: str, password_hash: str) -> bool:
+        return await self._run(verify_password, plain_password, password_hash)
+
+    def shutdown(self) -> None:
+        if self._executor is None:
+            return
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+
+    async def _run(self, func: Callable[..., Result], *args: Any) -> Result:
+        """
+        Run ``func`` on the executor unless the pending queue is full.
+
+        :raises PasswordHashingOverloadedError: if ``max_pending`` calls are
+            already waiting for or running on the executor
+        :return: what ``func`` returned
+        """
+        if self._pending >= self._max_pending:
+            raise PasswordHashingOverloadedError("Password hashing queue is full")
+
+        self._pending += 1
+        try:  # noqa: WPS501
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self._pending -= 1
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+        return self._executor
+
+
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASHING_WORKERS,
+    max_pending=settings.PASSWORD_HASHING_MAX_PENDING,
+)
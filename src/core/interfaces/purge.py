@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+
+from src.core.models.purge import PurgeJob
+
+
+class PurgeScheduler(ABC):
+    @abstractmethod
+    def schedule(self, job: PurgeJob) -> None:
+        raise NotImplementedError
@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Generic, Type, TypeVar
+from typing import Any, AsyncIterator, Collection, Generic, Iterable, Type, TypeVar
 
 from pydantic import BaseModel
 
 from src.core.filters.base import FilterSet
+from src.core.models.base import AppModel
+from src.core.pagination import Cursor
 
 PK = TypeVar("PK")
 Model = TypeVar("Model", bound=BaseModel)
@@ -15,7 +17,86 @@ class BaseRepository(Generic[PK, Model], ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def get_many(self, filter_set: FilterSet | None = None) -> list[Model]:
+    async def get_many_by_ids(self, pks: list[PK]) -> list[Model]:
+        """
+        Get the models with the given primary keys in a single query.
+
+        :param pks: primary keys to look up
+        :return: models in the order of ``pks``; keys without a model are
+            skipped
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_many(
+        self,
+        filter_set: FilterSet | None = None,
+        *,
+        limit: int | None = None,
+        after: Cursor | None = None,
+    ) -> list[Model]:
+        """
+        Get models matching ``filter_set`` ordered by (created_at, id).
+
+        :param filter_set: filters to apply
+        :param limit: maximum number of models to return
+        :param after: return only models positioned after this cursor
+        :return: list of models
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_many_projected(
+        self,
+        fields: Collection[str],
+        filter_set: FilterSet | None = None,
+        *,
+        limit: int | None = None,
+        after: Cursor | None = None,
+    ) -> list[AppModel]:
+        """
+        Get projections of models matching ``filter_set``, as ``get_many`` does.
+
+        Only ``fields`` are loaded, into read-only models built by
+        ``Model.projection(fields)``.
+
+        :param fields: fields to load
+        :param filter_set: filters to apply
+        :param limit: maximum number of projections to return
+        :param after: return only projections positioned after this cursor
+        :return: list of projections
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream_many(
+        self,
+        filter_set: FilterSet | None = None,
+        *,
+        fetch_size: int | None = None,
+    ) -> AsyncIterator[Model]:
+        """
+        Iterate over models matching ``filter_set`` ordered by (created_at, id).
+
+        Rows are fetched lazily in batches of ``fetch_size``, so memory usage does
+        not depend on the number of matching rows.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream_many_projected(
+        self,
+        fields: Collection[str],
+        filter_set: FilterSet | None = None,
+        *,
+        fetch_size: int | None = None,
+    ) -> AsyncIterator[AppModel]:
+        """
+        Iterate over projections of models matching ``filter_set``.
+
+        Works as ``stream_many``, loading only ``fields`` as in
+        ``get_many_projected``.
+        """
         raise NotImplementedError
 
     @abstractmethod
@@ -26,6 +107,24 @@ class BaseRepository(Generic[PK, Model], ABC):
     async def persist_many(self, models: list[Model]) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def bulk_persist(
+        self,
+        models: Iterable[Model],
+        *,
+        chunk_size: int | None = None,
+    ) -> int:
+        """
+        Insert a large number of models, ``chunk_size`` at a time.
+
+        Unlike ``persist_many``, the models are not refreshed from the database
+        and ``models`` may be a lazy iterable.
+
+        :raises AlreadyExistsError: if any of the models already exists
+        :return: number of inserted models
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def update(
         self,
@@ -35,6 +134,30 @@ class BaseRepository(Generic[PK, Model], ABC):
     ) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def update_many(self, filter_set: FilterSet, values: dict[str, Any]) -> int:
+        """
+        Set ``values`` on every row matching ``filter_set`` in one statement.
+
+        :param filter_set: rows to update; an empty filter set updates all rows
+        :param values: field values to set; 'id' and the timestamps cannot be
+            set
+        :raises ValueError: if ``values`` is empty or has an unknown field
+        :return: number of updated rows
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_many(self, filter_set: FilterSet) -> int:
+        """
+        Delete every row matching ``filter_set`` in one statement.
+
+        :raises ValueError: if ``filter_set`` is empty, deleting every row
+            takes an explicit statement
+        :return: number of deleted rows
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def delete(self, model: Model) -> None:
         raise NotImplementedError
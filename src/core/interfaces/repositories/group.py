@@ -1,13 +1,71 @@
 import uuid
 from abc import ABC, abstractmethod
 
+from src.core.enums.group import (
+    GroupRequestStatus,
+    JoinGroupResult,
+    RemoveGroupMemberResult,
+    ReviewGroupRequestResult,
+)
 from src.core.interfaces.repositories.base import BaseRepository
 from src.core.models.group import Group, GroupMember, GroupRequest
+from src.core.pagination import Cursor
 
 
 class GroupRepository(BaseRepository[uuid.UUID, Group], ABC):
     @abstractmethod
-    async def get_many_for_user(self, user_id: uuid.UUID) -> list[Group]:
+    async def get_many_for_user(
+        self,
+        user_id: uuid.UUID,
+        *,
+        limit: int | None = None,
+        after: Cursor | None = None,
+    ) -> list[Group]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_with_membership(
+        self,
+        group_id: uuid.UUID,
+        user_id: uuid.UUID,
+    ) -> tuple[Group, GroupMember | None]:
+        """
+        Get a group together with the given user's membership in it.
+
+        :param group_id: group id
+        :param user_id: id of the user whose membership is loaded
+        :raises DoesNotExistError: if the group does not exist
+        :return: the group and the membership, or ``None`` if the user is not
+            a member
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def mark_deleting(self, group_id: uuid.UUID) -> None:
+        """
+        Mark a group as being deleted, hiding it from every query at once.
+
+        Its members and requests are removed later by a purge job.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def mark_deleting_owned_by(self, user_id: uuid.UUID) -> list[uuid.UUID]:
+        """
+        Mark every group owned by the given user as being deleted.
+
+        :return: ids of all groups owned by the user, including ones marked
+            before
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def purge(self, group_id: uuid.UUID) -> None:
+        """
+        Delete a group marked as being deleted.
+
+        Its members and requests must already be removed.
+        """
         raise NotImplementedError
 
 
@@ -21,7 +79,86 @@ class GroupRequestRepository(BaseRepository[uuid.UUID, GroupRequest], ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def delete_by_group_id(self, group_id: uuid.UUID) -> None:
+    async def try_persist(self, group_request: GroupRequest) -> JoinGroupResult:
+        """
+        Persist a pending group request unless it duplicates one or a membership.
+
+        The request is not persisted if its user is already a member of the group
+        or already has a pending request for it.
+
+        The checks and the insert run as a single statement, so concurrent
+        requests cannot both succeed.
+
+        :param group_request: pending group request to persist
+        :return: ``JoinGroupResult.CREATED`` if the request was persisted,
+            otherwise the reason it was not
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def review(
+        self,
+        request_id: uuid.UUID,
+        group_id: uuid.UUID,
+        reviewer_id: uuid.UUID,
+        status: GroupRequestStatus,
+    ) -> ReviewGroupRequestResult:
+        """
+        Accept or decline a pending group request on behalf of a group owner or admin.
+
+        The requesting user is added to the group if the request is accepted.
+
+        The authorization check, the status update and the membership insert
+        run as a single statement.
+
+        :param request_id: id of the request to review
+        :param group_id: id of the group the request must belong to
+        :param reviewer_id: id of the user reviewing the request
+        :param status: ``ACCEPTED`` or ``DECLINED``
+        :return: ``ReviewGroupRequestResult.REVIEWED`` on success, otherwise
+            the reason the request was not reviewed
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def review_many(
+        self,
+        group_id: uuid.UUID,
+        request_ids: list[uuid.UUID],
+        status: GroupRequestStatus,
+    ) -> dict[uuid.UUID, ReviewGroupRequestResult]:
+        """
+        Accept or decline many pending requests of a group at once.
+
+        The requesting users of accepted requests are added to the group.
+
+        The caller is responsible for checking that the reviewer may review
+        requests of the group. Requests of users that already are members are
+        left pending when accepting.
+
+        :param group_id: id of the group the requests must belong to
+        :param request_ids: ids of the requests to review
+        :param status: ``ACCEPTED`` or ``DECLINED``
+        :return: result for every given request id
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_batch_by_group_id(self, group_id: uuid.UUID, limit: int) -> int:
+        """
+        Delete at most ``limit`` rows belonging to the given group.
+
+        :return: number of deleted rows
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_batch_by_user_id(self, user_id: uuid.UUID, limit: int) -> int:
+        """
+        Delete at most ``limit`` rows belonging to the given user.
+
+        :return: number of deleted rows
+        """
         raise NotImplementedError
 
 
@@ -35,5 +172,54 @@ class GroupMemberRepository(BaseRepository[uuid.UUID, GroupMember], ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def delete_by_group_id(self, group_id: uuid.UUID) -> None:
+    async def try_persist(self, group_member: GroupMember) -> JoinGroupResult:
+        """
+        Persist a group member unless the user is already a member of the group.
+
+        The checks and the insert run as a single statement, so concurrent
+        joins cannot both succeed.
+
+        :param group_member: group member to persist
+        :return: ``JoinGroupResult.CREATED`` if the member was persisted,
+            otherwise the reason it was not
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove_many(
+        self,
+        group_id: uuid.UUID,
+        member_ids: list[uuid.UUID],
+        *,
+        can_remove_admins: bool,
+    ) -> dict[uuid.UUID, RemoveGroupMemberResult]:
+        """
+        Remove many members of a group at once. Owners are never removed.
+
+        The caller is responsible for checking that the requesting user may
+        remove members of the group.
+
+        :param group_id: id of the group the members must belong to
+        :param member_ids: ids of the members to remove
+        :param can_remove_admins: whether admins may be removed as well
+        :return: result for every given member id
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_batch_by_group_id(self, group_id: uuid.UUID, limit: int) -> int:
+        """
+        Delete at most ``limit`` rows belonging to the given group.
+
+        :return: number of deleted rows
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_batch_by_user_id(self, user_id: uuid.UUID, limit: int) -> int:
+        """
+        Delete at most ``limit`` rows belonging to the given user.
+
+        :return: number of deleted rows
+        """
         raise NotImplementedError
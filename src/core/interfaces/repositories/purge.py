@@ -0,0 +1,9 @@
+import uuid
+from abc import ABC
+
+from src.core.interfaces.repositories.base import BaseRepository
+from src.core.models.purge import PurgeJob
+
+
+class PurgeJobRepository(BaseRepository[uuid.UUID, PurgeJob], ABC):
+    pass
@@ -9,3 +9,22 @@ class UserRepository(BaseRepository[uuid.UUID, User], ABC):
     @abstractmethod
     async def get_by_email(self, email: str) -> User | None:
         raise NotImplementedError
+
+    @abstractmethod
+    async def mark_deleting(self, user_id: uuid.UUID) -> None:
+        """
+        Mark a user as being deleted, hiding them from every query at once.
+
+        Their memberships and requests are hidden at once too. They and the
+        user's owned groups are removed later by a purge job.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def purge(self, user_id: uuid.UUID) -> None:
+        """
+        Delete a user marked as being deleted.
+
+        Their memberships and requests must already be removed.
+        """
+        raise NotImplementedError
@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+from typing import Callable
+
+
+class CommitHooks(ABC):
+    @abstractmethod
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Call ``callback`` once the current transaction commits."""
+        raise NotImplementedError
@@ -0,0 +1,41 @@
+from bisect import bisect_left
+from typing import Any, Sequence
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+)
+
+
+class Histogram:
+    """Cumulative histogram of observed values, in the Prometheus bucket layout."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.count = 0
+        self.sum: float = 0
+        self._counts = [0 for _ in range(len(self.buckets) + 1)]
+
+    def observe(self, value: float) -> None:
+        self._counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self) -> dict[str, Any]:
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip((*self.buckets, "+Inf"), self._counts):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+
+        return {"count": self.count, "sum": self.sum, "buckets": buckets}
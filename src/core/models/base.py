@@ -1,7 +1,9 @@
 from datetime import datetime
+from functools import cache
+from typing import Any, Collection, Mapping, Self, Type, TypeVar
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, create_model
 
 
 class AppModel(BaseModel):
@@ -10,3 +12,108 @@ class AppModel(BaseModel):
     id: UUID = Field(default_factory=uuid4)
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
+
+    # Private attributes are copied shallowly, so the set of changed fields is
+    # immutable and replaced on change, keeping copies independent.
+    _changed_fields: frozenset[str] = PrivateAttr(default=frozenset())
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in self.model_fields and getattr(self, name) != value:
+            self._changed_fields |= {name}
+        super().__setattr__(name, value)
+
+    @classmethod
+    def from_trusted(cls, values: Mapping[str, Any]) -> Self:
+        """
+        Build a model from values that already have the field types.
+
+        Such values, e.g. a row decoded by the database driver, are not
+        validated. Keys that are not fields are ignored. If a field is missing,
+        the values are validated as usual so defaults are applied.
+
+        :return: the model holding ``values``
+        """
+        try:
+            fields = {name: values[name] for name in cls.model_fields}
+        except KeyError:
+            return cls.model_validate(dict(values))
+        return _construct(cls, fields)
+
+    @classmethod
+    def projection(cls, fields: Collection[str]) -> Type["AppModel"]:
+        """
+        Get a read-only model holding only ``fields`` of this model.
+
+        The projection also holds ``id`` and the timestamps. It serves reads
+        that do not need whole rows.
+
+        :return: the projection model class
+        :raises ValueError: if any of ``fields`` is not a field of this model
+        """
+        unknown = set(fields) - cls.model_fields.keys()
+        if unknown:
+            raise ValueError(f"Unknown {cls.__name__} fields: {sorted(unknown)}")
+        return _projection(cls, frozenset(fields))
+
+    @property
+    def changed_fields(self) -> frozenset[str]:
+        """
+        Fields assigned a different value since the model was loaded or saved.
+
+        :return: names of the changed fields
+        """
+        return self._changed_fields
+
+    def mark_clean(self, fields: set[str] | None = None) -> None:
+        if fields is None:
+            self._changed_fields = frozenset()
+        else:
+            self._changed_fields -= fields
+
+
+class ProjectionModel(AppModel):
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+Model = TypeVar("Model", bound=AppModel)
+
+
+def _construct(model_class: Type[Model], fields: dict[str, Any]) -> Model:
+    """
+    Create an instance of ``model_class`` holding ``fields`` as they are.
+
+    This sets the instance attributes ``BaseModel.model_construct`` sets in
+    pydantic 2.4, skipping its handling of aliases and defaults, which makes
+    it over twice as slow (see ``benchmarks/row_materialization.py``).
+    ``tests/unit/core/models/test_base.py`` checks the attributes against the
+    installed pydantic version.
+
+    :return: the new instance
+    """
+    model = model_class.__new__(model_class)  # noqa: WPS609
+    set_attribute = object.__setattr__  # noqa: WPS609
+    set_attribute(model, "__dict__", fields)
+    set_attribute(model, "__pydantic_fields_set__", set(fields))
+    set_attribute(model, "__pydantic_extra__", None)
+    set_attribute(
+        model,
+        "__pydantic_private__",
+        {
+            name: private.get_default()
+            for name, private in model_class.__private_attributes__.items()
+        },
+    )
+    return model
+
+
+@cache
+def _projection(model: Type[AppModel], fields: frozenset[str]) -> Type[AppModel]:
+    return create_model(  # type: ignore
+        f"{model.__name__}Projection",
+        __base__=ProjectionModel,
+        **{
+            name: (field.annotation, field)
+            for name, field in model.model_fields.items()
+            if name in fields and name not in AppModel.model_fields
+        },
+    )
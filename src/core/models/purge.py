@@ -0,0 +1,22 @@
+from datetime import datetime
+from uuid import UUID
+
+from src.core.enums.purge import PurgeEntity, PurgeStatus
+from src.core.models.base import AppModel
+
+
+class PurgeJob(AppModel):
+    entity: PurgeEntity
+    entity_id: UUID
+
+    status: PurgeStatus = PurgeStatus.PENDING
+    deleted_rows: int = 0
+    finished_at: datetime | None = None
+
+    def record_progress(self, deleted_rows: int) -> None:
+        self.status = PurgeStatus.RUNNING
+        self.deleted_rows += deleted_rows
+
+    def finish(self) -> None:
+        self.status = PurgeStatus.DONE
+        self.finished_at = datetime.now()
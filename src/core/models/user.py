@@ -8,7 +8,6 @@ from src.core.exceptions import (
     UserNotActiveError,
 )
 from src.core.models.base import AppModel
-from src.core.utils import get_password_hash
 
 
 class User(AppModel):
@@ -54,7 +53,7 @@ class User(AppModel):
 
         self.is_active = False
 
-    def reset_password(self, token: str, new_password: str) -> None:
+    def check_password_reset_token(self, token: str) -> None:
         if self.password_reset_token != token:
             raise InvalidTokenError("Invalid token")
 
@@ -64,7 +63,10 @@ class User(AppModel):
         ):
             raise ExpiredTokenError("Expired token")
 
-        self.password_hash = get_password_hash(new_password)
+    def reset_password(self, token: str, password_hash: str) -> None:
+        self.check_password_reset_token(token)
+
+        self.password_hash = password_hash
         self.password_reset_token = None
         self.password_reset_token_expires_at = None
 
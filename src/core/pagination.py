@@ -0,0 +1,69 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from typing import Generic, Self, TypeVar
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from src.constants import constants
+from src.core.exceptions import InvalidCursorError
+from src.core.models.base import AppModel
+
+Model = TypeVar("Model", bound=AppModel)
+
+
+class Cursor(BaseModel):
+    """Position in the stable (created_at, id) ordering shared by all list queries."""
+
+    created_at: datetime
+    id: UUID
+
+    @classmethod
+    def from_model(cls, model: AppModel) -> Self:
+        return cls(created_at=model.created_at, id=model.id)
+
+    @classmethod
+    def decode(cls, value: str) -> Self:
+        try:
+            return cls.model_validate_json(urlsafe_b64decode(value.encode()))
+        except ValueError:
+            # binascii.Error and pydantic's ValidationError are both ValueErrors.
+            raise InvalidCursorError("Invalid cursor")
+
+    def encode(self) -> str:
+        return urlsafe_b64encode(self.model_dump_json().encode()).decode()
+
+
+class Pagination(BaseModel):
+    limit: int = Field(
+        default=constants.DEFAULT_PAGE_SIZE,
+        ge=1,
+        le=constants.MAX_PAGE_SIZE,
+    )
+    cursor: str | None = None
+
+    @property
+    def after(self) -> Cursor | None:
+        if self.cursor is None:
+            return None
+        return Cursor.decode(self.cursor)
+
+
+class Page(BaseModel, Generic[Model]):
+    items: list[Model]
+    next_cursor: str | None = None
+
+    @classmethod
+    def from_items(cls, items: list[Model], limit: int) -> Self:
+        """
+        Build a page out of ``items`` fetched with a limit of ``limit + 1``.
+
+        The extra row only signals that a next page exists and is dropped.
+
+        :return: page of at most ``limit`` items
+        """
+        if len(items) <= limit:
+            return cls(items=items)
+
+        items = items[:limit]
+        return cls(items=items, next_cursor=Cursor.from_model(items[-1]).encode())
@@ -43,6 +43,10 @@ class UpdateGroupRequestSchema(BaseUpdateSchema):
         return status
 
 
+class BulkUpdateGroupRequestsSchema(UpdateGroupRequestSchema):
+    ids: list[UUID] = Field(min_length=1, max_length=constants.MAX_BULK_IDS)
+
+
 class CreateGroupMemberSchema(BaseModel):
     user_id: UUID
     group_id: UUID
@@ -52,3 +56,7 @@ class CreateGroupMemberSchema(BaseModel):
 
 class UpdateGroupMemberSchema(BaseUpdateSchema):
     is_admin: bool
+
+
+class BulkDeleteGroupMembersSchema(BaseModel):
+    ids: list[UUID] = Field(min_length=1, max_length=constants.MAX_BULK_IDS)
@@ -1,25 +1,39 @@
+from src.core.admission import AdmissionController
+from src.core.cache import AccessTokenCache
 from src.core.exceptions import (
     DoesNotExistError,
     InvalidCredentialsError,
     UserNotActiveError,
 )
+from src.core.hashing import password_hasher
 from src.core.interfaces.repositories.user import UserRepository
 from src.core.models.user import User
 from src.core.schemas.auth import AccessToken, UserCredentials
 from src.core.schemas.jwt import JWTPayload
 from src.core.services.jwt import decode_jwt, encode_jwt
-from src.core.utils import verify_password
 
 
 class AuthService:
-    def __init__(self, repository: UserRepository) -> None:
+    def __init__(
+        self,
+        repository: UserRepository,
+        token_cache: AccessTokenCache | None = None,
+        login_admission: AdmissionController | None = None,
+    ) -> None:
         self.repository = repository
+        self.token_cache = token_cache
+        self.login_admission = login_admission
 
     def create_access_token(self, user: User) -> str:
         payload = JWTPayload(sub=user.id)
         return encode_jwt(payload)
 
     async def verify_access_token(self, auth_token: str) -> User:
+        if self.token_cache is not None:
+            cached = self.token_cache.get(auth_token)
+            if cached is not None:
+                return cached.user
+
         payload = decode_jwt(auth_token)
         try:
             user = await self.repository.get(payload.sub)
@@ -29,12 +43,18 @@ class AuthService:
         if not user.is_active:
             raise UserNotActiveError("Please activate your account")
 
+        if self.token_cache is not None:
+            self.token_cache.set(auth_token, payload, user)
+
         return user
 
     async def authenticate_user(self, credentials: UserCredentials) -> AccessToken:
         user = await self.repository.get_by_email(credentials.email)
 
-        if not user or not verify_password(credentials.password, user.password_hash):
+        if not user or not await self._verify_password(
+            credentials.password,
+            user.password_hash,
+        ):
             raise InvalidCredentialsError("Invalid credentials")
 
         if not user.is_active:
@@ -42,3 +62,10 @@ class AuthService:
 
         token = self.create_access_token(user)
         return AccessToken(access_token=token, token_type="bearer")
+
+    async def _verify_password(self, password: str, password_hash: str) -> bool:
+        if self.login_admission is None:
+            return await password_hasher.verify(password, password_hash)
+
+        async with self.login_admission.admit():
+            return await password_hasher.verify(password, password_hash)
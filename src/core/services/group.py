@@ -1,6 +1,13 @@
+from typing import AsyncIterator, Collection
 from uuid import UUID
 
-from src.core.enums.group import GroupRequestStatus
+from src.core.enums.group import (
+    GroupRequestStatus,
+    JoinGroupResult,
+    RemoveGroupMemberResult,
+    ReviewGroupRequestResult,
+)
+from src.core.enums.purge import PurgeEntity
 from src.core.exceptions import (
     AlreadyAGroupMemberError,
     AlreadyAGroupOwnerError,
@@ -26,8 +33,12 @@ from src.core.interfaces.repositories.group import (
     GroupRepository,
     GroupRequestRepository,
 )
+from src.core.models.base import AppModel
 from src.core.models.group import Group, GroupMember, GroupRequest
+from src.core.pagination import Page, Pagination
 from src.core.schemas.group import (
+    BulkDeleteGroupMembersSchema,
+    BulkUpdateGroupRequestsSchema,
     CreateGroupMemberSchema,
     CreateGroupRequestSchema,
     CreateGroupSchema,
@@ -35,6 +46,7 @@ from src.core.schemas.group import (
     UpdateGroupRequestSchema,
     UpdateGroupSchema,
 )
+from src.core.services.purge import PurgeService
 
 
 class GroupService:
@@ -43,10 +55,12 @@ class GroupService:
         group_repository: GroupRepository,
         member_repository: GroupMemberRepository,
         request_repository: GroupRequestRepository,
+        purge_service: PurgeService,
     ) -> None:
         self.group_repository = group_repository
         self.member_repository = member_repository
         self.request_repository = request_repository
+        self.purge_service = purge_service
 
     async def create_group(self, user_id: UUID, schema: CreateGroupSchema) -> Group:
         group = Group(**schema.model_dump())
@@ -66,43 +80,26 @@ class GroupService:
         request_user_id: UUID,
         group_id: UUID,
         schema: UpdateGroupSchema,
-    ) -> None:
-        group = await self.group_repository.get(group_id)
-        try:
-            member = await self.member_repository.get_by_user_and_group_id(
-                user_id=request_user_id,
-                group_id=group_id,
-            )
-        except DoesNotExistError:
-            raise NotAGroupMemberError("Not a member of the group")
+    ) -> Group:
+        group, member = await self._get_group_as_member(request_user_id, group_id)
 
         if not member.is_owner:
             raise NotAGroupOwnerError("Not the owner of the group")
 
-        fields_to_update = []
         for key, value in schema.model_dump().items():
             setattr(group, key, value)
-            fields_to_update.append(key)
 
-        await self.group_repository.update(group, fields_to_update)
+        await self.group_repository.update(group)
+        return group
 
     async def delete_group(self, request_user_id: UUID, group_id: UUID) -> None:
-        group = await self.group_repository.get(group_id)
-
-        try:
-            member = await self.member_repository.get_by_user_and_group_id(
-                user_id=request_user_id,
-                group_id=group_id,
-            )
-        except DoesNotExistError:
-            raise NotAGroupMemberError("Not a member of the group")
+        group, member = await self._get_group_as_member(request_user_id, group_id)
 
         if not member.is_owner:
             raise NotAGroupOwnerError("Not the owner of the group")
 
-        await self.member_repository.delete_by_group_id(group_id)
-        await self.request_repository.delete_by_group_id(group_id)
-        await self.group_repository.delete(group)
+        await self.group_repository.mark_deleting(group.id)
+        await self.purge_service.schedule(PurgeEntity.GROUP, group.id)
 
     async def get_group(self, group_id: UUID) -> Group:
         return await self.group_repository.get(pk=group_id)
@@ -110,20 +107,66 @@ class GroupService:
     async def get_groups(
         self,
         input_filters: GroupInputFilters | None = None,
-    ) -> list[Group]:
+        pagination: Pagination | None = None,
+    ) -> Page[Group]:
+        if input_filters is None:
+            input_filters = GroupInputFilters()
+        if pagination is None:
+            pagination = Pagination()
+
+        filter_set = GroupFilterSet(**input_filters.model_dump())
+        groups = await self.group_repository.get_many(
+            filter_set,
+            limit=pagination.limit + 1,
+            after=pagination.after,
+        )
+        return Page.from_items(groups, pagination.limit)
+
+    async def get_groups_projected(
+        self,
+        fields: Collection[str],
+        input_filters: GroupInputFilters | None = None,
+        pagination: Pagination | None = None,
+    ) -> Page[AppModel]:
+        if input_filters is None:
+            input_filters = GroupInputFilters()
+        if pagination is None:
+            pagination = Pagination()
+
+        filter_set = GroupFilterSet(**input_filters.model_dump())
+        groups = await self.group_repository.get_many_projected(
+            fields,
+            filter_set,
+            limit=pagination.limit + 1,
+            after=pagination.after,
+        )
+        return Page.from_items(groups, pagination.limit)
+
+    def stream_groups_projected(
+        self,
+        fields: Collection[str],
+        input_filters: GroupInputFilters | None = None,
+    ) -> AsyncIterator[AppModel]:
         if input_filters is None:
             input_filters = GroupInputFilters()
 
         filter_set = GroupFilterSet(**input_filters.model_dump())
-        return await self.group_repository.get_many(filter_set)
+        return self.group_repository.stream_many_projected(fields, filter_set)
 
     async def get_groups_for_user(
         self,
         user_id: UUID,
-    ) -> list[Group]:
-        return await self.group_repository.get_many_for_user(
+        pagination: Pagination | None = None,
+    ) -> Page[Group]:
+        if pagination is None:
+            pagination = Pagination()
+
+        groups = await self.group_repository.get_many_for_user(
             user_id=user_id,
+            limit=pagination.limit + 1,
+            after=pagination.after,
         )
+        return Page.from_items(groups, pagination.limit)
 
     async def create_group_request(
         self,
@@ -131,32 +174,13 @@ class GroupService:
         group_id: UUID,
         schema: CreateGroupRequestSchema,
     ) -> GroupRequest:
-        try:
-            await self.request_repository.get_pending_request_by_user_and_group_id(
-                user_id=user_id,
-                group_id=group_id,
-            )
-            raise AlreadyRequestedToJoinGroupError(
-                "Already requested to join the group",
-            )
-        except DoesNotExistError:
-            pass
-
-        try:
-            await self.member_repository.get_by_user_and_group_id(
-                user_id=user_id,
-                group_id=group_id,
-            )
-            raise AlreadyAGroupMemberError("Already a member of the group")
-        except DoesNotExistError:
-            pass
-
         group_request = GroupRequest(
             user_id=user_id,
             group_id=group_id,
             **schema.model_dump(),
         )
-        await self.request_repository.persist(group_request)
+        result = await self.request_repository.try_persist(group_request)
+        self._raise_for_join_result(result)
         return group_request
 
     async def update_group_request(
@@ -166,34 +190,44 @@ class GroupService:
         request_id: UUID,
         schema: UpdateGroupRequestSchema,
     ) -> None:
-        group_request = await self.request_repository.get(pk=request_id)
-        if group_request.group_id != group_id:
-            raise DoesNotExistError("Invalid request id")
-
-        member = await self.member_repository.get_by_user_and_group_id(
-            user_id=request_user_id,
+        result = await self.request_repository.review(
+            request_id=request_id,
             group_id=group_id,
+            reviewer_id=request_user_id,
+            status=schema.status,
         )
 
-        if not (member.is_owner or member.is_admin):
+        if result == ReviewGroupRequestResult.REQUEST_DOES_NOT_EXIST:
+            raise DoesNotExistError("Invalid request id")
+        if result == ReviewGroupRequestResult.NOT_A_MEMBER:
+            raise DoesNotExistError("Group member does not exist")
+        if result == ReviewGroupRequestResult.NOT_A_GROUP_OWNER_OR_ADMIN:
             raise NotAGroupOwnerOrAdminError(
                 "Only group owner or admin can update requests",
             )
-
-        if group_request.status != GroupRequestStatus.PENDING:
+        if result == ReviewGroupRequestResult.NOT_PENDING:
             raise RequestNotPendingError("Request is no longer pending")
+        if result == ReviewGroupRequestResult.ALREADY_A_MEMBER:
+            raise AlreadyAGroupMemberError("Already a member of the group")
 
-        group_request.status = schema.status
-        await self.request_repository.update(group_request, ["status"])
+    async def update_group_requests(
+        self,
+        request_user_id: UUID,
+        group_id: UUID,
+        schema: BulkUpdateGroupRequestsSchema,
+    ) -> dict[UUID, ReviewGroupRequestResult]:
+        _, member = await self._get_group_as_member(request_user_id, group_id)
 
-        if schema.status == GroupRequestStatus.DECLINED:
-            return
+        if not (member.is_owner or member.is_admin):
+            raise NotAGroupOwnerOrAdminError(
+                "Only group owner or admin can update requests",
+            )
 
-        group_member_schema = CreateGroupMemberSchema(
-            user_id=group_request.user_id,
-            group_id=group_request.group_id,
+        return await self.request_repository.review_many(
+            group_id=group_id,
+            request_ids=list(dict.fromkeys(schema.ids)),
+            status=schema.status,
         )
-        await self.create_group_member(group_member_schema)
 
     async def delete_group_request(
         self,
@@ -242,7 +276,11 @@ class GroupService:
         self,
         request_user_id: UUID,
         group_id: UUID,
-    ) -> list[GroupRequest]:
+        pagination: Pagination | None = None,
+    ) -> Page[GroupRequest]:
+        if pagination is None:
+            pagination = Pagination()
+
         filter_set = GroupRequestFilterSet(
             group_id__eq=group_id,
             user_id__eq=None,
@@ -260,37 +298,41 @@ class GroupService:
         except DoesNotExistError:
             filter_set.user_id__eq = request_user_id
 
-        return await self.request_repository.get_many(filter_set)
+        group_requests = await self.request_repository.get_many(
+            filter_set,
+            limit=pagination.limit + 1,
+            after=pagination.after,
+        )
+        return Page.from_items(group_requests, pagination.limit)
 
     async def get_group_requests_for_user(
         self,
         user_id: UUID,
-    ) -> list[GroupRequest]:
+        pagination: Pagination | None = None,
+    ) -> Page[GroupRequest]:
+        if pagination is None:
+            pagination = Pagination()
+
         filter_set = GroupRequestFilterSet(
             group_id__eq=None,
             user_id__eq=user_id,
             status__eq=GroupRequestStatus.PENDING,
         )
 
-        return await self.request_repository.get_many(filter_set)
+        group_requests = await self.request_repository.get_many(
+            filter_set,
+            limit=pagination.limit + 1,
+            after=pagination.after,
+        )
+        return Page.from_items(group_requests, pagination.limit)
 
     async def create_group_member(
         self,
         schema: CreateGroupMemberSchema,
     ) -> GroupMember:
-        await self.group_repository.get(pk=schema.group_id)
-
-        try:
-            await self.member_repository.get_by_user_and_group_id(
-                user_id=schema.user_id,
-                group_id=schema.group_id,
-            )
-            raise AlreadyAGroupMemberError("Already a member of the group")
-        except DoesNotExistError:
-            pass
-
         group_member = GroupMember(**schema.model_dump())
-        await self.member_repository.persist(group_member)
+        result = await self.member_repository.try_persist(group_member)
+        self._raise_for_join_result(result)
         return group_member
 
     async def update_group_member(
@@ -300,15 +342,7 @@ class GroupService:
         member_id: UUID,
         schema: UpdateGroupMemberSchema,
     ) -> None:
-        await self.group_repository.get(pk=group_id)
-
-        try:
-            member = await self.member_repository.get_by_user_and_group_id(
-                user_id=request_user_id,
-                group_id=group_id,
-            )
-        except DoesNotExistError:
-            raise NotAGroupMemberError("Not a member of the group")
+        _, member = await self._get_group_as_member(request_user_id, group_id)
 
         if not member.is_owner:
             raise NotAGroupOwnerError("Only a group owner can update a member")
@@ -319,7 +353,7 @@ class GroupService:
             return
 
         member_to_update.is_admin = schema.is_admin
-        await self.member_repository.update(member_to_update, ["is_admin"])
+        await self.member_repository.update(member_to_update)
 
     async def change_group_owner(
         self,
@@ -327,15 +361,7 @@ class GroupService:
         group_id: UUID,
         member_id: UUID,
     ) -> None:
-        await self.group_repository.get(pk=group_id)
-
-        try:
-            member = await self.member_repository.get_by_user_and_group_id(
-                user_id=request_user_id,
-                group_id=group_id,
-            )
-        except DoesNotExistError:
-            raise NotAGroupMemberError("Not a member of the group")
+        _, member = await self._get_group_as_member(request_user_id, group_id)
 
         member_to_update = await self.member_repository.get(pk=member_id)
 
@@ -348,8 +374,8 @@ class GroupService:
         member.is_owner = False
         member_to_update.is_owner = True
 
-        await self.member_repository.update(member, ["is_owner"])
-        await self.member_repository.update(member_to_update, ["is_owner"])
+        await self.member_repository.update(member)
+        await self.member_repository.update(member_to_update)
 
     async def delete_group_member(
         self,
@@ -357,15 +383,7 @@ class GroupService:
         group_id: UUID,
         member_id: UUID,
     ) -> None:
-        await self.group_repository.get(pk=group_id)
-
-        try:
-            member = await self.member_repository.get_by_user_and_group_id(
-                user_id=request_user_id,
-                group_id=group_id,
-            )
-        except DoesNotExistError:
-            raise NotAGroupMemberError("Not a member of the group")
+        _, member = await self._get_group_as_member(request_user_id, group_id)
 
         if not (member.is_admin or member.is_owner):
             raise NotAGroupOwnerOrAdminError(
@@ -382,6 +400,25 @@ class GroupService:
 
         await self.member_repository.delete(member_to_delete)
 
+    async def delete_group_members(
+        self,
+        request_user_id: UUID,
+        group_id: UUID,
+        schema: BulkDeleteGroupMembersSchema,
+    ) -> dict[UUID, RemoveGroupMemberResult]:
+        _, member = await self._get_group_as_member(request_user_id, group_id)
+
+        if not (member.is_admin or member.is_owner):
+            raise NotAGroupOwnerOrAdminError(
+                "Only an admin or owner can delete a member",
+            )
+
+        return await self.member_repository.remove_many(
+            group_id=group_id,
+            member_ids=list(dict.fromkeys(schema.ids)),
+            can_remove_admins=member.is_owner,
+        )
+
     async def leave_group(
         self,
         request_user_id: UUID,
@@ -403,16 +440,7 @@ class GroupService:
         group_id: UUID,
         member_id: UUID,
     ) -> GroupMember:
-        group = await self.group_repository.get(pk=group_id)
-
-        try:
-            await self.member_repository.get_by_user_and_group_id(
-                user_id=request_user_id,
-                group_id=group_id,
-            )
-        except DoesNotExistError:
-            if group.is_private:
-                raise NotAGroupMemberError("Not a member of the group")
+        await self._get_visible_group(request_user_id, group_id)
 
         member = await self.member_repository.get(pk=member_id)
         if member.group_id != group_id:
@@ -425,7 +453,42 @@ class GroupService:
         request_user_id: UUID,
         group_id: UUID,
         filters: GroupMemberInputFilters | None = None,
-    ) -> list[GroupMember]:
+        pagination: Pagination | None = None,
+    ) -> Page[GroupMember]:
+        if pagination is None:
+            pagination = Pagination()
+
+        filter_set = await self._get_group_members_filter_set(
+            request_user_id,
+            group_id,
+            filters,
+        )
+        group_members = await self.member_repository.get_many(
+            filter_set,
+            limit=pagination.limit + 1,
+            after=pagination.after,
+        )
+        return Page.from_items(group_members, pagination.limit)
+
+    async def stream_group_members(
+        self,
+        request_user_id: UUID,
+        group_id: UUID,
+        filters: GroupMemberInputFilters | None = None,
+    ) -> AsyncIterator[GroupMember]:
+        filter_set = await self._get_group_members_filter_set(
+            request_user_id,
+            group_id,
+            filters,
+        )
+        return self.member_repository.stream_many(filter_set)
+
+    async def _get_group_members_filter_set(
+        self,
+        request_user_id: UUID,
+        group_id: UUID,
+        filters: GroupMemberInputFilters | None = None,
+    ) -> GroupMemberFilterSet:
         if filters is None:
             filters = GroupMemberInputFilters()
 
@@ -435,15 +498,44 @@ class GroupService:
             **filters.model_dump(),
         )
 
-        group = await self.group_repository.get(pk=group_id)
+        await self._get_visible_group(request_user_id, group_id)
 
-        try:
-            await self.member_repository.get_by_user_and_group_id(
-                user_id=request_user_id,
-                group_id=group_id,
+        return filter_set
+
+    def _raise_for_join_result(self, result: JoinGroupResult) -> None:
+        if result == JoinGroupResult.GROUP_DOES_NOT_EXIST:
+            raise DoesNotExistError("Group does not exist")
+        if result == JoinGroupResult.ALREADY_A_MEMBER:
+            raise AlreadyAGroupMemberError("Already a member of the group")
+        if result == JoinGroupResult.ALREADY_REQUESTED:
+            raise AlreadyRequestedToJoinGroupError(
+                "Already requested to join the group",
             )
-        except DoesNotExistError:
-            if group.is_private:
-                raise NotAGroupMemberError("Not a member of the group")
 
-        return await self.member_repository.get_many(filter_set)
+    async def _get_group_as_member(
+        self,
+        request_user_id: UUID,
+        group_id: UUID,
+    ) -> tuple[Group, GroupMember]:
+        group, member = await self.group_repository.get_with_membership(
+            group_id=group_id,
+            user_id=request_user_id,
+        )
+        if member is None:
+            raise NotAGroupMemberError("Not a member of the group")
+
+        return group, member
+
+    async def _get_visible_group(
+        self,
+        request_user_id: UUID,
+        group_id: UUID,
+    ) -> tuple[Group, GroupMember | None]:
+        group, member = await self.group_repository.get_with_membership(
+            group_id=group_id,
+            user_id=request_user_id,
+        )
+        if member is None and group.is_private:
+            raise NotAGroupMemberError("Not a member of the group")
+
+        return group, member
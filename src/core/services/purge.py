@@ -0,0 +1,111 @@
+from functools import partial
+from typing import Awaitable, Callable
+from uuid import UUID
+
+from src.core.enums.purge import PurgeEntity, PurgeStatus
+from src.core.interfaces.purge import PurgeScheduler
+from src.core.interfaces.repositories.group import (
+    GroupMemberRepository,
+    GroupRepository,
+    GroupRequestRepository,
+)
+from src.core.interfaces.repositories.purge import PurgeJobRepository
+from src.core.interfaces.repositories.user import UserRepository
+from src.core.models.purge import PurgeJob
+
+
+class PurgeService:
+    def __init__(
+        self,
+        job_repository: PurgeJobRepository,
+        scheduler: PurgeScheduler,
+    ) -> None:
+        self.job_repository = job_repository
+        self.scheduler = scheduler
+
+    async def schedule(self, entity: PurgeEntity, entity_id: UUID) -> PurgeJob:
+        job = PurgeJob(entity=entity, entity_id=entity_id)
+        await self.job_repository.persist(job)
+        self.scheduler.schedule(job)
+        return job
+
+    async def get_job(self, job_id: UUID) -> PurgeJob:
+        return await self.job_repository.get(pk=job_id)
+
+
+class PurgeJobRunner:
+    """
+    Remove the rows of an entity marked as being deleted in batches.
+
+    At most ``batch_size`` rows are removed at once, and progress is recorded
+    on the job after every batch.
+
+    Every statement is expected to be committed on its own, so a batch only
+    holds locks for its own rows, and an interrupted job resumes where it
+    stopped when run again.
+    """
+
+    def __init__(
+        self,
+        job_repository: PurgeJobRepository,
+        user_repository: UserRepository,
+        group_repository: GroupRepository,
+        member_repository: GroupMemberRepository,
+        request_repository: GroupRequestRepository,
+        batch_size: int,
+    ) -> None:
+        self.job_repository = job_repository
+        self.user_repository = user_repository
+        self.group_repository = group_repository
+        self.member_repository = member_repository
+        self.request_repository = request_repository
+        self.batch_size = batch_size
+
+    async def run(self, job_id: UUID) -> PurgeJob:
+        job = await self.job_repository.get(pk=job_id)
+        if job.status == PurgeStatus.DONE:
+            return job
+
+        if job.entity == PurgeEntity.GROUP:
+            await self._purge_group(job, job.entity_id)
+        else:
+            await self._purge_user(job)
+
+        job.finish()
+        await self.job_repository.update(job)
+        return job
+
+    async def _purge_group(self, job: PurgeJob, group_id: UUID) -> None:
+        for repository in (self.member_repository, self.request_repository):
+            await self._delete_in_batches(
+                job,
+                partial(repository.delete_batch_by_group_id, group_id),
+            )
+        await self.group_repository.purge(group_id)
+
+    async def _purge_user(self, job: PurgeJob) -> None:
+        user_id = job.entity_id
+        for group_id in await self.group_repository.mark_deleting_owned_by(user_id):
+            await self._purge_group(job, group_id)
+
+        for repository in (self.member_repository, self.request_repository):
+            await self._delete_in_batches(
+                job,
+                partial(repository.delete_batch_by_user_id, user_id),
+            )
+        await self.user_repository.purge(user_id)
+
+    async def _delete_in_batches(
+        self,
+        job: PurgeJob,
+        delete_batch: Callable[[int], Awaitable[int]],
+    ) -> None:
+        while True:
+            deleted_rows = await delete_batch(self.batch_size)
+            if not deleted_rows:
+                return
+
+            job.record_progress(deleted_rows)
+            await self.job_repository.update(job)
+            if deleted_rows < self.batch_size:
+                return
@@ -1,28 +1,48 @@
+from typing import AsyncIterator, Collection
 from uuid import UUID
 
+from src.core.cache import AccessTokenCache
+from src.core.enums.purge import PurgeEntity
 from src.core.exceptions import (
     AlreadyActiveError,
     AlreadyExistsError,
     DoesNotExistError,
 )
+from src.core.hashing import password_hasher
 from src.core.interfaces.email import EmailSender
+from src.core.interfaces.repositories.group import GroupRepository
 from src.core.interfaces.repositories.user import UserRepository
+from src.core.interfaces.transaction import CommitHooks
+from src.core.models.base import AppModel
 from src.core.models.user import User
+from src.core.pagination import Page, Pagination
 from src.core.schemas.email import EmailSchema
 from src.core.schemas.user import CreateUserSchema, UpdateUserSchema
-from src.core.utils import get_password_hash
+from src.core.services.purge import PurgeService
 
 
 class UserService:
-    def __init__(self, repository: UserRepository, email_sender: EmailSender):
+    def __init__(
+        self,
+        repository: UserRepository,
+        group_repository: GroupRepository,
+        email_sender: EmailSender,
+        purge_service: PurgeService,
+        token_cache: AccessTokenCache | None = None,
+        commit_hooks: CommitHooks | None = None,
+    ):
         self.repository = repository
+        self.group_repository = group_repository
         self.email_sender = email_sender
+        self.purge_service = purge_service
+        self.token_cache = token_cache
+        self.commit_hooks = commit_hooks
 
     async def create_user(self, schema: CreateUserSchema) -> User:
         if await self.repository.get_by_email(schema.email):
             raise AlreadyExistsError("User with given email already exists")
 
-        hashed_password = get_password_hash(schema.password)
+        hashed_password = await password_hasher.hash(schema.password)
         user_data = schema.model_dump(exclude={"password", "repeat_password"})
         new_user = User(**user_data, password_hash=hashed_password)
         await self.repository.persist(new_user)
@@ -35,8 +55,7 @@ class UserService:
             raise AlreadyActiveError("User is already active")
 
         user.generate_email_confirmation_token()
-        fields_to_update = ["email_confirmation_token"]
-        await self.repository.update(user, fields_to_update)
+        await self._update(user)
 
         activation_email = EmailSchema(
             subject="Thank you for registering - activate your account",
@@ -52,8 +71,7 @@ class UserService:
             raise DoesNotExistError("User with given email does not exist")
 
         user.generate_password_reset_token()
-        fields_to_update = ["password_reset_token", "password_reset_token_expires_at"]
-        await self.repository.update(user, fields_to_update)
+        await self._update(user)
 
         password_reset_email = EmailSchema(
             subject="Password reset",
@@ -67,15 +85,19 @@ class UserService:
         user = await self.repository.get(pk=user_id)
 
         user.activate()
-        fields_to_update = ["is_active"]
-        await self.repository.update(user, fields_to_update)
+        await self._update(user)
+
+    async def deactivate_user(self, user_id: UUID) -> None:
+        user = await self.repository.get(pk=user_id)
+
+        user.deactivate()
+        await self._update(user)
 
     async def confirm_email(self, user_id: UUID, confirmation_token: str) -> None:
         user = await self.repository.get(pk=user_id)
 
         user.confirm_email(confirmation_token)
-        fields_to_update = ["is_active", "email_confirmation_token"]
-        await self.repository.update(user, fields_to_update)
+        await self._update(user)
 
     async def reset_password(
         self,
@@ -85,28 +107,72 @@ class UserService:
     ) -> None:
         user = await self.repository.get(pk=user_id)
 
-        user.reset_password(reset_password_token, new_password)
-        fields_to_update = [
-            "password_hash",
-            "password_reset_token",
-            "password_reset_token_expires_at",
-        ]
-        await self.repository.update(user, fields_to_update)
+        user.check_password_reset_token(reset_password_token)
+        password_hash = await password_hasher.hash(new_password)
+        user.reset_password(reset_password_token, password_hash)
+        await self._update(user)
 
     async def get_user(self, user_id: UUID) -> User:
         return await self.repository.get(pk=user_id)
 
-    async def get_users(self) -> list[User]:
+    async def get_users(self, pagination: Pagination | None = None) -> Page[User]:
         # TODO: Allow filtering
-        return await self.repository.get_many()
+        if pagination is None:
+            pagination = Pagination()
+
+        users = await self.repository.get_many(
+            limit=pagination.limit + 1,
+            after=pagination.after,
+        )
+        return Page.from_items(users, pagination.limit)
+
+    async def get_users_projected(
+        self,
+        fields: Collection[str],
+        pagination: Pagination | None = None,
+    ) -> Page[AppModel]:
+        if pagination is None:
+            pagination = Pagination()
+
+        users = await self.repository.get_many_projected(
+            fields,
+            limit=pagination.limit + 1,
+            after=pagination.after,
+        )
+        return Page.from_items(users, pagination.limit)
+
+    def stream_users_projected(
+        self,
+        fields: Collection[str],
+    ) -> AsyncIterator[AppModel]:
+        return self.repository.stream_many_projected(fields)
 
     async def delete_user(self, user: User) -> None:
-        await self.repository.delete(user)
+        await self.repository.mark_deleting(user.id)
+        await self.group_repository.mark_deleting_owned_by(user.id)
+        await self.purge_service.schedule(PurgeEntity.USER, user.id)
+        self._invalidate_cached_tokens(user)
 
-    async def update_user(self, user: User, schema: UpdateUserSchema) -> None:
-        fields_to_update = []
+    async def update_user(self, user: User, schema: UpdateUserSchema) -> User:
         for key, value in schema.model_dump().items():
             setattr(user, key, value)
-            fields_to_update.append(key)
 
-        await self.repository.update(user, fields_to_update)
+        await self._update(user)
+        return user
+
+    async def _update(self, user: User) -> None:
+        await self.repository.update(user)
+        self._invalidate_cached_tokens(user)
+
+    def _invalidate_cached_tokens(self, user: User) -> None:
+        if self.token_cache is None:
+            return
+
+        # Until the change commits, a concurrent request may cache the user as
+        # it was before, so the tokens are dropped again once it does.
+        self.token_cache.invalidate_user(user.id)
+        if self.commit_hooks is not None:
+            token_cache = self.token_cache
+            self.commit_hooks.after_commit(
+                lambda: token_cache.invalidate_user(user.id),
+            )
@@ -12,4 +12,4 @@ app.conf.update(
     result_serializer="pickle",
 )
 
-app.autodiscover_tasks(["src.infrastructure.email"])
+app.autodiscover_tasks(["src.infrastructure.email", "src.infrastructure.purge"])
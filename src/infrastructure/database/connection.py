@@ -1,12 +1,212 @@
-from typing import AsyncGenerator
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, TypeAlias
 
-from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+from sqlalchemy import CursorResult, Dialect, Executable, PoolProxiedConnection
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncResult,
+    create_async_engine,
+)
 
+from src.core.interfaces.transaction import CommitHooks
+from src.infrastructure.database.identity_map import IdentityMap
+from src.infrastructure.database.loader import BatchLoader, LoadMany
+from src.infrastructure.database.pool import InstrumentedAsyncAdaptedQueuePool
+from src.infrastructure.database.replicas import EngineRouter
 from src.settings import settings
 
-engine = create_async_engine(settings.postgres_url, echo=False)
 
+def _create_engine(url: str) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        echo=False,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=settings.POSTGRES_POOL_SIZE,
+        max_overflow=settings.POSTGRES_MAX_OVERFLOW,
+        pool_timeout=settings.POSTGRES_POOL_TIMEOUT,
+        pool_recycle=settings.POSTGRES_POOL_RECYCLE,
+        pool_pre_ping=settings.POSTGRES_POOL_PRE_PING,
+        connect_args={
+            "prepared_statement_cache_size": settings.POSTGRES_STATEMENT_CACHE_SIZE,
+        },
+    )
 
-async def get_db() -> AsyncGenerator[AsyncConnection, None]:
-    async with engine.begin() as conn:
-        yield conn
+
+engine = _create_engine(settings.postgres_url)
+
+engine_router = EngineRouter(
+    primary=engine,
+    replicas=[_create_engine(url) for url in settings.postgres_replica_urls],
+    selection=settings.POSTGRES_REPLICA_SELECTION,
+    health_check_interval=settings.POSTGRES_REPLICA_HEALTH_CHECK_INTERVAL,
+)
+
+
+class RequestConnection(CommitHooks):
+    """
+    Lazily checked out connection scoped to a single request.
+
+    No connection is taken from the pool until the first statement runs.
+    Read-only connections run in autocommit mode, so plain reads skip the
+    BEGIN/COMMIT round trips; writable ones open a transaction that is
+    committed or rolled back on ``release``. ``on_commit`` is called after
+    every successful commit; callbacks registered with ``after_commit`` run
+    once after the next one and are dropped if the transaction rolls back.
+
+    Repositories sharing the connection share its ``identity_map``, which is
+    cleared whenever the connection is released, and its primary key loaders.
+    Sibling coroutines may use it concurrently: checking out the connection
+    and running statements are serialized, so they never take a second
+    connection from the pool or interleave on the one they share.
+    """
+
+    def __init__(
+        self,
+        async_engine: AsyncEngine,
+        read_only: bool = False,
+        on_commit: Callable[[], None] | None = None,
+    ) -> None:
+        self._engine = async_engine
+        self._read_only = read_only
+        self._on_commit = on_commit
+        self._commit_callbacks: list[Callable[[], None]] = []
+        self._conn: AsyncConnection | None = None
+        self._lock = asyncio.Lock()
+        self.identity_map = IdentityMap()
+        self._loaders: dict[str, BatchLoader[Any, Any]] = {}
+
+    @property
+    def read_only(self) -> bool:
+        return self._read_only
+
+    @property
+    def checked_out(self) -> bool:
+        return self._conn is not None
+
+    @property
+    def dialect(self) -> Dialect:
+        return self._engine.dialect
+
+    def get_loader(
+        self,
+        name: str,
+        load_many: LoadMany[Any, Any],
+    ) -> BatchLoader[Any, Any]:
+        """
+        Get the loader registered under ``name``.
+
+        It is created with ``load_many`` on first use.
+
+        :return: the loader registered under ``name``
+        """
+        if name not in self._loaders:
+            self._loaders[name] = BatchLoader(load_many)
+        return self._loaders[name]
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """
+        Call ``callback`` once the current transaction commits.
+
+        Side effects such as enqueueing tasks then never see uncommitted rows.
+        """
+        self._commit_callbacks.append(callback)
+
+    async def execute(
+        self,
+        statement: Executable,
+        *args: Any,
+        **kwargs: Any,
+    ) -> CursorResult[Any]:
+        async with self._lock:
+            conn = await self._connect()
+            return await conn.execute(statement, *args, **kwargs)
+
+    async def get_raw_connection(self) -> PoolProxiedConnection:
+        async with self._lock:
+            conn = await self._connect()
+            return await conn.get_raw_connection()
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        statement: Executable,
+        *args: Any,
+        **kwargs: Any,
+    ) -> AsyncIterator[AsyncResult[Any]]:
+        # Rows are fetched in batches while the caller iterates, so the lock is
+        # only held to check the connection out.
+        async with self._lock:
+            conn = await self._connect()
+        if not self._read_only:
+            async with conn.stream(statement, *args, **kwargs) as results:
+                yield results
+            return
+
+        # Server-side cursors only live inside a transaction, which autocommit
+        # never opens, so streams get a short read-only one of their own.
+        await conn.execution_options(
+            isolation_level="READ COMMITTED",
+            postgresql_readonly=True,
+        )
+        try:
+            async with conn.begin():
+                async with conn.stream(statement, *args, **kwargs) as results:
+                    yield results
+        finally:
+            await conn.execution_options(isolation_level="AUTOCOMMIT")
+
+    async def release(self, commit: bool = True) -> None:
+        """
+        Finish the transaction, if any, and return the connection to the pool.
+
+        Safe to call more than once; a later statement checks out a new
+        connection.
+
+        :param commit: commit the transaction instead of rolling it back
+        """
+        self.identity_map.clear()
+        callbacks = self._commit_callbacks
+        self._commit_callbacks = []
+        conn = self._conn
+        self._conn = None
+        if conn is None:
+            return
+
+        try:  # noqa: WPS501
+            committed = await self._finish(conn, commit)
+        finally:
+            await conn.close()
+
+        if not committed:
+            return
+        if self._on_commit is not None:
+            self._on_commit()
+        for callback in callbacks:
+            callback()
+
+    async def _finish(self, conn: AsyncConnection, commit: bool) -> bool:
+        if not conn.in_transaction():
+            return False
+        if not commit:
+            await conn.rollback()
+            return False
+
+        await conn.commit()
+        return True
+
+    async def _connect(self) -> AsyncConnection:
+        if self._conn is not None:
+            return self._conn
+
+        conn = await self._engine.connect()
+        if self._read_only:
+            await conn.execution_options(isolation_level="AUTOCOMMIT")
+        else:
+            await conn.begin()
+        self._conn = conn
+        return conn
+
+
+DatabaseConnection: TypeAlias = AsyncConnection | RequestConnection
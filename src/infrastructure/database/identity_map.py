@@ -0,0 +1,46 @@
+from typing import Any
+
+from pydantic import BaseModel
+from sqlalchemy import Table
+
+
+class IdentityMap:
+    """
+    Models loaded through one connection, keyed by table and primary key.
+
+    Loading the same row twice hands back the model loaded first, so a
+    request sees one instance per row, including changes not saved yet, and
+    lookups by primary key skip the database entirely.
+    """
+
+    def __init__(self) -> None:
+        self._models: dict[tuple[str, Any], BaseModel] = {}
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def get(self, table: Table, pk: Any) -> BaseModel | None:
+        return self._models.get((table.name, pk))
+
+    def add(self, table: Table, pk: Any, model: BaseModel) -> BaseModel:
+        """
+        Register a loaded model, unless the row is already mapped.
+
+        :return: the mapped model for the row
+        """
+        return self._models.setdefault((table.name, pk), model)
+
+    def set(self, table: Table, pk: Any, model: BaseModel) -> None:
+        """Map the row to the given model, replacing any model mapped before."""
+        self._models[(table.name, pk)] = model
+
+    def remove(self, table: Table, pk: Any) -> None:
+        self._models.pop((table.name, pk), None)
+
+    def remove_all(self, table: Table) -> None:
+        stale = [key for key in self._models if key[0] == table.name]
+        for key in stale:
+            del self._models[key]
+
+    def clear(self) -> None:
+        self._models.clear()
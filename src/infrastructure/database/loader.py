@@ -0,0 +1,58 @@
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, TypeAlias, TypeVar
+
+Key = TypeVar("Key", bound=Hashable)
+Value = TypeVar("Value")
+
+LoadMany: TypeAlias = Callable[[list[Key]], Awaitable[dict[Key, Value]]]
+
+
+class BatchLoader(Generic[Key, Value]):
+    """
+    Load the keys requested within one event loop iteration at once.
+
+    The keys are loaded with a single call to ``load_many``.
+
+    Each caller receives the value of its own key, or ``None`` if
+    ``load_many`` did not return one. Keys requested again while a batch is
+    pending share that batch's result.
+    """
+
+    def __init__(self, load_many: LoadMany[Key, Value]) -> None:
+        self._load_many = load_many
+        self._pending: dict[Key, asyncio.Future[Value | None]] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def load(self, key: Key) -> Value | None:
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            if not self._pending:
+                loop.call_soon(self._dispatch)
+            future = loop.create_future()
+            self._pending[key] = future
+        return await future
+
+    def _dispatch(self) -> None:
+        batch = self._pending
+        self._pending = {}
+        task = asyncio.create_task(self._resolve(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(self, batch: dict[Key, asyncio.Future[Value | None]]) -> None:
+        try:
+            values = await self._load_many(list(batch))
+        except asyncio.CancelledError:
+            for future in batch.values():
+                future.cancel()
+            raise
+        except Exception as exc:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(values.get(key))
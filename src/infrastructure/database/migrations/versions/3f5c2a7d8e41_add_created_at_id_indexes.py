@@ -0,0 +1,38 @@
+"""Add (created_at, id) indexes for keyset pagination
+
+Revision ID: 3f5c2a7d8e41
+Revises: 9d9479b33ccb
+Create Date: 2026-10-17 10:12:31.508914
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3f5c2a7d8e41"
+down_revision = "9d9479b33ccb"
+branch_labels = None
+depends_on = None
+
+TABLES = ("user", "group", "group_member", "group_request")
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.create_index(
+                f"ix_{table}_created_at_id",
+                table,
+                ["created_at", "id"],
+                unique=False,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.drop_index(
+                f"ix_{table}_created_at_id",
+                table_name=table,
+                postgresql_concurrently=True,
+            )
@@ -0,0 +1,117 @@
+"""Add group membership and pending request indexes
+
+Revision ID: b72e4d1a9c05
+Revises: 3f5c2a7d8e41
+Create Date: 2026-10-17 14:03:47.219530
+
+"""
+from typing import Any
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b72e4d1a9c05"
+down_revision = "3f5c2a7d8e41"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Memberships and pending requests used to be created with a racy
+    # check-then-insert, so duplicates may exist and would make the unique
+    # indexes fail. Keep the most privileged membership and the oldest request.
+    op.execute(
+        """
+        DELETE FROM group_member
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY group_id, user_id
+                    ORDER BY is_owner DESC, is_admin DESC, created_at, id
+                ) AS position
+                FROM group_member
+            ) AS ranked
+            WHERE position > 1
+        )
+        """,
+    )
+    op.execute(
+        """
+        UPDATE group_request SET status = 'DECLINED'
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY user_id, group_id ORDER BY created_at, id
+                ) AS position
+                FROM group_request
+                WHERE status = 'PENDING'
+            ) AS ranked
+            WHERE position > 1
+        )
+        """,
+    )
+
+    with op.get_context().autocommit_block():
+        _create_index(
+            "ix_group_member_group_id_user_id",
+            "group_member",
+            ["group_id", "user_id"],
+            unique=True,
+            postgresql_include=["is_admin", "is_owner"],
+        )
+        _create_index(
+            "ix_group_member_user_id",
+            "group_member",
+            ["user_id"],
+            unique=False,
+        )
+        _create_index(
+            "ix_group_request_pending_user_id_group_id",
+            "group_request",
+            ["user_id", "group_id"],
+            unique=True,
+            postgresql_where=sa.text("status = 'PENDING'"),
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_group_request_pending_user_id_group_id",
+            table_name="group_request",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_group_member_user_id",
+            table_name="group_member",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_group_member_group_id_user_id",
+            table_name="group_member",
+            postgresql_concurrently=True,
+        )
+
+
+def _create_index(
+    name: str,
+    table_name: str,
+    columns: list[str],
+    **kwargs: Any,
+) -> None:
+    # A failed CREATE INDEX CONCURRENTLY leaves an INVALID index behind that
+    # would make the next run fail, so any leftover is dropped first.
+    op.drop_index(
+        name,
+        table_name=table_name,
+        if_exists=True,
+        postgresql_concurrently=True,
+    )
+    op.create_index(
+        name,
+        table_name,
+        columns,
+        postgresql_concurrently=True,
+        **kwargs,
+    )
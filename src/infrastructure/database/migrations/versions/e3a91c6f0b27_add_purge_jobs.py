@@ -0,0 +1,82 @@
+"""Add purge jobs and deleting_at columns
+
+Revision ID: e3a91c6f0b27
+Revises: b72e4d1a9c05
+Create Date: 2026-10-17 16:21:09.503112
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e3a91c6f0b27"
+down_revision = "b72e4d1a9c05"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("group", sa.Column("deleting_at", sa.DateTime(), nullable=True))
+    op.add_column("user", sa.Column("deleting_at", sa.DateTime(), nullable=True))
+    op.create_table(
+        "purge_job",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column(
+            "entity", sa.Enum("GROUP", "USER", name="purgeentity"), nullable=False
+        ),
+        sa.Column("entity_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum("PENDING", "RUNNING", "DONE", name="purgestatus"),
+            nullable=False,
+        ),
+        sa.Column("deleted_rows", sa.Integer(), nullable=False),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_group_request_group_id",
+            "group_request",
+            ["group_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_group_request_user_id",
+            "group_request",
+            ["user_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_group_request_user_id",
+            table_name="group_request",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_group_request_group_id",
+            table_name="group_request",
+            postgresql_concurrently=True,
+        )
+    op.drop_table("purge_job")
+    sa.Enum(name="purgestatus").drop(op.get_bind())
+    sa.Enum(name="purgeentity").drop(op.get_bind())
+    op.drop_column("user", "deleting_at")
+    op.drop_column("group", "deleting_at")
@@ -0,0 +1,39 @@
+import time
+from typing import Any
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+from src.core.metrics import Histogram
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that records how long checkouts take.
+
+    ``waiters`` counts checkouts that are currently waiting for a free
+    connection or for a new one to be opened.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.waiters = 0
+        self.checkout_latency = Histogram()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "size": self.size(),
+            "checked_in": self.checkedin(),
+            "checked_out": self.checkedout(),
+            "overflow": self.overflow(),
+            "waiters": self.waiters,
+            "checkout_latency": self.checkout_latency.snapshot(),
+        }
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started_at = time.perf_counter()
+        self.waiters += 1
+        try:  # noqa: WPS501
+            return super()._do_get()
+        finally:
+            self.waiters -= 1
+            self.checkout_latency.observe(time.perf_counter() - started_at)
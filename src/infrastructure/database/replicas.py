@@ -0,0 +1,109 @@
+import asyncio
+import itertools
+import logging
+from typing import Any, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.settings.database import ReplicaSelection
+
+logger = logging.getLogger(__name__)
+
+
+class EngineRouter:
+    """
+    Routes reads to replica engines and everything else to the primary.
+
+    Replicas that fail a health check are skipped until they pass one again.
+    When no replica is healthy, reads fall back to the primary.
+    """
+
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: Sequence[AsyncEngine] = (),
+        selection: ReplicaSelection = "round_robin",
+        health_check_interval: float = 5,
+    ) -> None:
+        self.primary = primary
+        self.replicas = tuple(replicas)
+        self.selection = selection
+        self.health_check_interval = health_check_interval
+        self._healthy = set(self.replicas)
+        self._round_robin = itertools.cycle(self.replicas)
+        self._health_check_task: asyncio.Task[None] | None = None
+        self._health_checks_stopped = asyncio.Event()
+
+    @property
+    def healthy_replicas(self) -> list[AsyncEngine]:
+        return [replica for replica in self.replicas if replica in self._healthy]
+
+    def reader(self) -> AsyncEngine:
+        healthy = self.healthy_replicas
+        if not healthy:
+            return self.primary
+
+        if self.selection == "least_connections":
+            return min(healthy, key=_checked_out)
+
+        while True:
+            replica = next(self._round_robin)
+            if replica in self._healthy:
+                return replica
+
+    def mark_unhealthy(self, replica: AsyncEngine) -> None:
+        if replica in self._healthy:
+            logger.warning(f"Replica {_display_url(replica)} marked unhealthy")
+        self._healthy.discard(replica)
+
+    async def check_health(self) -> None:
+        for replica in self.replicas:
+            try:
+                async with replica.connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+            except Exception:
+                self.mark_unhealthy(replica)
+            else:
+                self._healthy.add(replica)
+
+    async def start_health_checks(self) -> None:
+        if self.replicas and self._health_check_task is None:
+            self._health_checks_stopped.clear()
+            self._health_check_task = asyncio.create_task(self._run_health_checks())
+
+    async def stop_health_checks(self) -> None:
+        task = self._health_check_task
+        self._health_check_task = None
+        if task is None:
+            return
+
+        self._health_checks_stopped.set()
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    def stats(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "url": _display_url(replica),
+                "healthy": replica in self._healthy,
+                "checked_out": _checked_out(replica),
+            }
+            for replica in self.replicas
+        ]
+
+    async def _run_health_checks(self) -> None:
+        while not self._health_checks_stopped.is_set():
+            await self.check_health()
+            await asyncio.sleep(self.health_check_interval)
+
+
+def _checked_out(engine: AsyncEngine) -> int:
+    return engine.pool.checkedout()  # type: ignore
+
+
+def _display_url(engine: AsyncEngine) -> str:
+    return engine.url.render_as_string(hide_password=True)
@@ -1,4 +1,15 @@
-from sqlalchemy import Boolean, Column, DateTime, Enum, ForeignKey, String, Table, func
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    String,
+    Table,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID
 
 from src.constants import constants
@@ -20,8 +31,10 @@ group_table = Table(
         nullable=True,
     ),
     Column("is_private", Boolean, default=False, nullable=False),
+    Column("deleting_at", DateTime, nullable=True),
     Column("created_at", DateTime, server_default=func.now()),
     Column("updated_at", DateTime, server_default=func.now(), onupdate=func.now()),
+    Index("ix_group_created_at_id", "created_at", "id"),
 )
 
 group_member_table = Table(
@@ -34,6 +47,15 @@ group_member_table = Table(
     Column("is_owner", Boolean, default=False, nullable=False),
     Column("created_at", DateTime, server_default=func.now()),
     Column("updated_at", DateTime, server_default=func.now(), onupdate=func.now()),
+    Index("ix_group_member_created_at_id", "created_at", "id"),
+    Index(
+        "ix_group_member_group_id_user_id",
+        "group_id",
+        "user_id",
+        unique=True,
+        postgresql_include=["is_admin", "is_owner"],
+    ),
+    Index("ix_group_member_user_id", "user_id"),
 )
 
 group_request_table = Table(
@@ -50,4 +72,14 @@ group_request_table = Table(
     ),
     Column("created_at", DateTime, server_default=func.now()),
     Column("updated_at", DateTime, server_default=func.now(), onupdate=func.now()),
+    Index("ix_group_request_created_at_id", "created_at", "id"),
+    Index(
+        "ix_group_request_pending_user_id_group_id",
+        "user_id",
+        "group_id",
+        unique=True,
+        postgresql_where=text("status = 'PENDING'"),
+    ),
+    Index("ix_group_request_group_id", "group_id"),
+    Index("ix_group_request_user_id", "user_id"),
 )
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, DateTime, Enum, Integer, Table, func
+from sqlalchemy.dialects.postgresql import UUID
+
+from src.core.enums.purge import PurgeEntity, PurgeStatus
+from src.infrastructure.database.metadata import metadata
+
+purge_job_table = Table(
+    "purge_job",
+    metadata,
+    Column("id", UUID(as_uuid=True), primary_key=True),
+    Column("entity", Enum(PurgeEntity), nullable=False),
+    Column("entity_id", UUID(as_uuid=True), nullable=False),
+    Column("status", Enum(PurgeStatus), nullable=False),
+    Column("deleted_rows", Integer, default=0, nullable=False),
+    Column("finished_at", DateTime, nullable=True),
+    Column("created_at", DateTime, server_default=func.now()),
+    Column("updated_at", DateTime, server_default=func.now(), onupdate=func.now()),
+)
@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, Date, DateTime, String, Table, func
+from sqlalchemy import Boolean, Column, Date, DateTime, Index, String, Table, func
 from sqlalchemy.dialects.postgresql import UUID
 
 from src.infrastructure.database.metadata import metadata
@@ -17,6 +17,8 @@ user_table = Table(
     Column("password_reset_token_expires_at", DateTime),
     Column("is_active", Boolean, default=False, nullable=False),
     Column("is_superuser", Boolean, default=False, nullable=False),
+    Column("deleting_at", DateTime, nullable=True),
     Column("created_at", DateTime, server_default=func.now()),
     Column("updated_at", DateTime, server_default=func.now(), onupdate=func.now()),
+    Index("ix_user_created_at_id", "created_at", "id"),
 )
@@ -0,0 +1,63 @@
+import asyncio
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.core.interfaces.purge import PurgeScheduler as IPurgeScheduler
+from src.core.models.purge import PurgeJob
+from src.core.services.purge import PurgeJobRunner
+from src.infrastructure.celery import app
+from src.infrastructure.database.connection import RequestConnection
+from src.infrastructure.repositories.group import (
+    GroupMemberRepository,
+    GroupRepository,
+    GroupRequestRepository,
+)
+from src.infrastructure.repositories.purge import PurgeJobRepository
+from src.infrastructure.repositories.user import UserRepository
+from src.settings import settings
+
+
+class CeleryPurgeScheduler(IPurgeScheduler):
+    def __init__(self, conn: RequestConnection) -> None:
+        self._conn = conn
+
+    def schedule(self, job: PurgeJob) -> None:
+        # The job is committed together with the request that scheduled it;
+        # enqueue only once it is, so a rolled back request schedules nothing.
+        self._conn.after_commit(lambda: purge.apply_async(args=(job.id,)))
+
+
+async def run_purge_job(job_id: UUID) -> PurgeJob:
+    # Every statement commits on its own, so a batch holds row locks only
+    # until it finishes rather than for the whole purge.
+    engine = create_async_engine(
+        settings.postgres_url,
+        isolation_level="AUTOCOMMIT",
+        poolclass=NullPool,
+    )
+    try:  # noqa: WPS501
+        async with engine.connect() as conn:
+            runner = PurgeJobRunner(
+                PurgeJobRepository(conn),
+                UserRepository(conn),
+                GroupRepository(conn),
+                GroupMemberRepository(conn),
+                GroupRequestRepository(conn),
+                batch_size=settings.PURGE_BATCH_SIZE,
+            )
+            return await runner.run(job_id)
+    finally:
+        await engine.dispose()
+
+
+@app.task(
+    serializer="pickle",
+    ignore_result=True,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    acks_late=True,
+)
+def purge(job_id: UUID) -> None:
+    asyncio.run(run_purge_job(job_id))
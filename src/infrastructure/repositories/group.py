@@ -1,9 +1,34 @@
 import uuid
+from datetime import datetime
 from typing import Type
 
-from sqlalchemy import Table, delete, select
+from sqlalchemy import (
+    CTE,
+    ColumnElement,
+    Delete,
+    Row,
+    Select,
+    Table,
+    and_,
+    bindparam,
+    cast,
+    delete,
+    exists,
+    false,
+    func,
+    or_,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.dialects.postgresql import Insert, insert
 
-from src.core.enums.group import GroupRequestStatus
+from src.core.enums.group import (
+    GroupRequestStatus,
+    JoinGroupResult,
+    RemoveGroupMemberResult,
+    ReviewGroupRequestResult,
+)
 from src.core.exceptions import DoesNotExistError
 from src.core.interfaces.repositories.group import (
     GroupMemberRepository as AbstractGroupMemberRepository,
@@ -14,12 +39,15 @@ from src.core.interfaces.repositories.group import (
 from src.core.interfaces.repositories.group import (
     GroupRequestRepository as AbstractGroupRequestRepository,
 )
+from src.core.models.base import AppModel
 from src.core.models.group import Group, GroupMember, GroupRequest
+from src.core.pagination import Cursor
 from src.infrastructure.database.tables.group import (
     group_member_table,
     group_request_table,
     group_table,
 )
+from src.infrastructure.database.tables.user import user_table
 from src.infrastructure.repositories.sqlalchemy import SQLAlchemyRepository
 
 
@@ -27,14 +55,102 @@ class GroupRepository(
     SQLAlchemyRepository[uuid.UUID, Group],
     AbstractGroupRepository,
 ):
-    async def get_many_for_user(self, user_id: uuid.UUID) -> list[Group]:
-        stmt = (
+    async def get_many_for_user(
+        self,
+        user_id: uuid.UUID,
+        *,
+        limit: int | None = None,
+        after: Cursor | None = None,
+    ) -> list[Group]:
+        stmt = self._paginate(
             select(self._table)
             .join(self._group_member_table)
-            .where(self._group_member_table.c.user_id == user_id)
+            .where(
+                self._group_member_table.c.user_id == user_id,
+                *self._get_visibility_criteria(),
+            ),
+            limit,
+            after,
         )
         results = await self._conn.execute(stmt)
-        return [self._model.model_validate(result) for result in results]
+        return [self._load(result) for result in results]
+
+    async def get_with_membership(
+        self,
+        group_id: uuid.UUID,
+        user_id: uuid.UUID,
+    ) -> tuple[Group, GroupMember | None]:
+        member_columns = [
+            column.label(f"member_{column.name}")
+            for column in self._group_member_table.c
+        ]
+        stmt = (
+            select(self._table, *member_columns)
+            .outerjoin(
+                self._group_member_table,
+                and_(
+                    self._group_member_table.c.group_id == self._table.c.id,
+                    self._group_member_table.c.user_id == user_id,
+                ),
+            )
+            .where(self._table.c.id == group_id, *self._get_visibility_criteria())
+            .limit(1)
+        )
+        row = (await self._conn.execute(stmt)).mappings().first()
+        if not row:
+            raise DoesNotExistError(
+                f"{self.__class__.__name__} could not find {self._model.__name__} "
+                f"with given PK - {group_id}",
+            )
+
+        group = self._load({column.name: row[column.name] for column in self._table.c})
+        if row["member_id"] is None:
+            return group, None
+
+        member = GroupMember.from_trusted(
+            {
+                column.name: row[f"member_{column.name}"]
+                for column in self._group_member_table.c
+            },
+        )
+        return group, member
+
+    async def mark_deleting(self, group_id: uuid.UUID) -> None:
+        stmt = (
+            update(self._table)
+            .where(self._table.c.id == group_id)
+            .values(deleting_at=datetime.now())
+        )
+        await self._conn.execute(stmt)
+        self._forget(group_id)
+
+    async def mark_deleting_owned_by(self, user_id: uuid.UUID) -> list[uuid.UUID]:
+        owned = select(self._group_member_table.c.group_id).where(
+            self._group_member_table.c.user_id == user_id,
+            self._group_member_table.c.is_owner,
+        )
+        stmt = (
+            update(self._table)
+            .where(self._table.c.id.in_(owned))
+            .values(
+                deleting_at=func.coalesce(self._table.c.deleting_at, datetime.now()),
+            )
+            .returning(self._table.c.id)
+        )
+        group_ids = list((await self._conn.execute(stmt)).scalars())
+        self._forget(*group_ids)
+        return group_ids
+
+    async def purge(self, group_id: uuid.UUID) -> None:
+        stmt = delete(self._table).where(
+            self._table.c.id == group_id,
+            self._table.c.deleting_at.is_not(None),
+        )
+        await self._conn.execute(stmt)
+        self._forget(group_id)
+
+    def _get_visibility_criteria(self) -> list[ColumnElement[bool]]:
+        return [self._table.c.deleting_at.is_(None)]
 
     @property
     def _group_member_table(self) -> Table:
@@ -58,26 +174,121 @@ class GroupMemberRepository(
         user_id: uuid.UUID,
         group_id: uuid.UUID,
     ) -> GroupMember:
-        stmt = (
-            select(self._table)
-            .where(
-                self._table.c.user_id == user_id,
-                self._table.c.group_id == group_id,
-            )
-            .limit(1)
-        )
-        result = (await self._conn.execute(stmt)).first()
+        result = await self._fetch_by_user_and_group_id(user_id, group_id)
         if not result:
             raise DoesNotExistError(
                 f"{self.__class__.__name__} could not find {self._model.__name__}"
                 f"with given group_id - {group_id} and user_id - {user_id}",
             )
 
-        return self._model.model_validate(result)
+        return self._load(result)
 
-    async def delete_by_group_id(self, group_id: uuid.UUID) -> None:
-        stmt = delete(self._table).where(self._table.c.group_id == group_id)
-        await self._conn.execute(stmt)
+    async def try_persist(self, group_member: GroupMember) -> JoinGroupResult:
+        target_group = _select_group(group_member.group_id).cte("target_group")
+        inserted = (
+            insert(self._table)
+            .from_select(
+                [column.name for column in self._table.c],
+                _select_values(self._table, group_member).select_from(target_group),
+            )
+            .on_conflict_do_nothing(index_elements=["group_id", "user_id"])
+            .returning(self._table.c.id)
+            .cte("inserted")
+        )
+        stmt = select(
+            exists(target_group.select()).label("group_exists"),
+            exists(inserted.select()).label("created"),
+        )
+        result = (await self._conn.execute(stmt)).one()
+
+        return _to_join_result(
+            group_exists=result.group_exists,
+            is_member=not result.created,
+            created=result.created,
+        )
+
+    async def remove_many(
+        self,
+        group_id: uuid.UUID,
+        member_ids: list[uuid.UUID],
+        *,
+        can_remove_admins: bool,
+    ) -> dict[uuid.UUID, RemoveGroupMemberResult]:
+        target_members = (
+            select(self._table.c.id, self._table.c.is_owner)
+            .where(
+                self._table.c.group_id == group_id,
+                self._table.c.id.in_(member_ids),
+            )
+            .cte("target_members")
+        )
+        criteria = [
+            self._table.c.group_id == group_id,
+            self._table.c.id.in_(member_ids),
+            ~self._table.c.is_owner,
+        ]
+        if not can_remove_admins:
+            criteria.append(~self._table.c.is_admin)
+        deleted = (
+            delete(self._table)
+            .where(*criteria)
+            .returning(self._table.c.id)
+            .cte("deleted")
+        )
+        stmt = select(
+            target_members.c.id,
+            target_members.c.is_owner,
+            deleted.c.id.is_not(None).label("removed"),
+        ).outerjoin(deleted, deleted.c.id == target_members.c.id)
+
+        results = dict.fromkeys(
+            member_ids,
+            RemoveGroupMemberResult.MEMBER_DOES_NOT_EXIST,
+        )
+        for row in await self._conn.execute(stmt):
+            if row.removed:
+                self._forget(row.id)
+                results[row.id] = RemoveGroupMemberResult.REMOVED
+            elif row.is_owner:
+                results[row.id] = RemoveGroupMemberResult.CANNOT_DELETE_A_GROUP_OWNER
+            else:
+                results[row.id] = RemoveGroupMemberResult.NOT_A_GROUP_OWNER
+        return results
+
+    async def delete_batch_by_group_id(self, group_id: uuid.UUID, limit: int) -> int:
+        stmt = _delete_batch(self._table, self._table.c.group_id == group_id, limit)
+        self._forget_all()
+        return (await self._conn.execute(stmt)).rowcount
+
+    async def delete_batch_by_user_id(self, user_id: uuid.UUID, limit: int) -> int:
+        stmt = _delete_batch(self._table, self._table.c.user_id == user_id, limit)
+        self._forget_all()
+        return (await self._conn.execute(stmt)).rowcount
+
+    async def _fetch_by_user_and_group_id(
+        self,
+        user_id: uuid.UUID,
+        group_id: uuid.UUID,
+    ) -> Row | None:
+        stmt = self._get_statement(
+            "get_by_user_and_group_id",
+            self._select_by_user_and_group_id,
+        )
+        params = {"user_id": user_id, "group_id": group_id}
+        return (await self._conn.execute(stmt, params)).first()
+
+    def _select_by_user_and_group_id(self) -> Select:
+        return (
+            select(self._table)
+            .where(
+                self._table.c.user_id == bindparam("user_id"),
+                self._table.c.group_id == bindparam("group_id"),
+            )
+            .limit(1)
+        )
+
+    def _get_visibility_criteria(self) -> list[ColumnElement[bool]]:
+        return [_user_is_not_deleting(self._table)]
 
     @property
     def _table(self) -> Table:
@@ -113,11 +324,196 @@ class GroupRequestRepository(
                 f"with given group_id - {group_id} and user_id - {user_id}",
             )
 
-        return self._model.model_validate(result)
+        return self._load(result)
 
-    async def delete_by_group_id(self, group_id: uuid.UUID) -> None:
-        stmt = delete(self._table).where(self._table.c.group_id == group_id)
-        await self._conn.execute(stmt)
+    async def try_persist(self, group_request: GroupRequest) -> JoinGroupResult:
+        target_group = _select_group(group_request.group_id).cte("target_group")
+        membership = (
+            select(group_member_table.c.id)
+            .where(
+                group_member_table.c.group_id == group_request.group_id,
+                group_member_table.c.user_id == group_request.user_id,
+            )
+            .cte("membership")
+        )
+        inserted = (
+            insert(self._table)
+            .from_select(
+                [column.name for column in self._table.c],
+                _select_values(self._table, group_request)
+                .select_from(target_group)
+                .where(~exists(membership.select())),
+            )
+            .on_conflict_do_nothing(
+                index_elements=["user_id", "group_id"],
+                index_where=text("status = 'PENDING'"),
+            )
+            .returning(self._table.c.id)
+            .cte("inserted")
+        )
+        stmt = select(
+            exists(target_group.select()).label("group_exists"),
+            exists(membership.select()).label("is_member"),
+            exists(inserted.select()).label("created"),
+        )
+        result = (await self._conn.execute(stmt)).one()
+
+        return _to_join_result(
+            group_exists=result.group_exists,
+            is_member=result.is_member,
+            created=result.created,
+        )
+
+    async def review(
+        self,
+        request_id: uuid.UUID,
+        group_id: uuid.UUID,
+        reviewer_id: uuid.UUID,
+        status: GroupRequestStatus,
+    ) -> ReviewGroupRequestResult:
+        target_request = (
+            select(self._table.c.id)
+            .where(self._table.c.id == request_id, self._table.c.group_id == group_id)
+            .cte("target_request")
+        )
+        reviewer = (
+            select(group_member_table.c.is_admin, group_member_table.c.is_owner)
+            .where(
+                group_member_table.c.group_id == group_id,
+                group_member_table.c.user_id == reviewer_id,
+            )
+            .cte("reviewer")
+        )
+        can_review = exists(
+            reviewer.select().where(or_(reviewer.c.is_admin, reviewer.c.is_owner)),
+        )
+        updated = (
+            update(self._table)
+            .where(
+                self._table.c.id == request_id,
+                self._table.c.group_id == group_id,
+                self._table.c.status == GroupRequestStatus.PENDING,
+                can_review,
+            )
+            .values(status=status)
+            .returning(self._table.c.user_id, self._table.c.group_id)
+            .cte("updated")
+        )
+        outcome = [
+            exists(target_request.select()).label("request_exists"),
+            exists(reviewer.select()).label("is_member"),
+            can_review.label("can_review"),
+            exists(updated.select()).label("updated"),
+        ]
+        if status == GroupRequestStatus.ACCEPTED:
+            inserted = self._insert_member_from(updated).cte("inserted")
+            outcome.append(exists(inserted.select()).label("member_created"))
+
+        result = (await self._conn.execute(select(*outcome))).one()
+        self._forget(request_id)
+
+        if not result.request_exists:
+            return ReviewGroupRequestResult.REQUEST_DOES_NOT_EXIST
+        if not result.is_member:
+            return ReviewGroupRequestResult.NOT_A_MEMBER
+        if not result.can_review:
+            return ReviewGroupRequestResult.NOT_A_GROUP_OWNER_OR_ADMIN
+        if not result.updated:
+            return ReviewGroupRequestResult.NOT_PENDING
+        if status == GroupRequestStatus.ACCEPTED and not result.member_created:
+            return ReviewGroupRequestResult.ALREADY_A_MEMBER
+        return ReviewGroupRequestResult.REVIEWED
+
+    async def review_many(
+        self,
+        group_id: uuid.UUID,
+        request_ids: list[uuid.UUID],
+        status: GroupRequestStatus,
+    ) -> dict[uuid.UUID, ReviewGroupRequestResult]:
+        is_member = exists().where(
+            group_member_table.c.group_id == self._table.c.group_id,
+            group_member_table.c.user_id == self._table.c.user_id,
+        )
+        target_requests = (
+            select(self._table.c.id, self._table.c.status)
+            .where(
+                self._table.c.group_id == group_id,
+                self._table.c.id.in_(request_ids),
+            )
+            .cte("target_requests")
+        )
+        criteria = [
+            self._table.c.group_id == group_id,
+            self._table.c.id.in_(request_ids),
+            self._table.c.status == GroupRequestStatus.PENDING,
+        ]
+        if status == GroupRequestStatus.ACCEPTED:
+            criteria.append(~is_member)
+        updated = (
+            update(self._table)
+            .where(*criteria)
+            .values(status=status)
+            .returning(
+                self._table.c.id,
+                self._table.c.user_id,
+                self._table.c.group_id,
+            )
+            .cte("updated")
+        )
+        stmt = select(
+            target_requests.c.id,
+            target_requests.c.status,
+            updated.c.id.is_not(None).label("updated"),
+        ).outerjoin(updated, updated.c.id == target_requests.c.id)
+        if status == GroupRequestStatus.ACCEPTED:
+            stmt = stmt.add_cte(self._insert_member_from(updated).cte("inserted"))
+
+        results = dict.fromkeys(
+            request_ids,
+            ReviewGroupRequestResult.REQUEST_DOES_NOT_EXIST,
+        )
+        for row in await self._conn.execute(stmt):
+            if row.updated:
+                self._forget(row.id)
+                results[row.id] = ReviewGroupRequestResult.REVIEWED
+            elif row.status == GroupRequestStatus.PENDING:
+                results[row.id] = ReviewGroupRequestResult.ALREADY_A_MEMBER
+            else:
+                results[row.id] = ReviewGroupRequestResult.NOT_PENDING
+        return results
+
+    async def delete_batch_by_group_id(self, group_id: uuid.UUID, limit: int) -> int:
+        stmt = _delete_batch(self._table, self._table.c.group_id == group_id, limit)
+        self._forget_all()
+        return (await self._conn.execute(stmt)).rowcount
+
+    async def delete_batch_by_user_id(self, user_id: uuid.UUID, limit: int) -> int:
+        stmt = _delete_batch(self._table, self._table.c.user_id == user_id, limit)
+        self._forget_all()
+        return (await self._conn.execute(stmt)).rowcount
+
+    def _insert_member_from(self, accepted: CTE) -> Insert:
+        now = datetime.now()
+        return (
+            insert(group_member_table)
+            .from_select(
+                [column.name for column in group_member_table.c],
+                select(
+                    func.gen_random_uuid(),
+                    accepted.c.user_id,
+                    accepted.c.group_id,
+                    false(),
+                    false(),
+                    cast(now, group_member_table.c.created_at.type),
+                    cast(now, group_member_table.c.updated_at.type),
+                ),
+            )
+            .on_conflict_do_nothing(index_elements=["group_id", "user_id"])
+            .returning(group_member_table.c.id)
+        )
+
+    def _get_visibility_criteria(self) -> list[ColumnElement[bool]]:
+        return [_user_is_not_deleting(self._table)]
 
     @property
     def _table(self) -> Table:
@@ -126,3 +522,56 @@ class GroupRequestRepository(
     @property
     def _model(self) -> Type[GroupRequest]:
         return GroupRequest
+
+
+def _select_group(group_id: uuid.UUID) -> Select:
+    return select(group_table.c.id).where(
+        group_table.c.id == group_id,
+        group_table.c.deleting_at.is_(None),
+    )
+
+
+def _user_is_not_deleting(table: Table) -> ColumnElement[bool]:
+    # Rows of a user being deleted are only removed later by a purge job, so
+    # hide them from the moment the user is marked.
+    return ~exists().where(
+        user_table.c.id == table.c.user_id,
+        user_table.c.deleting_at.is_not(None),
+    )
+
+
+def _delete_batch(table: Table, criterion: ColumnElement[bool], limit: int) -> Delete:
+    """
+    Delete at most ``limit`` rows matching ``criterion``.
+
+    Each batch then only holds row locks for a bounded number of rows.
+
+    :return: the delete statement
+    """
+    batch = select(table.c.id).where(criterion).limit(limit)
+    return delete(table).where(table.c.id.in_(batch.scalar_subquery()))
+
+
+def _select_values(table: Table, model: AppModel) -> Select:
+    values = model.model_dump()
+    return select(
+        *[
+            cast(values[column.name], column.type).label(column.name)
+            for column in table.c
+        ],
+    )
+
+
+def _to_join_result(
+    *,
+    group_exists: bool,
+    is_member: bool,
+    created: bool,
+) -> JoinGroupResult:
+    if created:
+        return JoinGroupResult.CREATED
+    if not group_exists:
+        return JoinGroupResult.GROUP_DOES_NOT_EXIST
+    if is_member:
+        return JoinGroupResult.ALREADY_A_MEMBER
+    return JoinGroupResult.ALREADY_REQUESTED
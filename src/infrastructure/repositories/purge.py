@@ -0,0 +1,24 @@
+import uuid
+from typing import Type
+
+from sqlalchemy import Table
+
+from src.core.interfaces.repositories.purge import (
+    PurgeJobRepository as AbstractPurgeJobRepository,
+)
+from src.core.models.purge import PurgeJob
+from src.infrastructure.database.tables.purge import purge_job_table
+from src.infrastructure.repositories.sqlalchemy import SQLAlchemyRepository
+
+
+class PurgeJobRepository(
+    SQLAlchemyRepository[uuid.UUID, PurgeJob],
+    AbstractPurgeJobRepository,
+):
+    @property
+    def _table(self) -> Table:
+        return purge_job_table
+
+    @property
+    def _model(self) -> Type[PurgeJob]:
+        return PurgeJob
@@ -0,0 +1,71 @@
+import uuid
+from typing import Any, Callable
+
+from asyncpg import Record
+from sqlalchemy import Compiled, Dialect, Select
+
+from src.infrastructure.database.connection import DatabaseConnection
+from src.infrastructure.repositories.group import GroupMemberRepository
+from src.infrastructure.repositories.user import UserRepository
+
+_queries: dict[tuple[type, str, Dialect], Compiled] = {}
+
+
+class RawQueryMixin:
+    """
+    Run fixed-shape queries directly on the connection's asyncpg driver.
+
+    This skips SQLAlchemy's execution and result layers. Queries are compiled
+    once per repository class and dialect from the same statements the Core
+    path executes, so both return the same rows. asyncpg's statement
+    cache keeps one prepared statement per query on every pooled connection,
+    and records are mapped to models with ``AppModel.from_trusted``.
+
+    Reads issued before the connection's first Core statement run outside its
+    transaction; under READ COMMITTED they see the same data.
+    """
+
+    _conn: DatabaseConnection
+
+    async def _fetch_raw(
+        self,
+        name: str,
+        build: Callable[[], Select],
+        params: dict[str, Any],
+    ) -> list[Record]:
+        dialect = self._conn.dialect
+        key = (type(self), name, dialect)
+        compiled = _queries.get(key)
+        if compiled is None:
+            compiled = build().compile(dialect=dialect)
+            _queries[key] = compiled
+
+        values = compiled.construct_params(params)
+        raw = await self._conn.get_raw_connection()
+        return await raw.driver_connection.fetch(
+            compiled.string,
+            *(values[param] for param in compiled.positiontup or ()),
+        )
+
+
+class RawUserRepository(RawQueryMixin, UserRepository):
+    """``UserRepository`` that looks users up by primary key on raw asyncpg."""
+
+    async def _fetch_by_ids(self, pks: list[uuid.UUID]) -> list[Record]:
+        return await self._fetch_raw("get_by_ids", self._select_by_ids, {"ids": pks})
+
+
+class RawGroupMemberRepository(RawQueryMixin, GroupMemberRepository):
+    """``GroupMemberRepository`` that looks memberships up on raw asyncpg."""
+
+    async def _fetch_by_user_and_group_id(
+        self,
+        user_id: uuid.UUID,
+        group_id: uuid.UUID,
+    ) -> Record | None:
+        records = await self._fetch_raw(
+            "get_by_user_and_group_id",
+            self._select_by_user_and_group_id,
+            {"user_id": user_id, "group_id": group_id},
+        )
+        return records[0] if records else None
@@ -1,62 +1,226 @@
 from abc import ABC, abstractmethod
-from typing import Generic, Type, TypeVar
+from itertools import islice
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Collection,
+    Generic,
+    Iterable,
+    Iterator,
+    Mapping,
+    Type,
+    TypeVar,
+    cast,
+)
 
-from sqlalchemy import CursorResult, Table, delete, insert, select, update
+from asyncpg import IntegrityConstraintViolationError, Record
+from sqlalchemy import (
+    ARRAY,
+    ColumnElement,
+    CursorResult,
+    Executable,
+    Row,
+    RowMapping,
+    Select,
+    Table,
+    any_,
+    bindparam,
+    delete,
+    insert,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.ext.asyncio import AsyncConnection
 
 from src.core.exceptions import AlreadyExistsError, DoesNotExistError
-from src.core.filters.base import FilterSet, SQLAlchemyFilter
+from src.core.filters.base import FilterSet
 from src.core.interfaces.repositories.base import BaseRepository
 from src.core.models.base import AppModel
+from src.core.pagination import Cursor
+from src.infrastructure.database.connection import DatabaseConnection, RequestConnection
+from src.infrastructure.database.identity_map import IdentityMap
+from src.infrastructure.database.loader import BatchLoader
+from src.settings import settings
 
 PK = TypeVar("PK")
 Model = TypeVar("Model", bound=AppModel)
 
+_statements: dict[tuple[type, str], Executable] = {}
+
 
 class SQLAlchemyRepository(Generic[PK, Model], BaseRepository[PK, Model], ABC):
-    def __init__(self, async_connection: AsyncConnection) -> None:
+    def __init__(self, async_connection: DatabaseConnection) -> None:
         self._conn = async_connection
+        self._identity_map: IdentityMap | None = None
+        self._loader: BatchLoader[PK, Model] | None = None
+        if isinstance(async_connection, RequestConnection):
+            self._identity_map = async_connection.identity_map
+            self._loader = async_connection.get_loader(
+                self._table.name,
+                self._get_by_ids,
+            )
 
     async def get(self, pk: PK) -> Model:
-        stmt = select(self._table).where(self._table.c.id == pk).limit(1)
-        result = (await self._conn.execute(stmt)).first()
-        if not result:
+        mapped = self._get_mapped(pk)
+        if mapped is not None:
+            return mapped
+
+        # Lookups issued by sibling coroutines are batched into one query.
+        if self._loader is not None:
+            model = await self._loader.load(pk)
+        else:
+            model = (await self._get_by_ids([pk])).get(pk)
+        if model is None:
             raise DoesNotExistError(
                 f"{self.__class__.__name__} could not find {self._model.__name__} with given PK - {pk}",
             )
-        return self._model.model_validate(result)
-
-    async def get_many(self, filter_set: FilterSet | None = None) -> list[Model]:
-        exps = []
-        if filter_set:
-            sa_filters = [
-                SQLAlchemyFilter.from_filter(filter_)
-                for filter_ in filter_set.get_filters()
-            ]
-            exps = [filter_(self._table) for filter_ in sa_filters]
-
-        stmt = select(self._table).where(*exps)
+        return model
+
+    async def get_many_by_ids(self, pks: list[PK]) -> list[Model]:
+        models = await self._get_by_ids(pks)
+        return [models[pk] for pk in pks if pk in models]
+
+    async def get_many(
+        self,
+        filter_set: FilterSet | None = None,
+        *,
+        limit: int | None = None,
+        after: Cursor | None = None,
+    ) -> list[Model]:
+        stmt = self._paginate(self._select_many(filter_set), limit, after)
         results: CursorResult = await self._conn.execute(stmt)
-        return [self._model.model_validate(result) for result in results]
+        return [self._load(result) for result in results]
+
+    async def get_many_projected(
+        self,
+        fields: Collection[str],
+        filter_set: FilterSet | None = None,
+        *,
+        limit: int | None = None,
+        after: Cursor | None = None,
+    ) -> list[AppModel]:
+        projection = self._model.projection(fields)
+        stmt = self._paginate(
+            self._select_many(filter_set, projection),
+            limit,
+            after,
+        )
+        results: CursorResult = await self._conn.execute(stmt)
+        return [projection.from_trusted(_as_mapping(result)) for result in results]
+
+    async def stream_many(
+        self,
+        filter_set: FilterSet | None = None,
+        *,
+        fetch_size: int | None = None,
+    ) -> AsyncIterator[Model]:
+        stmt = self._paginate(self._select_many(filter_set)).execution_options(
+            yield_per=fetch_size or settings.STREAM_FETCH_SIZE,
+        )
+
+        # Streamed models are not mapped, so memory use stays independent of
+        # the number of rows.
+        async with self._conn.stream(stmt) as results:
+            async for result in results:
+                mapped = self._get_mapped(result.id)
+                yield mapped or self._model.from_trusted(_as_mapping(result))
+
+    async def stream_many_projected(
+        self,
+        fields: Collection[str],
+        filter_set: FilterSet | None = None,
+        *,
+        fetch_size: int | None = None,
+    ) -> AsyncIterator[AppModel]:
+        projection = self._model.projection(fields)
+        stmt = self._paginate(
+            self._select_many(filter_set, projection),
+        ).execution_options(yield_per=fetch_size or settings.STREAM_FETCH_SIZE)
+
+        async with self._conn.stream(stmt) as results:
+            async for result in results:
+                yield projection.from_trusted(_as_mapping(result))
 
     async def persist(self, model: Model) -> None:
-        stmt = insert(self._table).values(**model.model_dump())
+        stmt = insert(self._table).values(**model.model_dump()).returning(self._table)
         try:
-            await self._conn.execute(stmt)
+            result = (await self._conn.execute(stmt)).one()
         except IntegrityError:
             raise AlreadyExistsError(
                 f"{self.__class__.__name__} could not persist {model}: record with given PK already exists",
             )
+        _refresh(model, result)
+        self._map(model)
 
     async def persist_many(self, models: list[Model]) -> None:
-        stmt = insert(self._table).values([model.model_dump() for model in models])
+        stmt = (
+            insert(self._table)
+            .values([model.model_dump() for model in models])
+            .returning(self._table)
+        )
         try:
-            await self._conn.execute(stmt)
+            results = (await self._conn.execute(stmt)).all()
         except IntegrityError:
             raise AlreadyExistsError(
                 f"{self.__class__.__name__} could not persist {models}: one or more of the models already exists",
             )
+        # RETURNING does not guarantee the order of the inserted rows.
+        rows = {result.id: result for result in results}
+        for model in models:
+            _refresh(model, rows[model.id])
+            self._map(model)
+
+    async def bulk_persist(
+        self,
+        models: Iterable[Model],
+        *,
+        chunk_size: int | None = None,
+    ) -> int:
+        """
+        Insert models in chunks, with COPY when the connection runs on asyncpg.
+
+        Other drivers get one executemany INSERT per chunk. All COPY chunks run
+        in a single transaction, or a savepoint when the connection is already
+        in one, so a failed chunk leaves no rows behind. Inserted models are
+        not mapped, to keep memory use flat.
+
+        :raises AlreadyExistsError: if any of the models already exists
+        :return: number of inserted models
+        """
+        chunk_size = chunk_size or settings.BULK_INSERT_CHUNK_SIZE
+        if self._conn.dialect.driver != "asyncpg":
+            return await self._insert_chunks(models, chunk_size)
+
+        raw = await self._conn.get_raw_connection()
+        driver = raw.driver_connection
+
+        if not raw.dbapi_connection.autocommit and not driver.is_in_transaction():
+            # SQLAlchemy only sends BEGIN with the first statement, COPY must
+            # not run ahead of it outside the transaction.
+            await self._conn.execute(select(1))
+
+        columns = [
+            (column.name, column.type.bind_processor(self._conn.dialect))
+            for column in self._table.c
+            if column.name in self._model.model_fields
+        ]
+        count = 0
+        try:
+            async with driver.transaction():
+                for chunk in _chunked(models, chunk_size):
+                    await driver.copy_records_to_table(
+                        self._table.name,
+                        records=[_to_record(model, columns) for model in chunk],
+                        columns=[name for name, _ in columns],
+                    )
+                    count += len(chunk)
+        except IntegrityConstraintViolationError:
+            raise AlreadyExistsError(
+                f"{self.__class__.__name__} could not bulk persist models: one or more of the models already exists",
+            )
+        return count
 
     async def update(
         self,
@@ -70,31 +234,257 @@ class SQLAlchemyRepository(Generic[PK, Model], BaseRepository[PK, Model], ABC):
         :param model: The model instance to update in the database.
         :param fields_to_update: An optional list of field names to update.
             If specified, only the given fields will be updated in the database.
-            If not specified, all fields except for 'id', 'created_at', and 'updated_at'
-            will be updated in the database.
+            If not specified, only the fields changed since the model was loaded
+            or last saved are updated, and no statement is issued when nothing
+            changed.
+
+        The model is refreshed from the updated row, including values set by
+        the database such as 'updated_at'.
 
-        Note: This method ignores the 'created_at' and 'updated_at' fields as these fields are
-        automatically set by the database.
+        Note: This method never writes the 'id', 'created_at' and 'updated_at'
+        fields, the timestamps are set by the database.
         """
         if fields_to_update:
-            update_data = {
-                field: getattr(model, field)
-                for field in fields_to_update
-                if field not in {"created_at", "updated_at"}
-            }
+            fields = set(fields_to_update)
         else:
-            update_data = model.model_dump(exclude={"id", "created_at", "updated_at"})
+            fields = set(model.changed_fields)
+        fields -= {"id", "created_at", "updated_at"}
+        if not fields:
+            return
 
+        # Keep a stable column order so equivalent updates share a cached statement.
+        update_data = {
+            field: getattr(model, field)
+            for field in model.model_fields
+            if field in fields
+        }
         stmt = (
             update(self._table)
             .where(self._table.c.id == model.id)
             .values(**update_data)
+            .returning(self._table)
         )
-        await self._conn.execute(stmt)
+        result = (await self._conn.execute(stmt)).first()
+        if result is None:
+            return
+
+        # Changes left out with ``fields_to_update`` are kept as they are.
+        _refresh(model, result, keep=model.changed_fields - fields)
+        self._map(model)
+
+    async def update_many(self, filter_set: FilterSet, values: dict[str, Any]) -> int:
+        invalid = values.keys() - (
+            self._model.model_fields.keys() - {"id", "created_at", "updated_at"}
+        )
+        if not values or invalid:
+            raise ValueError(
+                f"{self.__class__.__name__} cannot update fields: {sorted(invalid) or 'none given'}",
+            )
+
+        stmt = (
+            update(self._table)
+            .where(
+                *self._get_filter_expressions(filter_set),
+                *self._get_visibility_criteria(),
+            )
+            .values(**values)
+        )
+        result: CursorResult = await self._conn.execute(stmt)
+        self._forget_all()
+        return result.rowcount
+
+    async def delete_many(self, filter_set: FilterSet) -> int:
+        if filter_set.is_empty():
+            raise ValueError(
+                f"{self.__class__.__name__} refuses to delete every row, pass a filter",
+            )
+
+        stmt = delete(self._table).where(
+            *self._get_filter_expressions(filter_set),
+            *self._get_visibility_criteria(),
+        )
+        result: CursorResult = await self._conn.execute(stmt)
+        self._forget_all()
+        return result.rowcount
 
     async def delete(self, model: Model) -> None:
         stmt = delete(self._table).where(self._table.c.id == model.id)
         await self._conn.execute(stmt)
+        self._forget(model.id)
+
+    async def _insert_chunks(self, models: Iterable[Model], chunk_size: int) -> int:
+        count = 0
+        for chunk in _chunked(models, chunk_size):
+            try:
+                await self._conn.execute(
+                    insert(self._table),
+                    [model.model_dump() for model in chunk],
+                )
+            except IntegrityError:
+                raise AlreadyExistsError(
+                    f"{self.__class__.__name__} could not bulk persist models: "
+                    "one or more of the models already exists",
+                )
+            count += len(chunk)
+        return count
+
+    async def _get_by_ids(self, pks: list[PK]) -> dict[PK, Model]:
+        models = {}
+        missing = []
+        for pk in dict.fromkeys(pks):
+            mapped = self._get_mapped(pk)
+            if mapped is None:
+                missing.append(pk)
+            else:
+                models[pk] = mapped
+
+        if missing:
+            for result in await self._fetch_by_ids(missing):
+                model = self._load(result)
+                models[model.id] = model
+        return models
+
+    async def _fetch_by_ids(self, pks: list[PK]) -> Iterable[Row]:
+        stmt = self._get_statement("get_by_ids", self._select_by_ids)
+        return await self._conn.execute(stmt, {"ids": pks})
+
+    def _select_by_ids(self) -> Select:
+        # A single array parameter keeps one prepared statement for any
+        # number of keys.
+        ids = bindparam("ids", type_=ARRAY(self._table.c.id.type))
+        return select(self._table).where(
+            self._table.c.id == any_(ids),
+            *self._get_visibility_criteria(),
+        )
+
+    def _get_statement(self, name: str, build: Callable[[], Executable]) -> Executable:
+        """
+        Get the statement cached under ``name`` for this repository class.
+
+        The statement is built with ``build`` on first use. Cached statements
+        take their values as bound parameters at execution. Reusing the same
+        construct lets SQLAlchemy skip building the statement and its cache key,
+        and keeps the SQL text identical, so asyncpg reuses the statement it
+        prepared on the connection.
+
+        :return: the cached statement
+        """
+        key = (type(self), name)
+        stmt = _statements.get(key)
+        if stmt is None:
+            stmt = build()
+            _statements[key] = stmt
+        return stmt
+
+    def _load(self, row: Row | Mapping[str, Any] | Record) -> Model:
+        """
+        Build a model from a loaded row.
+
+        If the row is already mapped on this connection, the mapped model is
+        returned instead.
+
+        :return: the model for the row
+        """
+        values = _as_mapping(row) if isinstance(row, Row) else row
+        mapped = self._get_mapped(values["id"])
+        if mapped is not None:
+            return mapped
+
+        model = self._model.from_trusted(values)
+        if self._identity_map is not None:
+            self._identity_map.add(self._table, model.id, model)
+        return model
+
+    def _get_mapped(self, pk: PK) -> Model | None:
+        if self._identity_map is None:
+            return None
+        return cast("Model | None", self._identity_map.get(self._table, pk))
+
+    def _map(self, model: Model) -> None:
+        if self._identity_map is not None:
+            self._identity_map.set(self._table, model.id, model)
+
+    def _forget(self, *pks: PK) -> None:
+        """
+        Drop mapped models of rows changed by a statement that bypassed them.
+
+        The rows are then loaded again when needed.
+        """
+        if self._identity_map is None:
+            return
+        for pk in pks:
+            self._identity_map.remove(self._table, pk)
+
+    def _forget_all(self) -> None:
+        if self._identity_map is not None:
+            self._identity_map.remove_all(self._table)
+
+    def _get_visibility_criteria(self) -> list[ColumnElement[bool]]:
+        """
+        Criteria every row must meet to be returned by this repository.
+
+        Tables with soft-deleted rows, or rows of soft-deleted users, override
+        this to hide them. The criteria must not depend on the call, as they are
+        part of cached statements.
+
+        :return: criteria to add to every statement reading or changing rows
+        """
+        return []
+
+    def _select_many(
+        self,
+        filter_set: FilterSet | None = None,
+        projection: Type[AppModel] | None = None,
+    ) -> Select:
+        """
+        Select the visible rows matching ``filter_set``.
+
+        Only the columns of ``projection`` are selected when it is given.
+        Projected models are never mapped, as they do not hold whole rows.
+
+        :return: the select statement
+        """
+        if projection is None:
+            stmt = select(self._table)
+        else:
+            stmt = select(*(self._table.c[name] for name in projection.model_fields))
+        return stmt.where(
+            *self._get_filter_expressions(filter_set),
+            *self._get_visibility_criteria(),
+        )
+
+    def _get_filter_expressions(
+        self,
+        filter_set: FilterSet | None = None,
+    ) -> list[ColumnElement[bool]]:
+        if not filter_set:
+            return []
+
+        return filter_set.get_expressions(self._table)
+
+    def _paginate(
+        self,
+        stmt: Select,
+        limit: int | None = None,
+        after: Cursor | None = None,
+    ) -> Select:
+        """
+        Apply keyset pagination over (created_at, id) to a select statement.
+
+        Ordering by both columns keeps pages stable for rows created at the same
+        time, and is served by the (created_at, id) index of each table.
+
+        :return: the paginated statement
+        """
+        order_by = (self._table.c.created_at, self._table.c.id)
+        if after is not None:
+            stmt = stmt.where(tuple_(*order_by) > tuple_(after.created_at, after.id))
+
+        stmt = stmt.order_by(*order_by)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        return stmt
 
     @property
     @abstractmethod
@@ -105,3 +495,38 @@ class SQLAlchemyRepository(Generic[PK, Model], BaseRepository[PK, Model], ABC):
     @abstractmethod
     def _table(self) -> Table:
         raise NotImplementedError
+
+
+def _chunked(models: Iterable[Model], size: int) -> Iterator[list[Model]]:
+    iterator = iter(models)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _to_record(
+    model: AppModel,
+    columns: list[tuple[str, Callable[[Any], Any] | None]],
+) -> tuple[Any, ...]:
+    values = model.__dict__
+    return tuple(
+        values[name] if process is None else process(values[name])
+        for name, process in columns
+    )
+
+
+def _refresh(model: AppModel, row: Row, keep: frozenset[str] = frozenset()) -> None:
+    """Overwrite the model's fields, except ``keep``, with a row from the database."""
+    mapping = _as_mapping(row)
+    refreshed = {field for field in model.model_fields if field not in keep}
+    for field in refreshed & mapping.keys():
+        setattr(model, field, mapping[field])
+    model.mark_clean(refreshed)
+
+
+def _as_mapping(row: Row) -> RowMapping:
+    # ``Row._mapping`` is public API, prefixed only so that it cannot clash with
+    # column names.
+    return row._mapping  # noqa: WPS437
@@ -1,7 +1,8 @@
 import uuid
+from datetime import datetime
 from typing import Type
 
-from sqlalchemy import Table, select
+from sqlalchemy import ColumnElement, Table, bindparam, delete, select, update
 
 from src.core.interfaces.repositories.user import (
     UserRepository as AbstractUserRepository,
@@ -16,12 +17,40 @@ class UserRepository(
     AbstractUserRepository,
 ):
     async def get_by_email(self, email: str) -> User | None:
-        stmt = select(self._table).where(self._table.c.email == email).limit(1)
-        result = (await self._conn.execute(stmt)).first()
+        stmt = self._get_statement(
+            "get_by_email",
+            lambda: select(self._table)
+            .where(
+                self._table.c.email == bindparam("email"),
+                *self._get_visibility_criteria(),
+            )
+            .limit(1),
+        )
+        result = (await self._conn.execute(stmt, {"email": email})).first()
         if not result:
             return None
 
-        return self._model.model_validate(result)
+        return self._load(result)
+
+    async def mark_deleting(self, user_id: uuid.UUID) -> None:
+        stmt = (
+            update(self._table)
+            .where(self._table.c.id == user_id)
+            .values(deleting_at=datetime.now())
+        )
+        await self._conn.execute(stmt)
+        self._forget(user_id)
+
+    async def purge(self, user_id: uuid.UUID) -> None:
+        stmt = delete(self._table).where(
+            self._table.c.id == user_id,
+            self._table.c.deleting_at.is_not(None),
+        )
+        await self._conn.execute(stmt)
+        self._forget(user_id)
+
+    def _get_visibility_criteria(self) -> list[ColumnElement[bool]]:
+        return [self._table.c.deleting_at.is_(None)]
 
     @property
     def _table(self) -> Table:
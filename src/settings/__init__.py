@@ -1,6 +1,7 @@
 from pydantic_settings import SettingsConfigDict
 
 from src.settings.application import AppSettings
+from src.settings.auth import AuthSettings
 from src.settings.celery import CelerySettings
 from src.settings.database import DatabaseSettings
 from src.settings.email import EmailSettings
@@ -9,6 +10,7 @@ from src.settings.jwt import JWTSettings
 
 class Settings(
     AppSettings,
+    AuthSettings,
     CelerySettings,
     JWTSettings,
     EmailSettings,
@@ -10,6 +10,7 @@ class AppSettings(BaseSettings):
     PORT: int = 8000
     WORKERS_COUNT: int = 1
     RELOAD: bool = False
+    OVERLOAD_RETRY_AFTER_SECONDS: int = 1
 
     BASE_DIR: Path = Path(__file__).parents[1]
     TEMPLATE_FOLDER: Path = BASE_DIR / "templates"
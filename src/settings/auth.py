@@ -0,0 +1,13 @@
+from pydantic_settings import BaseSettings
+
+
+class AuthSettings(BaseSettings):
+    PASSWORD_HASHING_WORKERS: int = 2
+    PASSWORD_HASHING_MAX_PENDING: int = 64
+
+    ACCESS_TOKEN_CACHE_SIZE: int = 10000
+    ACCESS_TOKEN_CACHE_TTL: float = 30
+
+    LOGIN_MAX_CONCURRENCY: int = 2
+    LOGIN_MAX_QUEUE: int = 32
+    LOGIN_QUEUE_TIMEOUT: float = 5
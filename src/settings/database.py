@@ -1,5 +1,9 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
+ReplicaSelection = Literal["round_robin", "least_connections"]
+
 
 class DatabaseSettings(BaseSettings):
     POSTGRES_HOST: str
@@ -8,13 +12,48 @@ class DatabaseSettings(BaseSettings):
     POSTGRES_PASSWORD: str
     POSTGRES_PORT: int
 
+    POSTGRES_POOL_SIZE: int = 5
+    POSTGRES_MAX_OVERFLOW: int = 10
+    POSTGRES_POOL_TIMEOUT: float = 30
+    POSTGRES_POOL_RECYCLE: int = 1800
+    POSTGRES_POOL_PRE_PING: bool = False
+    POSTGRES_STATEMENT_CACHE_SIZE: int = 100
+    POSTGRES_RAW_QUERIES: bool = False
+
+    POSTGRES_REPLICA_HOSTS: list[str] = []
+    POSTGRES_REPLICA_SELECTION: ReplicaSelection = "round_robin"
+    POSTGRES_REPLICA_HEALTH_CHECK_INTERVAL: float = 5
+    POSTGRES_READ_YOUR_WRITES_WINDOW: float = 5
+    POSTGRES_READ_YOUR_WRITES_MAX_SESSIONS: int = 10000
+
+    STREAM_FETCH_SIZE: int = 1000
+    PURGE_BATCH_SIZE: int = 1000
+    BULK_INSERT_CHUNK_SIZE: int = 10000
+
     TESTING: bool = False
 
     @property
     def postgres_url(self) -> str:
+        return self._build_postgres_url(f"{self.POSTGRES_HOST}:{self.POSTGRES_PORT}")
+
+    @property
+    def postgres_replica_urls(self) -> list[str]:
+        """
+        Replica URLs, using ``POSTGRES_PORT`` for hosts without an explicit port.
+
+        :return: one database URL per replica host
+        """
+        return [
+            self._build_postgres_url(
+                host if ":" in host else f"{host}:{self.POSTGRES_PORT}",
+            )
+            for host in self.POSTGRES_REPLICA_HOSTS
+        ]
+
+    def _build_postgres_url(self, address: str) -> str:
         database_name = "test" if self.TESTING else self.POSTGRES_DATABASE
         driver = "postgresql+asyncpg"
         return (
             f"{driver}://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@"
-            f"{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{database_name}"
+            f"{address}/{database_name}"
         )
@@ -3,12 +3,16 @@ from typing import Annotated
 from fastapi import Depends
 
 from src.core.models.user import User as _User
+from src.core.pagination import Pagination as _Pagination
 from src.core.services.auth import AuthService as _AuthService
 from src.core.services.group import GroupService as _GroupService
+from src.core.services.purge import PurgeService as _PurgeService
 from src.core.services.user import UserService as _UserService
 from src.web.api.v1.dependencies import (
     get_auth_service,
     get_group_service,
+    get_pagination,
+    get_purge_service,
     get_user,
     get_user_service,
     oauth2_scheme,
@@ -18,4 +22,6 @@ AccessToken = Annotated[str, Depends(oauth2_scheme)]
 UserService = Annotated[_UserService, Depends(get_user_service)]
 AuthService = Annotated[_AuthService, Depends(get_auth_service)]
 GroupService = Annotated[_GroupService, Depends(get_group_service)]
+PurgeService = Annotated[_PurgeService, Depends(get_purge_service)]
 User = Annotated[_User, Depends(get_user)]
+Pagination = Annotated[_Pagination, Depends(get_pagination)]
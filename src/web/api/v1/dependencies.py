@@ -1,8 +1,15 @@
-from fastapi import Depends
+import hashlib
+from contextvars import ContextVar
+from typing import AsyncGenerator
+
+from fastapi import Depends, Query, Request
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.ext.asyncio import AsyncConnection
 
+from src.constants import constants
+from src.core.admission import login_admission
+from src.core.cache import TTLCache, access_token_cache
 from src.core.interfaces.email import EmailSender as IEmailSender
+from src.core.interfaces.purge import PurgeScheduler as IPurgeScheduler
 from src.core.interfaces.repositories.group import (
     GroupMemberRepository as IGroupMemberRepository,
 )
@@ -10,62 +17,173 @@ from src.core.interfaces.repositories.group import GroupRepository as IGroupRepo
 from src.core.interfaces.repositories.group import (
     GroupRequestRepository as IGroupRequestRepository,
 )
+from src.core.interfaces.repositories.purge import (
+    PurgeJobRepository as IPurgeJobRepository,
+)
 from src.core.interfaces.repositories.user import UserRepository as IUserRepository
+from src.core.interfaces.transaction import CommitHooks
 from src.core.models.user import User
+from src.core.pagination import Pagination
 from src.core.services.auth import AuthService
 from src.core.services.group import GroupService
+from src.core.services.purge import PurgeService
 from src.core.services.user import UserService
-from src.infrastructure.database.connection import get_db
+from src.infrastructure.database.connection import RequestConnection, engine_router
 from src.infrastructure.email import CeleryEmailSender
+from src.infrastructure.purge import CeleryPurgeScheduler
 from src.infrastructure.repositories.group import (
     GroupMemberRepository,
     GroupRepository,
     GroupRequestRepository,
 )
+from src.infrastructure.repositories.purge import PurgeJobRepository
+from src.infrastructure.repositories.raw import (
+    RawGroupMemberRepository,
+    RawUserRepository,
+)
 from src.infrastructure.repositories.user import UserRepository
+from src.settings import settings
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="v1/auth/login/")
 
+READ_ONLY_METHODS = frozenset(("GET", "HEAD", "OPTIONS"))
+
+request_connection: ContextVar[RequestConnection | None] = ContextVar(
+    "request_connection",
+    default=None,
+)
+
+recent_writes: TTLCache[str, bool] = TTLCache(
+    maxsize=settings.POSTGRES_READ_YOUR_WRITES_MAX_SESSIONS,
+    ttl=settings.POSTGRES_READ_YOUR_WRITES_WINDOW,
+)
+
+
+def _get_session_key(request: Request) -> str:
+    authorization = request.headers.get("Authorization")
+    if authorization is None:
+        authorization = request.client.host if request.client else ""
+    return hashlib.sha256(authorization.encode()).hexdigest()
+
+
+async def get_db(request: Request) -> AsyncGenerator[RequestConnection, None]:
+    """
+    Get the request's database connection.
+
+    Reads go to a replica unless the same session committed a write within
+    the read-your-writes window, in which case they stay on the primary.
+
+    :yields: the request's connection
+    :raises Exception: whatever the endpoint raised, once the transaction is
+        rolled back
+    """
+    session_key = _get_session_key(request)
+    if request.method not in READ_ONLY_METHODS:
+        conn = RequestConnection(
+            engine_router.primary,
+            on_commit=lambda: recent_writes.set(session_key, value=True),
+        )
+    elif recent_writes.get(session_key):
+        conn = RequestConnection(engine_router.primary, read_only=True)
+    else:
+        conn = RequestConnection(engine_router.reader(), read_only=True)
+
+    request_connection.set(conn)
+    try:
+        yield conn
+    except Exception:
+        await conn.release(commit=False)
+        raise
+    await conn.release()
+
 
 def get_user_repository(
-    conn: AsyncConnection = Depends(get_db),
+    conn: RequestConnection = Depends(get_db),
 ) -> IUserRepository:
+    if settings.POSTGRES_RAW_QUERIES:
+        return RawUserRepository(conn)
     return UserRepository(conn)
 
 
 def get_group_repository(
-    conn: AsyncConnection = Depends(get_db),
+    conn: RequestConnection = Depends(get_db),
 ) -> IGroupRepository:
     return GroupRepository(conn)
 
 
 def get_group_member_repository(
-    conn: AsyncConnection = Depends(get_db),
+    conn: RequestConnection = Depends(get_db),
 ) -> IGroupMemberRepository:
+    if settings.POSTGRES_RAW_QUERIES:
+        return RawGroupMemberRepository(conn)
     return GroupMemberRepository(conn)
 
 
 def get_group_request_repository(
-    conn: AsyncConnection = Depends(get_db),
+    conn: RequestConnection = Depends(get_db),
 ) -> IGroupRequestRepository:
     return GroupRequestRepository(conn)
 
 
+def get_purge_job_repository(
+    conn: RequestConnection = Depends(get_db),
+) -> IPurgeJobRepository:
+    return PurgeJobRepository(conn)
+
+
+def get_pagination(
+    limit: int = Query(
+        default=constants.DEFAULT_PAGE_SIZE,
+        ge=1,
+        le=constants.MAX_PAGE_SIZE,
+    ),
+    cursor: str | None = Query(default=None),
+) -> Pagination:
+    return Pagination(limit=limit, cursor=cursor)
+
+
+def get_commit_hooks(conn: RequestConnection = Depends(get_db)) -> CommitHooks:
+    return conn
+
+
 def get_email_sender() -> IEmailSender:
     return CeleryEmailSender()
 
 
+def get_purge_scheduler(
+    conn: RequestConnection = Depends(get_db),
+) -> IPurgeScheduler:
+    return CeleryPurgeScheduler(conn)
+
+
+def get_purge_service(
+    purge_job_repository: IPurgeJobRepository = Depends(get_purge_job_repository),
+    purge_scheduler: IPurgeScheduler = Depends(get_purge_scheduler),
+) -> PurgeService:
+    return PurgeService(purge_job_repository, purge_scheduler)
+
+
 def get_user_service(
     user_repository: IUserRepository = Depends(get_user_repository),
+    group_repository: IGroupRepository = Depends(get_group_repository),
     email_sender: IEmailSender = Depends(get_email_sender),
+    purge_service: PurgeService = Depends(get_purge_service),
+    commit_hooks: CommitHooks = Depends(get_commit_hooks),
 ) -> UserService:
-    return UserService(user_repository, email_sender)
+    return UserService(
+        user_repository,
+        group_repository,
+        email_sender,
+        purge_service,
+        access_token_cache,
+        commit_hooks,
+    )
 
 
 def get_auth_service(
     user_repository: IUserRepository = Depends(get_user_repository),
 ) -> AuthService:
-    return AuthService(user_repository)
+    return AuthService(user_repository, access_token_cache, login_admission)
 
 
 def get_group_service(
@@ -76,11 +194,13 @@ def get_group_service(
     group_request_repository: IGroupRequestRepository = Depends(
         get_group_request_repository,
     ),
+    purge_service: PurgeService = Depends(get_purge_service),
 ) -> GroupService:
     return GroupService(
         group_repository,
         group_member_repository,
         group_request_repository,
+        purge_service,
     )
 
 
@@ -0,0 +1,24 @@
+from typing import Any
+
+from fastapi import Response
+
+from src.core.pagination import Page
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def paginated_response(response: Response, page: Page[Any]) -> list[Any]:
+    """
+    Expose the cursor of the next page in a response header.
+
+    Keeping the cursor out of the body lets list endpoints keep returning
+    plain JSON arrays.
+
+    :param response: response of the list endpoint
+    :param page: page returned by the service
+    :return: items of the page
+    """
+    if page.next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+
+    return page.items
@@ -4,8 +4,9 @@ from fastapi.security import OAuth2PasswordRequestForm
 
 from src.core.schemas.auth import AccessToken, UserCredentials
 from src.web.api.v1.annotations import AuthService
+from src.web.api.v1.routing import RequestConnectionRoute
 
-auth_router = APIRouter(prefix="/auth")
+auth_router = APIRouter(prefix="/auth", route_class=RequestConnectionRoute)
 
 
 @auth_router.post(
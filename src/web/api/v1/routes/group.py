@@ -1,26 +1,33 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import Depends, status
+from fastapi import Depends, Response, status
 from fastapi.routing import APIRouter
 
 from src.core.filters.group import GroupInputFilters, GroupMemberInputFilters
 from src.core.schemas.group import (
+    BulkDeleteGroupMembersSchema,
+    BulkUpdateGroupRequestsSchema,
     CreateGroupRequestSchema,
     CreateGroupSchema,
     UpdateGroupMemberSchema,
     UpdateGroupRequestSchema,
     UpdateGroupSchema,
 )
-from src.web.api.v1.annotations import GroupService, User
+from src.web.api.v1.annotations import GroupService, Pagination, User
+from src.web.api.v1.pagination import paginated_response
+from src.web.api.v1.routing import RequestConnectionRoute
 from src.web.api.v1.schemas.base import IDOnlyOutputSchema
 from src.web.api.v1.schemas.group import (
     GroupMemberOutputSchema,
+    GroupMemberRemovalOutputSchema,
     GroupOutputSchema,
     GroupRequestOutputSchema,
+    GroupRequestReviewOutputSchema,
 )
+from src.web.api.v1.streaming import ndjson_response
 
-group_router = APIRouter(prefix="/groups")
+group_router = APIRouter(prefix="/groups", route_class=RequestConnectionRoute)
 
 
 @group_router.get(
@@ -30,11 +37,22 @@ group_router = APIRouter(prefix="/groups")
     response_model=list[GroupOutputSchema],
 )
 async def get_groups(
+    response: Response,
     request_user: User,
     group_service: GroupService,
     filters: Annotated[GroupInputFilters, Depends()],
+    pagination: Pagination,
+    stream: bool = False,
 ):
-    return await group_service.get_groups(filters)
+    fields = GroupOutputSchema.model_fields.keys()
+    if stream:
+        return ndjson_response(
+            group_service.stream_groups_projected(fields, filters),
+            GroupOutputSchema,
+        )
+
+    page = await group_service.get_groups_projected(fields, filters, pagination)
+    return paginated_response(response, page)
 
 
 @group_router.post(
@@ -58,10 +76,13 @@ async def create_group(
     response_model=list[GroupOutputSchema],
 )
 async def get_groups_for_user(
+    response: Response,
     request_user: User,
     group_service: GroupService,
+    pagination: Pagination,
 ):
-    return await group_service.get_groups_for_user(request_user.id)
+    page = await group_service.get_groups_for_user(request_user.id, pagination)
+    return paginated_response(response, page)
 
 
 @group_router.get(
@@ -71,10 +92,16 @@ async def get_groups_for_user(
     response_model=list[GroupRequestOutputSchema],
 )
 async def get_group_requests_for_user(
+    response: Response,
     request_user: User,
     group_service: GroupService,
+    pagination: Pagination,
 ):
-    return await group_service.get_group_requests_for_user(request_user.id)
+    page = await group_service.get_group_requests_for_user(
+        request_user.id,
+        pagination,
+    )
+    return paginated_response(response, page)
 
 
 @group_router.get(
@@ -95,7 +122,7 @@ async def get_group(
     "/{group_id}/",
     tags=["groups"],
     status_code=status.HTTP_200_OK,
-    response_model=IDOnlyOutputSchema,
+    response_model=GroupOutputSchema,
 )
 async def update_group(
     group_id: UUID,
@@ -103,8 +130,7 @@ async def update_group(
     request_user: User,
     group_service: GroupService,
 ):
-    await group_service.update_group(request_user.id, group_id, schema)
-    return IDOnlyOutputSchema(id=group_id)
+    return await group_service.update_group(request_user.id, group_id, schema)
 
 
 @group_router.delete(
@@ -128,11 +154,51 @@ async def delete_group(
 )
 async def get_group_members(
     group_id: UUID,
+    response: Response,
     request_user: User,
     group_service: GroupService,
     filters: Annotated[GroupMemberInputFilters, Depends()],
+    pagination: Pagination,
+    stream: bool = False,
 ):
-    return await group_service.get_group_members(request_user.id, group_id, filters)
+    if stream:
+        group_members = await group_service.stream_group_members(
+            request_user.id,
+            group_id,
+            filters,
+        )
+        return ndjson_response(group_members, GroupMemberOutputSchema)
+
+    page = await group_service.get_group_members(
+        request_user.id,
+        group_id,
+        filters,
+        pagination,
+    )
+    return paginated_response(response, page)
+
+
+@group_router.delete(
+    "/{group_id}/members/",
+    tags=["groups"],
+    status_code=status.HTTP_200_OK,
+    response_model=list[GroupMemberRemovalOutputSchema],
+)
+async def delete_group_members(
+    group_id: UUID,
+    schema: BulkDeleteGroupMembersSchema,
+    request_user: User,
+    group_service: GroupService,
+):
+    results = await group_service.delete_group_members(
+        request_user.id,
+        group_id,
+        schema,
+    )
+    return [
+        GroupMemberRemovalOutputSchema(id=member_id, result=result)
+        for member_id, result in results.items()
+    ]
 
 
 @group_router.get(
@@ -194,10 +260,17 @@ async def delete_group_member(
 )
 async def get_group_requests_for_group(
     group_id: UUID,
+    response: Response,
     request_user: User,
     group_service: GroupService,
+    pagination: Pagination,
 ):
-    return await group_service.get_group_requests_for_group(request_user.id, group_id)
+    page = await group_service.get_group_requests_for_group(
+        request_user.id,
+        group_id,
+        pagination,
+    )
+    return paginated_response(response, page)
 
 
 @group_router.post(
@@ -215,6 +288,29 @@ async def create_group_request(
     return await group_service.create_group_request(request_user.id, group_id, schema)
 
 
+@group_router.patch(
+    "/{group_id}/requests/",
+    tags=["groups"],
+    status_code=status.HTTP_200_OK,
+    response_model=list[GroupRequestReviewOutputSchema],
+)
+async def update_group_requests(
+    group_id: UUID,
+    schema: BulkUpdateGroupRequestsSchema,
+    request_user: User,
+    group_service: GroupService,
+):
+    results = await group_service.update_group_requests(
+        request_user.id,
+        group_id,
+        schema,
+    )
+    return [
+        GroupRequestReviewOutputSchema(id=request_id, result=result)
+        for request_id, result in results.items()
+    ]
+
+
 @group_router.get(
     "/{group_id}/requests/{request_id}/",
     tags=["groups"],
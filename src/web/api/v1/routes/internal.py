@@ -0,0 +1,51 @@
+from typing import Any
+from uuid import UUID
+
+from fastapi import status
+from fastapi.routing import APIRouter
+
+from src.core.admission import login_admission
+from src.core.cache import access_token_cache
+from src.core.exceptions import PermissionDeniedError
+from src.core.hashing import password_hasher
+from src.infrastructure.database.connection import engine_router
+from src.web.api.v1.annotations import PurgeService, User
+from src.web.api.v1.routing import RequestConnectionRoute
+from src.web.api.v1.schemas.purge import PurgeJobOutputSchema
+
+internal_router = APIRouter(prefix="/internal", route_class=RequestConnectionRoute)
+
+
+@internal_router.get(
+    "/metrics/",
+    tags=["internal"],
+    status_code=status.HTTP_200_OK,
+)
+async def get_metrics(request_user: User) -> dict[str, Any]:
+    if not request_user.is_superuser:
+        raise PermissionDeniedError()
+
+    return {
+        "login_admission": login_admission.stats(),
+        "password_hashing": {"pending": password_hasher.pending},
+        "access_token_cache": access_token_cache.stats(),
+        "database_pool": engine_router.primary.pool.stats(),  # type: ignore
+        "database_replicas": engine_router.stats(),
+    }
+
+
+@internal_router.get(
+    "/purge-jobs/{job_id}/",
+    tags=["internal"],
+    status_code=status.HTTP_200_OK,
+    response_model=PurgeJobOutputSchema,
+)
+async def get_purge_job(
+    job_id: UUID,
+    request_user: User,
+    purge_service: PurgeService,
+):
+    if not request_user.is_superuser:
+        raise PermissionDeniedError()
+
+    return await purge_service.get_job(job_id)
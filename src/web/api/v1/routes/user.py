@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from fastapi import HTTPException, status
+from fastapi import HTTPException, Response, status
 from fastapi.routing import APIRouter
 
 from src.core.exceptions import (
@@ -10,15 +10,24 @@ from src.core.exceptions import (
     PermissionDeniedError,
 )
 from src.core.schemas.user import CreateUserSchema, UpdateUserSchema
-from src.web.api.v1.annotations import AccessToken, AuthService, User, UserService
+from src.web.api.v1.annotations import (
+    AccessToken,
+    AuthService,
+    Pagination,
+    User,
+    UserService,
+)
+from src.web.api.v1.pagination import paginated_response
+from src.web.api.v1.routing import RequestConnectionRoute
 from src.web.api.v1.schemas.base import IDOnlyOutputSchema
 from src.web.api.v1.schemas.user import (
     PasswordResetSchema,
     SendPasswordResetEmailSchema,
     UserOutputSchema,
 )
+from src.web.api.v1.streaming import ndjson_response
 
-user_router = APIRouter(prefix="/users")
+user_router = APIRouter(prefix="/users", route_class=RequestConnectionRoute)
 
 
 @user_router.get(
@@ -28,10 +37,22 @@ user_router = APIRouter(prefix="/users")
     response_model=list[UserOutputSchema],
 )
 async def get_users(
+    response: Response,
     request_user: User,
     user_service: UserService,
+    pagination: Pagination,
+    stream: bool = False,
 ):
-    return await user_service.get_users()
+    # Load only the columns the response shows, not hashes and tokens.
+    fields = UserOutputSchema.model_fields.keys()
+    if stream:
+        return ndjson_response(
+            user_service.stream_users_projected(fields),
+            UserOutputSchema,
+        )
+
+    page = await user_service.get_users_projected(fields, pagination)
+    return paginated_response(response, page)
 
 
 @user_router.post(
@@ -95,7 +116,7 @@ async def get_user(
     "/{user_id}/",
     tags=["users"],
     status_code=status.HTTP_200_OK,
-    response_model=IDOnlyOutputSchema,
+    response_model=UserOutputSchema,
 )
 async def update_user(
     user_id: UUID,
@@ -109,8 +130,7 @@ async def update_user(
     if user.id != user_id and not user.is_superuser:
         raise PermissionDeniedError()
 
-    await user_service.update_user(user, schema)
-    return user
+    return await user_service.update_user(user, schema)
 
 
 @user_router.delete(
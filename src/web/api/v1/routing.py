@@ -0,0 +1,33 @@
+import functools
+from typing import Any, Callable
+
+from fastapi.responses import StreamingResponse
+from fastapi.routing import APIRoute
+
+from src.web.api.v1.dependencies import request_connection
+
+
+class RequestConnectionRoute(APIRoute):
+    """
+    Route that releases the request's database connection early.
+
+    The connection goes back to the pool as soon as the endpoint returns,
+    before the response is serialized. Streaming responses keep their
+    connection until the body has been sent; it is released by the ``get_db``
+    teardown instead.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        super().__init__(path, _release_connection_on_return(endpoint), **kwargs)
+
+
+def _release_connection_on_return(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(endpoint)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        result = await endpoint(*args, **kwargs)
+        conn = request_connection.get()
+        if conn is not None and not isinstance(result, StreamingResponse):
+            await conn.release()
+        return result
+
+    return wrapper
@@ -1,6 +1,12 @@
 from uuid import UUID
 
-from src.core.enums.group import GroupRequestStatus
+from pydantic import BaseModel
+
+from src.core.enums.group import (
+    GroupRequestStatus,
+    RemoveGroupMemberResult,
+    ReviewGroupRequestResult,
+)
 from src.web.api.v1.schemas.base import BaseOutputSchema
 
 
@@ -24,3 +30,13 @@ class GroupRequestOutputSchema(BaseOutputSchema):
 
     message: str | None = None
     status: GroupRequestStatus
+
+
+class GroupRequestReviewOutputSchema(BaseModel):
+    id: UUID
+    result: ReviewGroupRequestResult
+
+
+class GroupMemberRemovalOutputSchema(BaseModel):
+    id: UUID
+    result: RemoveGroupMemberResult
@@ -0,0 +1,13 @@
+from datetime import datetime
+from uuid import UUID
+
+from src.core.enums.purge import PurgeEntity, PurgeStatus
+from src.web.api.v1.schemas.base import BaseOutputSchema
+
+
+class PurgeJobOutputSchema(BaseOutputSchema):
+    entity: PurgeEntity
+    entity_id: UUID
+    status: PurgeStatus
+    deleted_rows: int
+    finished_at: datetime | None = None
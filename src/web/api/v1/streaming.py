@@ -0,0 +1,53 @@
+from typing import AsyncIterator, Type
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from src.settings import settings
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def ndjson_response(
+    models: AsyncIterator[BaseModel],
+    schema: Type[BaseModel],
+    chunk_size: int = settings.STREAM_FETCH_SIZE,
+) -> StreamingResponse:
+    """
+    Stream models as newline-delimited JSON.
+
+    Models are serialized with the output ``schema`` as they arrive and sent in
+    chunks of ``chunk_size`` lines, so memory usage stays bounded no matter
+    how many rows the query returns.
+
+    :param models: models to serialize
+    :param schema: output schema used to serialize each model
+    :param chunk_size: number of lines sent in a single chunk
+    :return: streaming response
+    """
+    return StreamingResponse(
+        _serialize(models, schema, chunk_size),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
+
+
+async def _serialize(
+    models: AsyncIterator[BaseModel],
+    schema: Type[BaseModel],
+    chunk_size: int,
+) -> AsyncIterator[bytes]:
+    lines: list[str] = []
+    async for model in models:
+        lines.append(
+            schema.model_validate(model, from_attributes=True).model_dump_json(),
+        )
+        if len(lines) >= chunk_size:
+            yield _to_chunk(lines)
+            lines = []
+
+    if lines:
+        yield _to_chunk(lines)
+
+
+def _to_chunk(lines: list[str]) -> bytes:
+    return "".join(f"{line}\n" for line in lines).encode()
@@ -8,7 +8,11 @@ from src.core.exceptions import (
     InvalidAccessTokenError,
     InvalidCredentialsError,
     PermissionDeniedError,
+    ServiceOverloadedError,
 )
+from src.core.hashing import password_hasher
+from src.infrastructure.database.connection import engine_router
+from src.settings import settings
 from src.web.api.v1.router import api_router
 
 
@@ -86,6 +90,21 @@ def get_app() -> FastAPI:
             content={"detail": "Not found"},
         )
 
+    @app.exception_handler(ServiceOverloadedError)
+    async def service_overloaded_exception_handler(
+        request: Request,
+        exc: ServiceOverloadedError,
+    ):
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"detail": "Service temporarily overloaded"},
+            headers={"Retry-After": str(settings.OVERLOAD_RETRY_AFTER_SECONDS)},
+        )
+
+    app.add_event_handler("startup", engine_router.start_health_checks)
+    app.add_event_handler("shutdown", engine_router.stop_health_checks)
+    app.add_event_handler("shutdown", password_hasher.shutdown)
+
     app.include_router(router=api_router, prefix="/api")
 
     return app
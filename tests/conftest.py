@@ -7,31 +7,42 @@ from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
 from tests.fakes.database import FakeDatabase
 from tests.fakes.email import FakeEmailSender
+from tests.fakes.purge import FakePurgeScheduler
 from tests.fakes.repositories.group import (
     FakeGroupMemberRepository,
     FakeGroupRepository,
     FakeGroupRequestRepository,
 )
+from tests.fakes.repositories.purge import FakePurgeJobRepository
 from tests.fakes.repositories.user import FakeUserRepository
+from tests.fakes.transaction import FakeCommitHooks
 
+from src.core.cache import access_token_cache
 from src.core.interfaces.email import EmailSender
+from src.core.interfaces.purge import PurgeScheduler
 from src.core.interfaces.repositories.group import (
     GroupMemberRepository,
     GroupRepository,
     GroupRequestRepository,
 )
+from src.core.interfaces.repositories.purge import PurgeJobRepository
 from src.core.interfaces.repositories.user import UserRepository
+from src.core.interfaces.transaction import CommitHooks
 from src.core.services.auth import AuthService
 from src.core.services.group import GroupService
+from src.core.services.purge import PurgeService
 from src.core.services.user import UserService
 from src.infrastructure.database.metadata import metadata
 from src.infrastructure.database.tables import load_all_tables
 from src.settings import Settings
 from src.web.api.v1.dependencies import (
+    get_commit_hooks,
     get_email_sender,
     get_group_member_repository,
     get_group_repository,
     get_group_request_repository,
+    get_purge_job_repository,
+    get_purge_scheduler,
     get_user_repository,
 )
 from src.web.application import get_app
@@ -80,12 +91,32 @@ def user_repository(fake_db: FakeDatabase) -> UserRepository:
     return FakeUserRepository(fake_db)
 
 
+@pytest.fixture
+def purge_job_repository(fake_db: FakeDatabase) -> PurgeJobRepository:
+    return FakePurgeJobRepository(fake_db)
+
+
+@pytest.fixture
+def purge_scheduler() -> PurgeScheduler:
+    return FakePurgeScheduler()
+
+
+@pytest.fixture
+def purge_service(
+    purge_job_repository: PurgeJobRepository,
+    purge_scheduler: PurgeScheduler,
+) -> PurgeService:
+    return PurgeService(purge_job_repository, purge_scheduler)
+
+
 @pytest.fixture
 def user_service(
     user_repository: UserRepository,
+    group_repository: GroupRepository,
     email_sender: EmailSender,
+    purge_service: PurgeService,
 ) -> UserService:
-    return UserService(user_repository, email_sender)
+    return UserService(user_repository, group_repository, email_sender, purge_service)
 
 
 @pytest.fixture
@@ -115,11 +146,13 @@ def group_service(
     group_repository: GroupRepository,
     group_member_repository: GroupMemberRepository,
     group_request_repository: GroupRequestRepository,
+    purge_service: PurgeService,
 ) -> GroupService:
     return GroupService(
         group_repository,
         group_member_repository,
         group_request_repository,
+        purge_service,
     )
 
 
@@ -128,6 +161,11 @@ def email_sender() -> EmailSender:
     return FakeEmailSender()
 
 
+@pytest.fixture
+def commit_hooks() -> CommitHooks:
+    return FakeCommitHooks()
+
+
 @pytest.fixture
 def fastapi_app(
     email_sender: EmailSender,
@@ -135,7 +173,12 @@ def fastapi_app(
     group_repository: GroupRepository,
     group_member_repository: GroupMemberRepository,
     group_request_repository: GroupRequestRepository,
+    purge_job_repository: PurgeJobRepository,
+    purge_scheduler: PurgeScheduler,
+    commit_hooks: CommitHooks,
 ) -> FastAPI:
+    access_token_cache.clear()
+
     app = get_app()
     app.dependency_overrides[get_user_repository] = lambda: user_repository
     app.dependency_overrides[get_email_sender] = lambda: email_sender
@@ -146,6 +189,9 @@ def fastapi_app(
     app.dependency_overrides[
         get_group_request_repository
     ] = lambda: group_request_repository
+    app.dependency_overrides[get_purge_job_repository] = lambda: purge_job_repository
+    app.dependency_overrides[get_purge_scheduler] = lambda: purge_scheduler
+    app.dependency_overrides[get_commit_hooks] = lambda: commit_hooks
 
     return app  # noqa: WPS331
 
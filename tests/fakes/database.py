@@ -1,6 +1,7 @@
 from uuid import UUID
 
 from src.core.models.group import Group, GroupMember, GroupRequest
+from src.core.models.purge import PurgeJob
 from src.core.models.user import User
 
 
@@ -10,3 +11,8 @@ class FakeDatabase:
         self.groups: dict[UUID, Group] = {}
         self.group_members: dict[UUID, GroupMember] = {}
         self.group_requests: dict[UUID, GroupRequest] = {}
+        self.purge_jobs: dict[UUID, PurgeJob] = {}
+
+        # Users and groups marked as being deleted, by primary key, kept out of
+        # their tables until they are purged.
+        self.deleting: dict[UUID, User | Group] = {}
@@ -0,0 +1,10 @@
+from src.core.interfaces.purge import PurgeScheduler
+from src.core.models.purge import PurgeJob
+
+
+class FakePurgeScheduler(PurgeScheduler):
+    def __init__(self) -> None:
+        self.scheduled: list[PurgeJob] = []
+
+    def schedule(self, job: PurgeJob) -> None:
+        self.scheduled.append(job)
@@ -0,0 +1,77 @@
+from typing import Any, Collection, Iterable, TypeVar
+
+from src.core.filters.base import FilterSet
+from src.core.models.base import AppModel
+from src.core.pagination import Cursor
+
+Model = TypeVar("Model", bound=AppModel)
+
+
+def paginate(
+    models: Iterable[Model],
+    limit: int | None = None,
+    after: Cursor | None = None,
+) -> list[Model]:
+    ordered = sorted(models, key=lambda model: (model.created_at, model.id))
+    if after is not None:
+        ordered = [
+            model
+            for model in ordered
+            if (model.created_at, model.id) > (after.created_at, after.id)
+        ]
+
+    if limit is not None:
+        ordered = ordered[:limit]
+
+    return ordered
+
+
+def project(
+    models: Iterable[Model],
+    model_class: type[Model],
+    fields: Collection[str],
+) -> list[AppModel]:
+    projection = model_class.projection(fields)
+    return [projection.from_trusted(model.model_dump()) for model in models]
+
+
+def update_matching(
+    models: Iterable[Model],
+    model_class: type[Model],
+    filter_set: FilterSet,
+    values: dict[str, Any],
+) -> int:
+    """
+    Mirror ``update_many`` of the SQLAlchemy repositories.
+
+    Rows marked as being deleted are kept apart in ``FakeDatabase``, so
+    ``models`` must only hold the visible ones, as the real visibility
+    criteria would.
+
+    :raises ValueError: if ``values`` is empty or has an unknown field
+    :return: number of updated models
+    """
+    invalid = values.keys() - (
+        model_class.model_fields.keys() - {"id", "created_at", "updated_at"}
+    )
+    if not values or invalid:
+        raise ValueError(f"Cannot update fields: {sorted(invalid) or 'none given'}")
+
+    count = 0
+    for model in models:
+        if filter_set.matches(model):
+            for field, value in values.items():
+                setattr(model, field, value)
+            model.mark_clean(set(values))
+            count += 1
+    return count
+
+
+def delete_matching(models: dict[Any, Model], filter_set: FilterSet) -> int:
+    if filter_set.is_empty():
+        raise ValueError("Refusing to delete every row")
+
+    matching = [pk for pk, model in models.items() if filter_set.matches(model)]
+    for pk in matching:
+        del models[pk]
+    return len(matching)
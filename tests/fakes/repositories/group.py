@@ -1,8 +1,20 @@
+from typing import Any, AsyncIterator, Callable, Collection, Iterable, TypeVar
 from uuid import UUID
 
 from tests.fakes.database import FakeDatabase
+from tests.fakes.repositories.base import (
+    delete_matching,
+    paginate,
+    project,
+    update_matching,
+)
 
-from src.core.enums.group import GroupRequestStatus
+from src.core.enums.group import (
+    GroupRequestStatus,
+    JoinGroupResult,
+    RemoveGroupMemberResult,
+    ReviewGroupRequestResult,
+)
 from src.core.exceptions import AlreadyExistsError, DoesNotExistError
 from src.core.filters.group import FilterSet
 from src.core.interfaces.repositories.group import (
@@ -10,7 +22,11 @@ from src.core.interfaces.repositories.group import (
     GroupRepository,
     GroupRequestRepository,
 )
+from src.core.models.base import AppModel
 from src.core.models.group import Group, GroupMember, GroupRequest
+from src.core.pagination import Cursor
+
+Model = TypeVar("Model", GroupMember, GroupRequest)
 
 
 class FakeGroupRepository(GroupRepository):
@@ -23,24 +39,83 @@ class FakeGroupRepository(GroupRepository):
         except KeyError:
             raise DoesNotExistError("Group does not exist")
 
-    async def get_many(self, filter_set: FilterSet | None = None) -> list[Group]:
+    async def get_many_by_ids(self, pks: list[UUID]) -> list[Group]:
+        return [self.db.groups[pk] for pk in pks if pk in self.db.groups]
+
+    async def get_many(
+        self,
+        filter_set: FilterSet | None = None,
+        *,
+        limit: int | None = None,
+        after: Cursor | None = None,
+    ) -> list[Group]:
         groups = list(self.db.groups.values())
 
         if filter_set:
-            filters = filter_set.get_filters()
-            groups = [
-                group for group in groups if all(filter_(group) for filter_ in filters)
-            ]
+            groups = [group for group in groups if filter_set.matches(group)]
 
-        return groups
+        return paginate(groups, limit, after)
 
-    async def get_many_for_user(self, user_id: UUID) -> list[Group]:
+    async def get_many_for_user(
+        self,
+        user_id: UUID,
+        *,
+        limit: int | None = None,
+        after: Cursor | None = None,
+    ) -> list[Group]:
         memberships = [
             member
             for member in self.db.group_members.values()
             if member.user_id == user_id
         ]
-        return [self.db.groups[member.group_id] for member in memberships]
+        groups = [self.db.groups[member.group_id] for member in memberships]
+        return paginate(groups, limit, after)
+
+    async def get_with_membership(
+        self,
+        group_id: UUID,
+        user_id: UUID,
+    ) -> tuple[Group, GroupMember | None]:
+        try:
+            group = self.db.groups[group_id]
+        except KeyError:
+            raise DoesNotExistError("Group does not exist")
+
+        for group_member in self.db.group_members.values():
+            if group_member.user_id == user_id and group_member.group_id == group_id:
+                return group, group_member
+
+        return group, None
+
+    async def stream_many(
+        self,
+        filter_set: FilterSet | None = None,
+        *,
+        fetch_size: int | None = None,
+    ) -> AsyncIterator[Group]:
+        for model in await self.get_many(filter_set):
+            yield model
+
+    async def get_many_projected(
+        self,
+        fields: Collection[str],
+        filter_set: FilterSet | None = None,
+        *,
+        limit: int | None = None,
+        after: Cursor | None = None,
+    ) -> list[AppModel]:
+        models = await self.get_many(filter_set, limit=limit, after=after)
+        return project(models, self._model, fields)
+
+    async def stream_many_projected(
+        self,
+        fields: Collection[str],
+        filter_set: FilterSet | None = None,
+        *,
+        fetch_size: int | None = None,
+    ) -> AsyncIterator[AppModel]:
+        for model in await self.get_many_projected(fields, filter_set):
+            yield model
 
     async def persist(self, group: Group) -> None:
         if group.id in self.db.groups:
@@ -53,6 +128,16 @@ class FakeGroupRepository(GroupRepository):
                 raise AlreadyExistsError("Group already exists")
             self.db.groups[group.id] = group
 
+    async def bulk_persist(
+        self,
+        groups: Iterable[Group],
+        *,
+        chunk_size: int | None = None,
+    ) -> int:
+        groups = list(groups)
+        await self.persist_many(groups)
+        return len(groups)
+
     async def update(
         self,
         group: Group,
@@ -60,10 +145,34 @@ class FakeGroupRepository(GroupRepository):
         fields_to_update: list[str] | None = None,
     ) -> None:
         self.db.groups[group.id] = group
+        group.mark_clean()
+
+    async def update_many(self, filter_set: FilterSet, values: dict[str, Any]) -> int:
+        return update_matching(self.db.groups.values(), self._model, filter_set, values)
+
+    async def delete_many(self, filter_set: FilterSet) -> int:
+        return delete_matching(self.db.groups, filter_set)
 
     async def delete(self, group: Group) -> None:
         del self.db.groups[group.id]
 
+    async def mark_deleting(self, group_id: UUID) -> None:
+        self.db.deleting[group_id] = self.db.groups.pop(group_id)
+
+    async def mark_deleting_owned_by(self, user_id: UUID) -> list[UUID]:
+        group_ids = [
+            member.group_id
+            for member in self.db.group_members.values()
+            if member.user_id == user_id and member.is_owner
+        ]
+        for group_id in group_ids:
+            if group_id in self.db.groups:
+                await self.mark_deleting(group_id)
+        return group_ids
+
+    async def purge(self, group_id: UUID) -> None:
+        self.db.deleting.pop(group_id, None)
+
     @property
     def _model(self) -> type[Group]:
         return Group
@@ -75,25 +184,62 @@ class FakeGroupRequestRepository(GroupRequestRepository):
 
     async def get(self, pk: UUID) -> GroupRequest:
         try:
-            return self.db.group_requests[pk]
+            return _of_visible_users(self.db, self.db.group_requests)[pk]
         except KeyError:
             raise DoesNotExistError("Group request does not exist")
 
+    async def get_many_by_ids(self, pks: list[UUID]) -> list[GroupRequest]:
+        group_requests = _of_visible_users(self.db, self.db.group_requests)
+        return [group_requests[pk] for pk in pks if pk in group_requests]
+
     async def get_many(
         self,
         filter_set: FilterSet | None = None,
+        *,
+        limit: int | None = None,
+        after: Cursor | None = None,
     ) -> list[GroupRequest]:
-        group_requests = list(self.db.group_requests.values())
+        visible = _of_visible_users(self.db, self.db.group_requests)
+        group_requests = list(visible.values())
 
         if filter_set:
-            filters = filter_set.get_filters()
             group_requests = [
                 group_request
                 for group_request in group_requests
-                if all(filter_(group_request) for filter_ in filters)
+                if filter_set.matches(group_request)
             ]
 
-        return group_requests
+        return paginate(group_requests, limit, after)
+
+    async def stream_many(
+        self,
+        filter_set: FilterSet | None = None,
+        *,
+        fetch_size: int | None = None,
+    ) -> AsyncIterator[GroupRequest]:
+        for model in await self.get_many(filter_set):
+            yield model
+
+    async def get_many_projected(
+        self,
+        fields: Collection[str],
+        filter_set: FilterSet | None = None,
+        *,
+        limit: int | None = None,
+        after: Cursor | None = None,
+    ) -> list[AppModel]:
+        models = await self.get_many(filter_set, limit=limit, after=after)
+        return project(models, self._model, fields)
+
+    async def stream_many_projected(
+        self,
+        fields: Collection[str],
+        filter_set: FilterSet | None = None,
+        *,
+        fetch_size: int | None = None,
+    ) -> AsyncIterator[AppModel]:
+        for model in await self.get_many_projected(fields, filter_set):
+            yield model
 
     async def persist(self, group_request: GroupRequest) -> None:
         if group_request.id in self.db.group_requests:
@@ -106,6 +252,16 @@ class FakeGroupRequestRepository(GroupRequestRepository):
                 raise AlreadyExistsError("Group request already exists")
             self.db.group_requests[group_request.id] = group_request
 
+    async def bulk_persist(
+        self,
+        group_requests: Iterable[GroupRequest],
+        *,
+        chunk_size: int | None = None,
+    ) -> int:
+        group_requests = list(group_requests)
+        await self.persist_many(group_requests)
+        return len(group_requests)
+
     async def update(
         self,
         group_request: GroupRequest,
@@ -113,14 +269,35 @@ class FakeGroupRequestRepository(GroupRequestRepository):
         fields_to_update: list[str] | None = None,
     ) -> None:
         self.db.group_requests[group_request.id] = group_request
+        group_request.mark_clean()
+
+    async def update_many(self, filter_set: FilterSet, values: dict[str, Any]) -> int:
+        return update_matching(
+            _of_visible_users(self.db, self.db.group_requests).values(),
+            self._model,
+            filter_set,
+            values,
+        )
+
+    async def delete_many(self, filter_set: FilterSet) -> int:
+        return delete_matching(self.db.group_requests, filter_set)
 
     async def delete(self, group_request: GroupRequest) -> None:
         del self.db.group_requests[group_request.id]
 
-    async def delete_by_group_id(self, group_id: UUID) -> None:
-        for request_id in list(self.db.group_requests.keys()):
-            if self.db.group_requests[request_id].group_id == group_id:
-                del self.db.group_requests[request_id]
+    async def delete_batch_by_group_id(self, group_id: UUID, limit: int) -> int:
+        return _delete_batch(
+            self.db.group_requests,
+            lambda model: model.group_id == group_id,
+            limit,
+        )
+
+    async def delete_batch_by_user_id(self, user_id: UUID, limit: int) -> int:
+        return _delete_batch(
+            self.db.group_requests,
+            lambda model: model.user_id == user_id,
+            limit,
+        )
 
     async def get_pending_request_by_user_and_group_id(
         self,
@@ -137,6 +314,110 @@ class FakeGroupRequestRepository(GroupRequestRepository):
 
         raise DoesNotExistError("Pending group request does not exist")
 
+    async def try_persist(self, group_request: GroupRequest) -> JoinGroupResult:
+        if group_request.group_id not in self.db.groups:
+            return JoinGroupResult.GROUP_DOES_NOT_EXIST
+
+        for group_member in self.db.group_members.values():
+            if (
+                group_member.user_id == group_request.user_id
+                and group_member.group_id == group_request.group_id
+            ):
+                return JoinGroupResult.ALREADY_A_MEMBER
+
+        try:
+            await self.get_pending_request_by_user_and_group_id(
+                group_request.user_id,
+                group_request.group_id,
+            )
+        except DoesNotExistError:
+            await self.persist(group_request)
+            return JoinGroupResult.CREATED
+
+        return JoinGroupResult.ALREADY_REQUESTED
+
+    async def review(
+        self,
+        request_id: UUID,
+        group_id: UUID,
+        reviewer_id: UUID,
+        status: GroupRequestStatus,
+    ) -> ReviewGroupRequestResult:
+        group_request = self.db.group_requests.get(request_id)
+        if group_request is None or group_request.group_id != group_id:
+            return ReviewGroupRequestResult.REQUEST_DOES_NOT_EXIST
+
+        members = {
+            group_member.user_id: group_member
+            for group_member in self.db.group_members.values()
+            if group_member.group_id == group_id
+        }
+        reviewer = members.get(reviewer_id)
+        if reviewer is None:
+            return ReviewGroupRequestResult.NOT_A_MEMBER
+        if not (reviewer.is_admin or reviewer.is_owner):
+            return ReviewGroupRequestResult.NOT_A_GROUP_OWNER_OR_ADMIN
+        if group_request.status != GroupRequestStatus.PENDING:
+            return ReviewGroupRequestResult.NOT_PENDING
+
+        if status == GroupRequestStatus.ACCEPTED:
+            if group_request.user_id in members:
+                return ReviewGroupRequestResult.ALREADY_A_MEMBER
+
+            group_member = GroupMember(user_id=group_request.user_id, group_id=group_id)
+            self.db.group_members[group_member.id] = group_member
+
+        group_request.status = status
+        return ReviewGroupRequestResult.REVIEWED
+
+    async def review_many(
+        self,
+        group_id: UUID,
+        request_ids: list[UUID],
+        status: GroupRequestStatus,
+    ) -> dict[UUID, ReviewGroupRequestResult]:
+        member_user_ids = {
+            group_member.user_id
+            for group_member in self.db.group_members.values()
+            if group_member.group_id == group_id
+        }
+
+        results = {}
+        for request_id in request_ids:
+            group_request = self.db.group_requests.get(request_id)
+            if group_request is None or group_request.group_id != group_id:
+                results[request_id] = ReviewGroupRequestResult.REQUEST_DOES_NOT_EXIST
+            else:
+                results[request_id] = self._review_one(
+                    group_request,
+                    status,
+                    member_user_ids,
+                )
+        return results
+
+    def _review_one(
+        self,
+        group_request: GroupRequest,
+        status: GroupRequestStatus,
+        member_user_ids: set[UUID],
+    ) -> ReviewGroupRequestResult:
+        if group_request.status != GroupRequestStatus.PENDING:
+            return ReviewGroupRequestResult.NOT_PENDING
+
+        if status == GroupRequestStatus.ACCEPTED:
+            if group_request.user_id in member_user_ids:
+                return ReviewGroupRequestResult.ALREADY_A_MEMBER
+
+            group_member = GroupMember(
+                user_id=group_request.user_id,
+                group_id=group_request.group_id,
+            )
+            self.db.group_members[group_member.id] = group_member
+            member_user_ids.add(group_member.user_id)
+
+        group_request.status = status
+        return ReviewGroupRequestResult.REVIEWED
+
     @property
     def _model(self) -> type[GroupRequest]:
         return GroupRequest
@@ -148,25 +429,62 @@ class FakeGroupMemberRepository(GroupMemberRepository):
 
     async def get(self, pk: UUID) -> GroupMember:
         try:
-            return self.db.group_members[pk]
+            return _of_visible_users(self.db, self.db.group_members)[pk]
         except KeyError:
             raise DoesNotExistError("Group member does not exist")
 
+    async def get_many_by_ids(self, pks: list[UUID]) -> list[GroupMember]:
+        group_members = _of_visible_users(self.db, self.db.group_members)
+        return [group_members[pk] for pk in pks if pk in group_members]
+
     async def get_many(
         self,
         filter_set: FilterSet | None = None,
+        *,
+        limit: int | None = None,
+        after: Cursor | None = None,
     ) -> list[GroupMember]:
-        group_members = list(self.db.group_members.values())
+        visible = _of_visible_users(self.db, self.db.group_members)
+        group_members = list(visible.values())
 
         if filter_set:
-            filters = filter_set.get_filters()
             group_members = [
                 group_member
                 for group_member in group_members
-                if all(filter_(group_member) for filter_ in filters)
+                if filter_set.matches(group_member)
             ]
 
-        return group_members
+        return paginate(group_members, limit, after)
+
+    async def stream_many(
+        self,
+        filter_set: FilterSet | None = None,
+        *,
+        fetch_size: int | None = None,
+    ) -> AsyncIterator[GroupMember]:
+        for model in await self.get_many(filter_set):
+            yield model
+
+    async def get_many_projected(
+        self,
+        fields: Collection[str],
+        filter_set: FilterSet | None = None,
+        *,
+        limit: int | None = None,
+        after: Cursor | None = None,
+    ) -> list[AppModel]:
+        models = await self.get_many(filter_set, limit=limit, after=after)
+        return project(models, self._model, fields)
+
+    async def stream_many_projected(
+        self,
+        fields: Collection[str],
+        filter_set: FilterSet | None = None,
+        *,
+        fetch_size: int | None = None,
+    ) -> AsyncIterator[AppModel]:
+        for model in await self.get_many_projected(fields, filter_set):
+            yield model
 
     async def persist(self, group_member: GroupMember) -> None:
         if group_member.id in self.db.group_members:
@@ -179,6 +497,16 @@ class FakeGroupMemberRepository(GroupMemberRepository):
                 raise AlreadyExistsError("Group member already exists")
             self.db.group_members[group_member.id] = group_member
 
+    async def bulk_persist(
+        self,
+        group_members: Iterable[GroupMember],
+        *,
+        chunk_size: int | None = None,
+    ) -> int:
+        group_members = list(group_members)
+        await self.persist_many(group_members)
+        return len(group_members)
+
     async def update(
         self,
         group_member: GroupMember,
@@ -186,14 +514,35 @@ class FakeGroupMemberRepository(GroupMemberRepository):
         fields_to_update: list[str] | None = None,
     ) -> None:
         self.db.group_members[group_member.id] = group_member
+        group_member.mark_clean()
+
+    async def update_many(self, filter_set: FilterSet, values: dict[str, Any]) -> int:
+        return update_matching(
+            _of_visible_users(self.db, self.db.group_members).values(),
+            self._model,
+            filter_set,
+            values,
+        )
+
+    async def delete_many(self, filter_set: FilterSet) -> int:
+        return delete_matching(self.db.group_members, filter_set)
 
     async def delete(self, group_member: GroupMember) -> None:
         del self.db.group_members[group_member.id]
 
-    async def delete_by_group_id(self, group_id: UUID) -> None:
-        for member_id in list(self.db.group_members.keys()):
-            if self.db.group_members[member_id].group_id == group_id:
-                del self.db.group_members[member_id]
+    async def delete_batch_by_group_id(self, group_id: UUID, limit: int) -> int:
+        return _delete_batch(
+            self.db.group_members,
+            lambda model: model.group_id == group_id,
+            limit,
+        )
+
+    async def delete_batch_by_user_id(self, user_id: UUID, limit: int) -> int:
+        return _delete_batch(
+            self.db.group_members,
+            lambda model: model.user_id == user_id,
+            limit,
+        )
 
     async def get_by_user_and_group_id(
         self,
@@ -206,6 +555,60 @@ class FakeGroupMemberRepository(GroupMemberRepository):
 
         raise DoesNotExistError("Group member does not exist")
 
+    async def try_persist(self, group_member: GroupMember) -> JoinGroupResult:
+        if group_member.group_id not in self.db.groups:
+            return JoinGroupResult.GROUP_DOES_NOT_EXIST
+
+        try:
+            await self.get_by_user_and_group_id(
+                group_member.user_id,
+                group_member.group_id,
+            )
+        except DoesNotExistError:
+            await self.persist(group_member)
+            return JoinGroupResult.CREATED
+
+        return JoinGroupResult.ALREADY_A_MEMBER
+
+    async def remove_many(
+        self,
+        group_id: UUID,
+        member_ids: list[UUID],
+        *,
+        can_remove_admins: bool,
+    ) -> dict[UUID, RemoveGroupMemberResult]:
+        results = {}
+        for member_id in member_ids:
+            group_member = self.db.group_members.get(member_id)
+            if group_member is None or group_member.group_id != group_id:
+                results[member_id] = RemoveGroupMemberResult.MEMBER_DOES_NOT_EXIST
+            elif group_member.is_owner:
+                results[member_id] = RemoveGroupMemberResult.CANNOT_DELETE_A_GROUP_OWNER
+            elif group_member.is_admin and not can_remove_admins:
+                results[member_id] = RemoveGroupMemberResult.NOT_A_GROUP_OWNER
+            else:
+                del self.db.group_members[member_id]
+                results[member_id] = RemoveGroupMemberResult.REMOVED
+        return results
+
     @property
     def _model(self) -> type[GroupMember]:
         return GroupMember
+
+
+def _of_visible_users(db: FakeDatabase, models: dict[UUID, Model]) -> dict[UUID, Model]:
+    # Mirror the visibility criteria hiding rows of users being deleted.
+    return {
+        pk: model for pk, model in models.items() if model.user_id not in db.deleting
+    }
+
+
+def _delete_batch(
+    models: dict[UUID, Model],
+    predicate: Callable[[Model], bool],
+    limit: int,
+) -> int:
+    batch = [pk for pk, model in models.items() if predicate(model)][:limit]
+    for pk in batch:
+        del models[pk]
+    return len(batch)
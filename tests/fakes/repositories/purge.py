@@ -0,0 +1,116 @@
+from typing import Any, AsyncIterator, Collection, Iterable
+from uuid import UUID
+
+from tests.fakes.database import FakeDatabase
+from tests.fakes.repositories.base import (
+    delete_matching,
+    paginate,
+    project,
+    update_matching,
+)
+
+from src.core.exceptions import AlreadyExistsError, DoesNotExistError
+from src.core.filters.base import FilterSet
+from src.core.interfaces.repositories.purge import PurgeJobRepository
+from src.core.models.base import AppModel
+from src.core.models.purge import PurgeJob
+from src.core.pagination import Cursor
+
+
+class FakePurgeJobRepository(PurgeJobRepository):
+    def __init__(self, db: FakeDatabase) -> None:
+        self.db = db
+
+    async def get(self, pk: UUID) -> PurgeJob:
+        try:
+            return self.db.purge_jobs[pk]
+        except KeyError:
+            raise DoesNotExistError("Purge job does not exist")
+
+    async def get_many_by_ids(self, pks: list[UUID]) -> list[PurgeJob]:
+        return [self.db.purge_jobs[pk] for pk in pks if pk in self.db.purge_jobs]
+
+    async def get_many(
+        self,
+        filter_set: FilterSet | None = None,
+        *,
+        limit: int | None = None,
+        after: Cursor | None = None,
+    ) -> list[PurgeJob]:
+        return paginate(self.db.purge_jobs.values(), limit, after)
+
+    async def stream_many(
+        self,
+        filter_set: FilterSet | None = None,
+        *,
+        fetch_size: int | None = None,
+    ) -> AsyncIterator[PurgeJob]:
+        for model in await self.get_many(filter_set):
+            yield model
+
+    async def get_many_projected(
+        self,
+        fields: Collection[str],
+        filter_set: FilterSet | None = None,
+        *,
+        limit: int | None = None,
+        after: Cursor | None = None,
+    ) -> list[AppModel]:
+        models = await self.get_many(filter_set, limit=limit, after=after)
+        return project(models, self._model, fields)
+
+    async def stream_many_projected(
+        self,
+        fields: Collection[str],
+        filter_set: FilterSet | None = None,
+        *,
+        fetch_size: int | None = None,
+    ) -> AsyncIterator[AppModel]:
+        for model in await self.get_many_projected(fields, filter_set):
+            yield model
+
+    async def persist(self, job: PurgeJob) -> None:
+        if job.id in self.db.purge_jobs:
+            raise AlreadyExistsError("Purge job already exists")
+        self.db.purge_jobs[job.id] = job
+
+    async def persist_many(self, jobs: list[PurgeJob]) -> None:
+        for job in jobs:
+            await self.persist(job)
+
+    async def bulk_persist(
+        self,
+        jobs: Iterable[PurgeJob],
+        *,
+        chunk_size: int | None = None,
+    ) -> int:
+        jobs = list(jobs)
+        await self.persist_many(jobs)
+        return len(jobs)
+
+    async def update(
+        self,
+        job: PurgeJob,
+        *_,
+        fields_to_update: list[str] | None = None,
+    ) -> None:
+        self.db.purge_jobs[job.id] = job
+        job.mark_clean()
+
+    async def update_many(self, filter_set: FilterSet, values: dict[str, Any]) -> int:
+        return update_matching(
+            self.db.purge_jobs.values(),
+            self._model,
+            filter_set,
+            values,
+        )
+
+    async def delete_many(self, filter_set: FilterSet) -> int:
+        return delete_matching(self.db.purge_jobs, filter_set)
+
+    async def delete(self, job: PurgeJob) -> None:
+        del self.db.purge_jobs[job.id]
+
+    @property
+    def _model(self) -> type[PurgeJob]:
+        return PurgeJob
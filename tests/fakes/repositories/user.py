@@ -1,11 +1,20 @@
+from typing import Any, AsyncIterator, Collection, Iterable
 from uuid import UUID
 
 from tests.fakes.database import FakeDatabase
+from tests.fakes.repositories.base import (
+    delete_matching,
+    paginate,
+    project,
+    update_matching,
+)
 
 from src.core.exceptions import AlreadyExistsError, DoesNotExistError
 from src.core.filters.base import FilterSet
 from src.core.interfaces.repositories.user import UserRepository
+from src.core.models.base import AppModel
 from src.core.models.user import User
+from src.core.pagination import Cursor
 
 
 class FakeUserRepository(UserRepository):
@@ -18,6 +27,9 @@ class FakeUserRepository(UserRepository):
         except KeyError:
             raise DoesNotExistError("User does not exist")
 
+    async def get_many_by_ids(self, pks: list[UUID]) -> list[User]:
+        return [self.db.users[pk] for pk in pks if pk in self.db.users]
+
     async def get_by_email(self, email: str) -> User | None:
         for user in self.db.users.values():
             if user.email == email:
@@ -25,8 +37,44 @@ class FakeUserRepository(UserRepository):
 
         return None
 
-    async def get_many(self, filter_set: FilterSet | None = None) -> list[User]:
-        return list(self.db.users.values())
+    async def get_many(
+        self,
+        filter_set: FilterSet | None = None,
+        *,
+        limit: int | None = None,
+        after: Cursor | None = None,
+    ) -> list[User]:
+        return paginate(self.db.users.values(), limit, after)
+
+    async def stream_many(
+        self,
+        filter_set: FilterSet | None = None,
+        *,
+        fetch_size: int | None = None,
+    ) -> AsyncIterator[User]:
+        for model in await self.get_many(filter_set):
+            yield model
+
+    async def get_many_projected(
+        self,
+        fields: Collection[str],
+        filter_set: FilterSet | None = None,
+        *,
+        limit: int | None = None,
+        after: Cursor | None = None,
+    ) -> list[AppModel]:
+        models = await self.get_many(filter_set, limit=limit, after=after)
+        return project(models, self._model, fields)
+
+    async def stream_many_projected(
+        self,
+        fields: Collection[str],
+        filter_set: FilterSet | None = None,
+        *,
+        fetch_size: int | None = None,
+    ) -> AsyncIterator[AppModel]:
+        for model in await self.get_many_projected(fields, filter_set):
+            yield model
 
     async def persist(self, user: User) -> None:
         if user.id in self.db.users:
@@ -39,6 +87,16 @@ class FakeUserRepository(UserRepository):
                 raise AlreadyExistsError("User already exists")
             self.db.users[user.id] = user
 
+    async def bulk_persist(
+        self,
+        users: Iterable[User],
+        *,
+        chunk_size: int | None = None,
+    ) -> int:
+        users = list(users)
+        await self.persist_many(users)
+        return len(users)
+
     async def update(
         self,
         user: User,
@@ -46,10 +104,23 @@ class FakeUserRepository(UserRepository):
         fields_to_update: list[str] | None = None,
     ) -> None:
         self.db.users[user.id] = user
+        user.mark_clean()
+
+    async def update_many(self, filter_set: FilterSet, values: dict[str, Any]) -> int:
+        return update_matching(self.db.users.values(), self._model, filter_set, values)
+
+    async def delete_many(self, filter_set: FilterSet) -> int:
+        return delete_matching(self.db.users, filter_set)
 
     async def delete(self, user: User) -> None:
         del self.db.users[user.id]
 
+    async def mark_deleting(self, user_id: UUID) -> None:
+        self.db.deleting[user_id] = self.db.users.pop(user_id)
+
+    async def purge(self, user_id: UUID) -> None:
+        self.db.deleting.pop(user_id, None)
+
     @property
     def _model(self) -> type[User]:
         return User
@@ -0,0 +1,17 @@
+from typing import Callable
+
+from src.core.interfaces.transaction import CommitHooks
+
+
+class FakeCommitHooks(CommitHooks):
+    def __init__(self) -> None:
+        self.callbacks: list[Callable[[], None]] = []
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        self.callbacks.append(callback)
+
+    def commit(self) -> None:
+        callbacks = self.callbacks
+        self.callbacks = []
+        for callback in callbacks:
+            callback()
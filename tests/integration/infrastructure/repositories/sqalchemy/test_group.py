@@ -0,0 +1,483 @@
+from datetime import date
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from src.core.enums.group import (
+    GroupRequestStatus,
+    JoinGroupResult,
+    RemoveGroupMemberResult,
+    ReviewGroupRequestResult,
+)
+from src.core.exceptions import DoesNotExistError
+from src.core.filters.group import GroupMemberFilterSet
+from src.core.models.group import Group, GroupMember, GroupRequest
+from src.core.models.user import User
+from src.infrastructure.repositories.group import (
+    GroupMemberRepository,
+    GroupRepository,
+    GroupRequestRepository,
+)
+from src.infrastructure.repositories.user import UserRepository
+
+
+@pytest.fixture
+def group_repository(async_db_connection: AsyncConnection) -> GroupRepository:
+    return GroupRepository(async_db_connection)
+
+
+@pytest.fixture
+def group_member_repository(
+    async_db_connection: AsyncConnection,
+) -> GroupMemberRepository:
+    return GroupMemberRepository(async_db_connection)
+
+
+@pytest.fixture
+def group_request_repository(
+    async_db_connection: AsyncConnection,
+) -> GroupRequestRepository:
+    return GroupRequestRepository(async_db_connection)
+
+
+@pytest_asyncio.fixture
+async def user(async_db_connection: AsyncConnection) -> User:
+    user = User(
+        email="user@example.com",
+        date_of_birth=date(1990, 1, 1),
+        password_hash="test",
+    )
+    await UserRepository(async_db_connection).persist(user)
+    return user
+
+
+@pytest_asyncio.fixture
+async def group(group_repository: GroupRepository) -> Group:
+    group = Group(name="Test group")
+    await group_repository.persist(group)
+    return group
+
+
+@pytest.mark.asyncio
+async def test_get_with_membership(
+    group_repository: GroupRepository,
+    group_member_repository: GroupMemberRepository,
+    user: User,
+    group: Group,
+):
+    member = GroupMember(user_id=user.id, group_id=group.id, is_owner=True)
+    await group_member_repository.persist(member)
+
+    result = await group_repository.get_with_membership(group.id, user.id)
+
+    assert result == (group, member)
+
+
+@pytest.mark.asyncio
+async def test_get_with_membership_not_a_member(
+    group_repository: GroupRepository,
+    user: User,
+    group: Group,
+):
+    result = await group_repository.get_with_membership(group.id, user.id)
+
+    assert result == (group, None)
+
+
+@pytest.mark.asyncio
+async def test_get_with_membership_group_does_not_exist(
+    group_repository: GroupRepository,
+    user: User,
+):
+    with pytest.raises(DoesNotExistError):
+        await group_repository.get_with_membership(uuid4(), user.id)
+
+
+@pytest.mark.asyncio
+async def test_try_persist_member(
+    group_member_repository: GroupMemberRepository,
+    user: User,
+    group: Group,
+):
+    member = GroupMember(user_id=user.id, group_id=group.id)
+
+    result = await group_member_repository.try_persist(member)
+
+    assert result == JoinGroupResult.CREATED
+    assert await group_member_repository.get(member.id) == member
+
+
+@pytest.mark.asyncio
+async def test_try_persist_member_already_a_member(
+    group_member_repository: GroupMemberRepository,
+    user: User,
+    group: Group,
+):
+    await group_member_repository.persist(
+        GroupMember(user_id=user.id, group_id=group.id),
+    )
+
+    result = await group_member_repository.try_persist(
+        GroupMember(user_id=user.id, group_id=group.id),
+    )
+
+    assert result == JoinGroupResult.ALREADY_A_MEMBER
+
+
+@pytest.mark.asyncio
+async def test_try_persist_member_group_does_not_exist(
+    group_member_repository: GroupMemberRepository,
+    user: User,
+):
+    result = await group_member_repository.try_persist(
+        GroupMember(user_id=user.id, group_id=uuid4()),
+    )
+
+    assert result == JoinGroupResult.GROUP_DOES_NOT_EXIST
+
+
+@pytest.mark.asyncio
+async def test_try_persist_request(
+    group_request_repository: GroupRequestRepository,
+    user: User,
+    group: Group,
+):
+    group_request = GroupRequest(user_id=user.id, group_id=group.id)
+
+    result = await group_request_repository.try_persist(group_request)
+
+    assert result == JoinGroupResult.CREATED
+    assert await group_request_repository.get(group_request.id) == group_request
+
+
+@pytest.mark.asyncio
+async def test_try_persist_request_already_requested(
+    group_request_repository: GroupRequestRepository,
+    user: User,
+    group: Group,
+):
+    await group_request_repository.persist(
+        GroupRequest(user_id=user.id, group_id=group.id),
+    )
+
+    result = await group_request_repository.try_persist(
+        GroupRequest(user_id=user.id, group_id=group.id),
+    )
+
+    assert result == JoinGroupResult.ALREADY_REQUESTED
+
+
+@pytest.mark.asyncio
+async def test_try_persist_request_already_a_member(
+    group_member_repository: GroupMemberRepository,
+    group_request_repository: GroupRequestRepository,
+    user: User,
+    group: Group,
+):
+    await group_member_repository.persist(
+        GroupMember(user_id=user.id, group_id=group.id),
+    )
+
+    result = await group_request_repository.try_persist(
+        GroupRequest(user_id=user.id, group_id=group.id),
+    )
+
+    assert result == JoinGroupResult.ALREADY_A_MEMBER
+
+
+@pytest_asyncio.fixture
+async def other_user(async_db_connection: AsyncConnection) -> User:
+    user = User(
+        email="other@example.com",
+        date_of_birth=date(1990, 1, 1),
+        password_hash="test",
+    )
+    await UserRepository(async_db_connection).persist(user)
+    return user
+
+
+@pytest_asyncio.fixture
+async def group_request(
+    group_member_repository: GroupMemberRepository,
+    group_request_repository: GroupRequestRepository,
+    user: User,
+    other_user: User,
+    group: Group,
+) -> GroupRequest:
+    await group_member_repository.persist(
+        GroupMember(user_id=user.id, group_id=group.id, is_owner=True),
+    )
+    group_request = GroupRequest(user_id=other_user.id, group_id=group.id)
+    await group_request_repository.persist(group_request)
+    return group_request
+
+
+@pytest.mark.asyncio
+async def test_review_accepted(
+    group_member_repository: GroupMemberRepository,
+    group_request_repository: GroupRequestRepository,
+    user: User,
+    other_user: User,
+    group: Group,
+    group_request: GroupRequest,
+):
+    result = await group_request_repository.review(
+        group_request.id,
+        group.id,
+        user.id,
+        GroupRequestStatus.ACCEPTED,
+    )
+
+    assert result == ReviewGroupRequestResult.REVIEWED
+    reviewed = await group_request_repository.get(group_request.id)
+    assert reviewed.status == GroupRequestStatus.ACCEPTED
+    assert await group_member_repository.get_by_user_and_group_id(
+        other_user.id,
+        group.id,
+    )
+
+
+@pytest.mark.asyncio
+async def test_review_declined(
+    group_member_repository: GroupMemberRepository,
+    group_request_repository: GroupRequestRepository,
+    user: User,
+    other_user: User,
+    group: Group,
+    group_request: GroupRequest,
+):
+    result = await group_request_repository.review(
+        group_request.id,
+        group.id,
+        user.id,
+        GroupRequestStatus.DECLINED,
+    )
+
+    assert result == ReviewGroupRequestResult.REVIEWED
+    with pytest.raises(DoesNotExistError):
+        await group_member_repository.get_by_user_and_group_id(other_user.id, group.id)
+
+
+@pytest.mark.asyncio
+async def test_review_not_a_member(
+    group_request_repository: GroupRequestRepository,
+    other_user: User,
+    group: Group,
+    group_request: GroupRequest,
+):
+    result = await group_request_repository.review(
+        group_request.id,
+        group.id,
+        other_user.id,
+        GroupRequestStatus.ACCEPTED,
+    )
+
+    assert result == ReviewGroupRequestResult.NOT_A_MEMBER
+
+
+@pytest.mark.asyncio
+async def test_review_not_pending(
+    group_request_repository: GroupRequestRepository,
+    user: User,
+    group: Group,
+    group_request: GroupRequest,
+):
+    await group_request_repository.review(
+        group_request.id,
+        group.id,
+        user.id,
+        GroupRequestStatus.DECLINED,
+    )
+
+    result = await group_request_repository.review(
+        group_request.id,
+        group.id,
+        user.id,
+        GroupRequestStatus.ACCEPTED,
+    )
+
+    assert result == ReviewGroupRequestResult.NOT_PENDING
+
+
+@pytest.mark.asyncio
+async def test_review_request_does_not_exist(
+    group_request_repository: GroupRequestRepository,
+    user: User,
+    group: Group,
+    group_request: GroupRequest,
+):
+    result = await group_request_repository.review(
+        uuid4(),
+        group.id,
+        user.id,
+        GroupRequestStatus.ACCEPTED,
+    )
+
+    assert result == ReviewGroupRequestResult.REQUEST_DOES_NOT_EXIST
+
+
+@pytest.mark.asyncio
+async def test_review_many(
+    group_member_repository: GroupMemberRepository,
+    group_request_repository: GroupRequestRepository,
+    other_user: User,
+    group: Group,
+    group_request: GroupRequest,
+):
+    missing_id = uuid4()
+
+    results = await group_request_repository.review_many(
+        group.id,
+        [group_request.id, missing_id],
+        GroupRequestStatus.ACCEPTED,
+    )
+
+    assert results == {
+        group_request.id: ReviewGroupRequestResult.REVIEWED,
+        missing_id: ReviewGroupRequestResult.REQUEST_DOES_NOT_EXIST,
+    }
+    assert await group_member_repository.get_by_user_and_group_id(
+        other_user.id,
+        group.id,
+    )
+
+
+@pytest.mark.asyncio
+async def test_remove_many(
+    group_member_repository: GroupMemberRepository,
+    user: User,
+    other_user: User,
+    group: Group,
+):
+    owner = GroupMember(user_id=user.id, group_id=group.id, is_owner=True)
+    admin = GroupMember(user_id=other_user.id, group_id=group.id, is_admin=True)
+    await group_member_repository.persist(owner)
+    await group_member_repository.persist(admin)
+
+    results = await group_member_repository.remove_many(
+        group.id,
+        [owner.id, admin.id],
+        can_remove_admins=False,
+    )
+
+    assert results == {
+        owner.id: RemoveGroupMemberResult.CANNOT_DELETE_A_GROUP_OWNER,
+        admin.id: RemoveGroupMemberResult.NOT_A_GROUP_OWNER,
+    }
+
+
+@pytest.mark.asyncio
+async def test_mark_deleting_hides_group(
+    group_repository: GroupRepository,
+    user: User,
+    group: Group,
+):
+    await group_repository.mark_deleting(group.id)
+
+    with pytest.raises(DoesNotExistError):
+        await group_repository.get(group.id)
+    with pytest.raises(DoesNotExistError):
+        await group_repository.get_with_membership(group.id, user.id)
+    assert await group_repository.get_many() == []
+
+
+@pytest.mark.asyncio
+async def test_mark_user_deleting_hides_memberships(
+    async_db_connection: AsyncConnection,
+    group_member_repository: GroupMemberRepository,
+    user: User,
+    other_user: User,
+    group: Group,
+):
+    member = GroupMember(user_id=user.id, group_id=group.id)
+    other_member = GroupMember(user_id=other_user.id, group_id=group.id)
+    await group_member_repository.persist_many([member, other_member])
+
+    await UserRepository(async_db_connection).mark_deleting(user.id)
+
+    with pytest.raises(DoesNotExistError):
+        await group_member_repository.get(member.id)
+    assert await group_member_repository.get_many() == [other_member]
+
+
+@pytest.mark.asyncio
+async def test_mark_user_deleting_hides_requests(
+    async_db_connection: AsyncConnection,
+    group_request_repository: GroupRequestRepository,
+    user: User,
+    group: Group,
+):
+    group_request = GroupRequest(user_id=user.id, group_id=group.id)
+    await group_request_repository.persist(group_request)
+
+    await UserRepository(async_db_connection).mark_deleting(user.id)
+
+    with pytest.raises(DoesNotExistError):
+        await group_request_repository.get(group_request.id)
+    assert await group_request_repository.get_many() == []
+
+
+@pytest.mark.asyncio
+async def test_delete_batch_by_group_id(
+    group_member_repository: GroupMemberRepository,
+    user: User,
+    other_user: User,
+    group: Group,
+):
+    await group_member_repository.persist_many(
+        [
+            GroupMember(user_id=user.id, group_id=group.id),
+            GroupMember(user_id=other_user.id, group_id=group.id),
+        ],
+    )
+
+    assert await group_member_repository.delete_batch_by_group_id(group.id, 1) == 1
+    assert await group_member_repository.delete_batch_by_group_id(group.id, 1) == 1
+    assert await group_member_repository.delete_batch_by_group_id(group.id, 1) == 0
+
+
+@pytest.mark.asyncio
+async def test_update_many(
+    group_member_repository: GroupMemberRepository,
+    user: User,
+    other_user: User,
+    group: Group,
+):
+    owner = GroupMember(user_id=user.id, group_id=group.id, is_admin=True)
+    admin = GroupMember(user_id=other_user.id, group_id=group.id, is_admin=True)
+    await group_member_repository.persist_many([owner, admin])
+
+    count = await group_member_repository.update_many(
+        GroupMemberFilterSet(group_id__eq=group.id, user_id__eq=other_user.id),
+        {"is_admin": False},
+    )
+
+    assert count == 1
+    assert (await group_member_repository.get(admin.id)).is_admin is False
+    assert (await group_member_repository.get(owner.id)).is_admin is True
+
+
+@pytest.mark.asyncio
+async def test_delete_many(
+    group_member_repository: GroupMemberRepository,
+    user: User,
+    other_user: User,
+    group: Group,
+):
+    await group_member_repository.persist_many(
+        [
+            GroupMember(user_id=user.id, group_id=group.id, is_admin=True),
+            GroupMember(user_id=other_user.id, group_id=group.id),
+        ],
+    )
+
+    count = await group_member_repository.delete_many(
+        GroupMemberFilterSet(group_id__eq=group.id, is_admin__eq=False),
+    )
+
+    assert count == 1
+    assert [member.user_id for member in await group_member_repository.get_many()] == [
+        user.id,
+    ]
@@ -9,8 +9,11 @@ from sqlalchemy.ext.asyncio import AsyncConnection
 from src.core.exceptions import AlreadyExistsError, DoesNotExistError
 from src.core.interfaces.email import EmailSender
 from src.core.models.user import User
+from src.core.pagination import Cursor
 from src.core.schemas.user import CreateUserSchema
+from src.core.services.purge import PurgeService
 from src.core.services.user import UserService
+from src.infrastructure.repositories.group import GroupRepository
 from src.infrastructure.repositories.user import UserRepository
 
 
@@ -19,12 +22,19 @@ def user_repository(async_db_connection: AsyncConnection) -> UserRepository:
     return UserRepository(async_db_connection)
 
 
+@pytest.fixture
+def group_repository(async_db_connection: AsyncConnection) -> GroupRepository:
+    return GroupRepository(async_db_connection)
+
+
 @pytest.fixture
 def user_service(
     user_repository: UserRepository,
+    group_repository: GroupRepository,
     email_sender: EmailSender,
+    purge_service: PurgeService,
 ) -> UserService:
-    return UserService(user_repository, email_sender)
+    return UserService(user_repository, group_repository, email_sender, purge_service)
 
 
 @pytest.fixture
@@ -132,6 +142,37 @@ async def test_persist_many_with_already_exists(user_repository: UserRepository)
         await user_repository.persist_many(users)
 
 
+@pytest.mark.asyncio
+async def test_bulk_persist(user_repository: UserRepository):
+    users = [
+        User(
+            email=f"test{index}@example.com",
+            date_of_birth=date(1990, 1, 1),
+            password_hash="test",
+        )
+        for index in range(5)
+    ]
+
+    assert await user_repository.bulk_persist(iter(users), chunk_size=2) == 5
+    assert await user_repository.get_many() == users
+
+
+@pytest.mark.asyncio
+async def test_bulk_persist_with_already_exists(
+    user_repository: UserRepository,
+    user: User,
+):
+    other_user = User(
+        email="test1@example.com",
+        date_of_birth=date(1990, 1, 1),
+        password_hash="test",
+    )
+
+    with pytest.raises(AlreadyExistsError):
+        await user_repository.bulk_persist([other_user, user])
+    assert await user_repository.get_many() == [user]
+
+
 @pytest.mark.asyncio
 async def test_delete_user(user_repository: UserRepository, user: User):
     await user_repository.delete(user)
@@ -161,3 +202,50 @@ async def test_update_with_selected_fields(user_repository: UserRepository, user
     assert result is not None
     assert result.email == user.email
     assert result.first_name is None
+
+
+@pytest.mark.asyncio
+async def test_update_changed_fields(user_repository: UserRepository, user: User):
+    stored = await user_repository.get(user.id)
+    user.first_name = "John"
+    stored.last_name = "Doe"
+
+    await user_repository.update(user)
+    await user_repository.update(stored)
+    result = await user_repository.get(user.id)
+
+    assert result.first_name == "John"
+    assert result.last_name == "Doe"
+    assert user.changed_fields == stored.changed_fields == frozenset()
+
+
+@pytest.mark.asyncio
+async def test_update_refreshes_model(user_repository: UserRepository, user: User):
+    user.first_name = "John"
+
+    await user_repository.update(user)
+    result = await user_repository.get(user.id)
+
+    assert user == result
+
+
+@pytest.mark.asyncio
+async def test_get_many_paginated(user_repository: UserRepository):
+    users = [
+        User(
+            email=f"test{index}@example.com",
+            date_of_birth=date(1990, 1, 1),
+            password_hash="test",
+        )
+        for index in range(3)
+    ]
+    await user_repository.persist_many(users)
+
+    first_page = await user_repository.get_many(limit=2)
+    second_page = await user_repository.get_many(
+        limit=2,
+        after=Cursor.from_model(first_page[-1]),
+    )
+
+    assert first_page == users[:2]
+    assert second_page == users[2:]
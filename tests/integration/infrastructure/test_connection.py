@@ -0,0 +1,54 @@
+import asyncio
+from datetime import date
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.core.models.group import Group
+from src.core.models.user import User
+from src.infrastructure.database.connection import RequestConnection
+from src.infrastructure.repositories.group import GroupRepository
+from src.infrastructure.repositories.user import UserRepository
+
+
+@pytest_asyncio.fixture
+async def user(async_db_engine: AsyncEngine) -> User:
+    user = User(
+        email="user@example.com",
+        date_of_birth=date(1990, 1, 1),
+        password_hash="test",
+    )
+    async with async_db_engine.begin() as conn:
+        await UserRepository(conn).persist(user)
+    return user
+
+
+@pytest_asyncio.fixture
+async def group(async_db_engine: AsyncEngine) -> Group:
+    group = Group(name="Test group")
+    async with async_db_engine.begin() as conn:
+        await GroupRepository(conn).persist(group)
+    return group
+
+
+@pytest.mark.asyncio
+async def test_concurrent_statements_share_one_connection(
+    async_db_engine: AsyncEngine,
+    user: User,
+    group: Group,
+):
+    # Start from an empty pool, so checking out a connection has to wait for
+    # the server and lets the other statement run meanwhile.
+    await async_db_engine.dispose()
+    conn = RequestConnection(async_db_engine)
+
+    loaded_user, loaded_group = await asyncio.gather(
+        UserRepository(conn).get(user.id),
+        GroupRepository(conn).get(group.id),
+    )
+    await conn.release()
+
+    assert loaded_user.id == user.id
+    assert loaded_group.id == group.id
+    assert async_db_engine.pool.checkedout() == 0
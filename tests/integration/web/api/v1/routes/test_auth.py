@@ -1,11 +1,15 @@
 import pytest
 import pytest_asyncio
-from fastapi import status
+from fastapi import FastAPI, status
 from httpx import AsyncClient, Response
 
+from src.core.admission import AdmissionController
+from src.core.interfaces.repositories.user import UserRepository
 from src.core.models.user import User
 from src.core.schemas.user import CreateUserSchema
+from src.core.services.auth import AuthService
 from src.core.services.user import UserService
+from src.web.api.v1.dependencies import get_auth_service
 
 
 @pytest.fixture
@@ -46,3 +50,28 @@ async def test_authenticate_user(
     response: Response = await client.post("/auth/login/", data=login_data)
 
     assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.asyncio
+async def test_authenticate_user_throttled(
+    client: AsyncClient,
+    fastapi_app: FastAPI,
+    user: User,
+    user_repository: UserRepository,
+    login_data: dict[str, str],
+):
+    login_admission = AdmissionController(
+        max_concurrency=0,
+        max_queue=0,
+        queue_timeout=0,
+    )
+    fastapi_app.dependency_overrides[get_auth_service] = lambda: AuthService(
+        user_repository,
+        login_admission=login_admission,
+    )
+
+    response: Response = await client.post("/auth/login/", data=login_data)
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.headers["Retry-After"] == "1"
+    assert login_admission.rejected == 1
@@ -1,9 +1,17 @@
+import json
+from uuid import uuid4
+
 import pytest
 import pytest_asyncio
 from fastapi import status
 from httpx import AsyncClient, Response
 
-from src.core.enums.group import GroupRequestStatus
+from src.constants import constants
+from src.core.enums.group import (
+    GroupRequestStatus,
+    RemoveGroupMemberResult,
+    ReviewGroupRequestResult,
+)
 from src.core.models.group import Group, GroupMember, GroupRequest
 from src.core.models.user import User
 from src.core.schemas.group import (
@@ -15,6 +23,8 @@ from src.core.schemas.group import (
     UpdateGroupSchema,
 )
 from src.core.services.group import GroupService
+from src.web.api.v1.pagination import NEXT_CURSOR_HEADER
+from src.web.api.v1.streaming import NDJSON_MEDIA_TYPE
 
 
 @pytest.fixture
@@ -102,6 +112,8 @@ async def test_update_group(
     assert response.status_code == status.HTTP_200_OK
     body = response.json()
     assert body["id"] == str(group.id)
+    assert body["name"] == update_group_schema.name
+    assert body["description"] == update_group_schema.description
 
 
 @pytest.mark.asyncio
@@ -163,6 +175,86 @@ async def test_get_groups(
 
     assert response.status_code == status.HTTP_200_OK
     assert len(response.json()) == 1
+    assert NEXT_CURSOR_HEADER not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_get_groups_stream(
+    client: AsyncClient,
+    user_bearer_token_header: dict[str, str],
+    group: Group,
+) -> None:
+    response: Response = await client.get(
+        "/groups/",
+        params={"stream": True},
+        headers=user_bearer_token_header,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == NDJSON_MEDIA_TYPE
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["id"] for line in lines] == [str(group.id)]
+
+
+@pytest.mark.asyncio
+async def test_get_groups_paginated(
+    client: AsyncClient,
+    user: User,
+    user_bearer_token_header: dict[str, str],
+    group: Group,
+    group_service: GroupService,
+) -> None:
+    other_group = await group_service.create_group(
+        user.id,
+        CreateGroupSchema(name="Other group"),
+    )
+
+    response: Response = await client.get(
+        "/groups/",
+        params={"limit": 1},
+        headers=user_bearer_token_header,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [body["id"] for body in response.json()] == [str(group.id)]
+
+    response = await client.get(
+        "/groups/",
+        params={"limit": 1, "cursor": response.headers[NEXT_CURSOR_HEADER]},
+        headers=user_bearer_token_header,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [body["id"] for body in response.json()] == [str(other_group.id)]
+    assert NEXT_CURSOR_HEADER not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_get_groups_invalid_cursor(
+    client: AsyncClient,
+    user_bearer_token_header: dict[str, str],
+) -> None:
+    response: Response = await client.get(
+        "/groups/",
+        params={"cursor": "invalid"},
+        headers=user_bearer_token_header,
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_get_groups_limit_too_large(
+    client: AsyncClient,
+    user_bearer_token_header: dict[str, str],
+) -> None:
+    response: Response = await client.get(
+        "/groups/",
+        params={"limit": constants.MAX_PAGE_SIZE + 1},
+        headers=user_bearer_token_header,
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
 
 @pytest.mark.asyncio
@@ -218,6 +310,51 @@ async def test_delete_group_member(
     assert response.status_code == status.HTTP_204_NO_CONTENT
 
 
+@pytest.mark.asyncio
+async def test_delete_group_members(
+    client: AsyncClient,
+    user_bearer_token_header: dict[str, str],
+    group: Group,
+    other_user_group_member: GroupMember,
+) -> None:
+    missing_id = uuid4()
+    response: Response = await client.request(
+        "DELETE",
+        f"/groups/{group.id}/members/",
+        headers=user_bearer_token_header,
+        json={"ids": [str(other_user_group_member.id), str(missing_id)]},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [
+        {
+            "id": str(other_user_group_member.id),
+            "result": RemoveGroupMemberResult.REMOVED,
+        },
+        {
+            "id": str(missing_id),
+            "result": RemoveGroupMemberResult.MEMBER_DOES_NOT_EXIST,
+        },
+    ]
+
+
+@pytest.mark.asyncio
+async def test_delete_group_members_not_admin_or_owner(
+    client: AsyncClient,
+    group: Group,
+    other_user_bearer_token_header: dict[str, str],
+    other_user_group_member: GroupMember,
+) -> None:
+    response: Response = await client.request(
+        "DELETE",
+        f"/groups/{group.id}/members/",
+        headers=other_user_bearer_token_header,
+        json={"ids": [str(other_user_group_member.id)]},
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
 @pytest.mark.asyncio
 async def test_get_group_members(
     client: AsyncClient,
@@ -238,6 +375,42 @@ async def test_get_group_members(
     assert body[0]["is_owner"] is True
 
 
+@pytest.mark.asyncio
+async def test_get_group_members_stream(
+    client: AsyncClient,
+    user: User,
+    user_bearer_token_header: dict[str, str],
+    group: Group,
+) -> None:
+    response: Response = await client.get(
+        f"/groups/{group.id}/members/",
+        params={"stream": True},
+        headers=user_bearer_token_header,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert len(lines) == 1
+    assert lines[0]["user_id"] == str(user.id)
+
+
+@pytest.mark.asyncio
+async def test_get_group_members_stream_private_group(
+    client: AsyncClient,
+    group: Group,
+    other_user_bearer_token_header: dict[str, str],
+) -> None:
+    group.is_private = True
+
+    response: Response = await client.get(
+        f"/groups/{group.id}/members/",
+        params={"stream": True},
+        headers=other_user_bearer_token_header,
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
 @pytest.mark.asyncio
 async def test_get_group_member_by_id(
     client: AsyncClient,
@@ -300,6 +473,54 @@ async def test_update_group_request(
     assert body["id"] == str(other_user_group_request.id)
 
 
+@pytest.mark.asyncio
+async def test_update_group_requests(
+    client: AsyncClient,
+    user_bearer_token_header: dict[str, str],
+    group: Group,
+    other_user_group_request: GroupRequest,
+) -> None:
+    missing_id = uuid4()
+    response: Response = await client.patch(
+        f"/groups/{group.id}/requests/",
+        headers=user_bearer_token_header,
+        json={
+            "ids": [str(other_user_group_request.id), str(missing_id)],
+            "status": GroupRequestStatus.ACCEPTED,
+        },
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [
+        {
+            "id": str(other_user_group_request.id),
+            "result": ReviewGroupRequestResult.REVIEWED,
+        },
+        {
+            "id": str(missing_id),
+            "result": ReviewGroupRequestResult.REQUEST_DOES_NOT_EXIST,
+        },
+    ]
+
+
+@pytest.mark.asyncio
+async def test_update_group_requests_too_many_ids(
+    client: AsyncClient,
+    user_bearer_token_header: dict[str, str],
+    group: Group,
+) -> None:
+    response: Response = await client.patch(
+        f"/groups/{group.id}/requests/",
+        headers=user_bearer_token_header,
+        json={
+            "ids": [str(uuid4()) for _ in range(constants.MAX_BULK_IDS + 1)],
+            "status": GroupRequestStatus.ACCEPTED,
+        },
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
 @pytest.mark.asyncio
 async def test_delete_group_request(
     client: AsyncClient,
@@ -0,0 +1,65 @@
+import pytest
+from fastapi import status
+from httpx import AsyncClient, Response
+
+from src.core.enums.purge import PurgeEntity
+from src.core.models.user import User
+from src.core.services.purge import PurgeService
+
+
+@pytest.mark.asyncio
+async def test_get_metrics(
+    client: AsyncClient,
+    user: User,
+    user_bearer_token_header: dict[str, str],
+):
+    user.is_superuser = True
+
+    response: Response = await client.get(
+        "/internal/metrics/",
+        headers=user_bearer_token_header,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert set(response.json()) == {
+        "login_admission",
+        "password_hashing",
+        "access_token_cache",
+        "database_pool",
+        "database_replicas",
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_metrics_not_superuser(
+    client: AsyncClient,
+    user_bearer_token_header: dict[str, str],
+):
+    response: Response = await client.get(
+        "/internal/metrics/",
+        headers=user_bearer_token_header,
+    )
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.asyncio
+async def test_get_purge_job(
+    client: AsyncClient,
+    user: User,
+    user_bearer_token_header: dict[str, str],
+    purge_service: PurgeService,
+):
+    user.is_superuser = True
+    job = await purge_service.schedule(PurgeEntity.GROUP, user.id)
+
+    response: Response = await client.get(
+        f"/internal/purge-jobs/{job.id}/",
+        headers=user_bearer_token_header,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    body = response.json()
+    assert body["id"] == str(job.id)
+    assert body["status"] == "pending"
+    assert body["deleted_rows"] == 0
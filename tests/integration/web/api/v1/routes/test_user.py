@@ -1,3 +1,4 @@
+import json
 from uuid import UUID, uuid4
 
 import pytest
@@ -5,6 +6,7 @@ from fastapi import status
 from httpx import AsyncClient, Response
 
 from src.core.models.user import User
+from src.web.api.v1.streaming import NDJSON_MEDIA_TYPE
 
 
 @pytest.mark.asyncio
@@ -47,6 +49,26 @@ async def test_get_users(
     assert body[0]["is_active"] == user.is_active
 
 
+@pytest.mark.asyncio
+async def test_get_users_stream(
+    client: AsyncClient,
+    user: User,
+    other_user: User,
+    user_bearer_token_header: dict[str, str],
+):
+    response: Response = await client.get(
+        "/users/",
+        params={"stream": True},
+        headers=user_bearer_token_header,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == NDJSON_MEDIA_TYPE
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["id"] for line in lines] == [str(user.id), str(other_user.id)]
+    assert "password_hash" not in lines[0]
+
+
 @pytest.mark.asyncio
 async def test_get_user_by_id(
     client: AsyncClient,
@@ -154,6 +176,9 @@ async def test_update_user(
     body = response.json()
 
     assert body["id"] == str(user.id)
+    assert body["email"] == user.email
+    assert body["first_name"] == "New Name"
+    assert body["last_name"] == "New Last Name"
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,114 @@
+import pytest
+from pydantic import VERSION as PYDANTIC_VERSION
+from pydantic import ValidationError
+
+from src.core.models.group import Group
+
+
+def test_new_model_has_no_changed_fields():
+    group = Group(name="Test group")
+
+    assert group.changed_fields == frozenset()
+
+
+def test_changed_fields():
+    group = Group(name="Test group")
+
+    group.name = "New name"
+    group.is_private = False
+
+    assert group.changed_fields == {"name"}
+
+
+def test_changed_fields_validated_model():
+    group = Group.model_validate({"name": "Test group", "is_private": True})
+
+    group.is_private = False
+
+    assert group.changed_fields == {"is_private"}
+
+
+def test_mark_clean():
+    group = Group(name="Test group")
+    group.name = "New name"
+    group.description = "Description"
+
+    group.mark_clean({"name"})
+    assert group.changed_fields == {"description"}
+
+    group.mark_clean()
+    assert group.changed_fields == frozenset()
+
+
+@pytest.mark.parametrize("deep", [False, True])
+def test_copy_tracks_changes_separately(deep: bool):
+    group = Group(name="Test group")
+    group.description = "Description"
+
+    copied = group.model_copy(deep=deep)
+    copied.name = "New name"
+    copied.mark_clean({"description"})
+
+    assert group.changed_fields == {"description"}
+    assert copied.changed_fields == {"name"}
+
+
+def test_from_trusted():
+    group = Group(name="Test group")
+    row = {**group.model_dump(), "deleting_at": None}
+
+    trusted = Group.from_trusted(row)
+
+    assert trusted == group
+    assert trusted.model_fields_set == set(Group.model_fields)
+    assert trusted.changed_fields == frozenset()
+
+
+def test_from_trusted_matches_model_construct():
+    # from_trusted sets pydantic's instance attributes itself. Check them again,
+    # and update this version, when upgrading pydantic.
+    assert PYDANTIC_VERSION.startswith("2.4.")
+    values = Group(name="Test group").model_dump()
+
+    trusted = Group.from_trusted(values)
+    constructed = Group.model_construct(set(values), **values)
+
+    # Equality covers the fields, extra values and private attributes.
+    assert trusted == constructed
+    assert trusted.model_fields_set == constructed.model_fields_set
+
+
+def test_from_trusted_tracks_changes():
+    group = Group.from_trusted(Group(name="Test group").model_dump())
+
+    group.name = "New name"
+
+    assert group.changed_fields == {"name"}
+
+
+def test_from_trusted_validates_incomplete_values():
+    group = Group.from_trusted({"name": "Test group"})
+
+    assert group.is_private is False
+    assert group.description is None
+
+
+def test_projection():
+    projection = Group.projection(["name"])
+
+    assert list(projection.model_fields) == ["id", "created_at", "updated_at", "name"]
+    assert Group.projection({"name"}) is projection
+
+
+def test_projection_is_read_only():
+    group = Group(name="Test group")
+    projected = Group.projection(["name"]).from_trusted(group.model_dump())
+
+    assert projected.name == group.name
+    with pytest.raises(ValidationError):
+        projected.name = "New name"
+
+
+def test_projection_unknown_field():
+    with pytest.raises(ValueError, match="Unknown Group fields"):
+        Group.projection(["password_hash"])
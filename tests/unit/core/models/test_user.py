@@ -9,7 +9,7 @@ from src.core.exceptions import (
     UserNotActiveError,
 )
 from src.core.models.user import User
-from src.core.utils import verify_password
+from src.core.utils import get_password_hash, verify_password
 
 
 @pytest.fixture
@@ -86,7 +86,7 @@ def test_deactivate_already_inactive(user: User):
 def test_reset_password(user: User):
     token = user.generate_password_reset_token()
 
-    user.reset_password(token, "new_password")
+    user.reset_password(token, get_password_hash("new_password"))
 
     assert verify_password("new_password", user.password_hash)
     assert user.password_reset_token is None
@@ -100,10 +100,10 @@ def test_reset_password_invalid_token(user: User):
     user.generate_password_reset_token()
 
     with pytest.raises(InvalidTokenError):
-        user.reset_password(token, "new_password")
+        user.reset_password(token, "new_password_hash")
 
     with pytest.raises(InvalidTokenError):
-        user.reset_password("some_invalid_token", "new_password")
+        user.reset_password("some_invalid_token", "new_password_hash")
 
 
 def test_reset_password_expired_token(user: User):
@@ -111,7 +111,7 @@ def test_reset_password_expired_token(user: User):
     user.password_reset_token_expires_at = datetime.now() - timedelta(hours=1)
 
     with pytest.raises(ExpiredTokenError):
-        user.reset_password(token, "new_password")
+        user.reset_password(token, "new_password_hash")
 
 
 def test_get_email_context(user: User):
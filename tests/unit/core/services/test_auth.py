@@ -3,7 +3,10 @@ from uuid import uuid4
 
 import pytest
 import pytest_asyncio
+from pytest_mock import MockerFixture
+from tests.fakes.transaction import FakeCommitHooks
 
+from src.core.cache import AccessTokenCache
 from src.core.exceptions import InvalidCredentialsError, UserNotActiveError
 from src.core.models.user import User
 from src.core.schemas.auth import UserCredentials
@@ -144,3 +147,65 @@ async def test_authenticate_user_with_invalid_email_and_password(
     )
     with pytest.raises(InvalidCredentialsError):
         await auth_service.authenticate_user(credentials)
+
+
+@pytest.mark.asyncio
+async def test_verify_access_token_uses_cache(
+    user: User,
+    user_service: UserService,
+    mocker: MockerFixture,
+) -> None:
+    user.activate()
+    token_cache = AccessTokenCache(maxsize=10, ttl=10)
+    auth_service = AuthService(user_service.repository, token_cache)
+    access_token = auth_service.create_access_token(user)
+    await auth_service.verify_access_token(access_token)
+
+    get = mocker.spy(user_service.repository, "get")
+    verified_user = await auth_service.verify_access_token(access_token)
+
+    assert verified_user.id == user.id
+    assert get.call_count == 0
+    assert token_cache.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_verify_access_token_cache_invalidated_on_user_change(
+    user: User,
+    user_service: UserService,
+) -> None:
+    user.activate()
+    token_cache = AccessTokenCache(maxsize=10, ttl=10)
+    user_service.token_cache = token_cache
+    auth_service = AuthService(user_service.repository, token_cache)
+    access_token = auth_service.create_access_token(user)
+    await auth_service.verify_access_token(access_token)
+
+    await user_service.deactivate_user(user.id)
+
+    with pytest.raises(UserNotActiveError):
+        await auth_service.verify_access_token(access_token)
+
+
+@pytest.mark.asyncio
+async def test_verify_access_token_cache_invalidated_after_commit(
+    user: User,
+    user_service: UserService,
+) -> None:
+    user.activate()
+    token_cache = AccessTokenCache(maxsize=10, ttl=10)
+    commit_hooks = FakeCommitHooks()
+    user_service.token_cache = token_cache
+    user_service.commit_hooks = commit_hooks
+    auth_service = AuthService(user_service.repository, token_cache)
+    access_token = auth_service.create_access_token(user)
+    await auth_service.verify_access_token(access_token)
+    cached = token_cache.get(access_token)
+    assert cached is not None
+
+    await user_service.deactivate_user(user.id)
+    # A request running before the commit caches the user as it was.
+    token_cache.set(access_token, cached.payload, cached.user)
+    commit_hooks.commit()
+
+    assert token_cache.get(access_token) is None
@@ -3,8 +3,15 @@ from uuid import uuid4
 
 import pytest
 import pytest_asyncio
+from pytest_mock import MockerFixture
+from tests.fakes.purge import FakePurgeScheduler
 
-from src.core.enums.group import GroupRequestStatus
+from src.core.enums.group import (
+    GroupRequestStatus,
+    RemoveGroupMemberResult,
+    ReviewGroupRequestResult,
+)
+from src.core.enums.purge import PurgeEntity
 from src.core.exceptions import (
     AlreadyAGroupMemberError,
     AlreadyAGroupOwnerError,
@@ -19,9 +26,12 @@ from src.core.exceptions import (
     RequestNotPendingError,
 )
 from src.core.filters.group import GroupInputFilters
+from src.core.interfaces.repositories.user import UserRepository
 from src.core.models.group import Group, GroupMember, GroupRequest
 from src.core.models.user import User
 from src.core.schemas.group import (
+    BulkDeleteGroupMembersSchema,
+    BulkUpdateGroupRequestsSchema,
     CreateGroupMemberSchema,
     CreateGroupRequestSchema,
     CreateGroupSchema,
@@ -133,7 +143,7 @@ async def test_create_group_creates_member(
 ) -> None:
     group = await group_service.create_group(user.id, create_group_schema)
 
-    members = await group_service.get_group_members(user.id, group.id)
+    members = (await group_service.get_group_members(user.id, group.id)).items
 
     assert len(members) == 1
     assert members[0].user_id == user.id
@@ -183,22 +193,57 @@ async def test_update_group_other_member(
 
 
 @pytest.mark.asyncio
-async def test_delete_group(
+async def test_update_group_loads_membership_with_group(
     user: User,
     group: Group,
+    update_group_schema: UpdateGroupSchema,
     group_service: GroupService,
+    mocker: MockerFixture,
 ) -> None:
-    await group_service.delete_group(user.id, group.id)
+    get_with_membership = mocker.spy(
+        group_service.group_repository,
+        "get_with_membership",
+    )
+    get_group = mocker.spy(group_service.group_repository, "get")
+    get_member = mocker.spy(
+        group_service.member_repository,
+        "get_by_user_and_group_id",
+    )
+
+    await group_service.update_group(user.id, group.id, update_group_schema)
+
+    get_with_membership.assert_called_once_with(group_id=group.id, user_id=user.id)
+    get_group.assert_not_called()
+    get_member.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_update_group_does_not_exist(
+    user: User,
+    update_group_schema: UpdateGroupSchema,
+    group_service: GroupService,
+) -> None:
+    with pytest.raises(DoesNotExistError):
+        await group_service.update_group(user.id, uuid4(), update_group_schema)
 
-    group_members = await group_service.group_repository.get_many()
-    group_requests = await group_service.request_repository.get_many()
 
-    assert group_members == []
-    assert group_requests == []
+@pytest.mark.asyncio
+async def test_delete_group(
+    user: User,
+    group: Group,
+    group_service: GroupService,
+    purge_scheduler: FakePurgeScheduler,
+) -> None:
+    await group_service.delete_group(user.id, group.id)
 
     with pytest.raises(DoesNotExistError):
         await group_service.get_group(group.id)
 
+    assert len(purge_scheduler.scheduled) == 1
+    job = purge_scheduler.scheduled[0]
+    assert job.entity == PurgeEntity.GROUP
+    assert job.entity_id == group.id
+
 
 @pytest.mark.asyncio
 async def test_delete_group_other_user(
@@ -239,7 +284,7 @@ async def test_get_groups_for_user(
     group: Group,
     group_service: GroupService,
 ) -> None:
-    result = await group_service.get_groups_for_user(user.id)
+    result = (await group_service.get_groups_for_user(user.id)).items
 
     assert len(result) == 1
     assert result[0] == group
@@ -260,7 +305,7 @@ async def test_get_groups(
     group: Group,
     group_service: GroupService,
 ) -> None:
-    result = await group_service.get_groups()
+    result = (await group_service.get_groups()).items
 
     assert len(result) == 1
     assert result[0] == group
@@ -273,14 +318,14 @@ async def test_get_groups_with_filters(
 ) -> None:
     filters = GroupInputFilters(name__eq=group.name)
 
-    result = await group_service.get_groups(filters)
+    result = (await group_service.get_groups(filters)).items
 
     assert len(result) == 1
     assert result[0] == group
 
     filters = GroupInputFilters(name__eq="Other Name")
 
-    result = await group_service.get_groups(filters)
+    result = (await group_service.get_groups(filters)).items
 
     assert result == []
 
@@ -326,6 +371,17 @@ async def test_create_group_request_already_requested(
         await group_service.create_group_request(other_user.id, group.id, schema)
 
 
+@pytest.mark.asyncio
+async def test_create_group_request_wrong_group_id(
+    other_user: User,
+    group_service: GroupService,
+) -> None:
+    schema = CreateGroupRequestSchema(message="Test message")
+
+    with pytest.raises(DoesNotExistError):
+        await group_service.create_group_request(other_user.id, uuid4(), schema)
+
+
 @pytest.mark.asyncio
 async def test_update_group_request(
     user: User,
@@ -353,6 +409,45 @@ async def test_update_group_request(
     assert result.status == schema.status
 
 
+@pytest.mark.asyncio
+async def test_update_group_requests(
+    user: User,
+    group: Group,
+    other_user_group_request: GroupRequest,
+    group_service: GroupService,
+) -> None:
+    missing_id = uuid4()
+    schema = BulkUpdateGroupRequestsSchema(
+        ids=[other_user_group_request.id, missing_id],
+        status=GroupRequestStatus.ACCEPTED,
+    )
+
+    results = await group_service.update_group_requests(user.id, group.id, schema)
+
+    assert results == {
+        other_user_group_request.id: ReviewGroupRequestResult.REVIEWED,
+        missing_id: ReviewGroupRequestResult.REQUEST_DOES_NOT_EXIST,
+    }
+    members = (await group_service.get_group_members(user.id, group.id)).items
+    assert other_user_group_request.user_id in {member.user_id for member in members}
+
+
+@pytest.mark.asyncio
+async def test_update_group_requests_not_owner_or_admin(
+    other_user: User,
+    group: Group,
+    other_user_group_member: GroupMember,
+    group_service: GroupService,
+) -> None:
+    schema = BulkUpdateGroupRequestsSchema(
+        ids=[uuid4()],
+        status=GroupRequestStatus.ACCEPTED,
+    )
+
+    with pytest.raises(NotAGroupOwnerOrAdminError):
+        await group_service.update_group_requests(other_user.id, group.id, schema)
+
+
 @pytest.mark.asyncio
 async def test_update_group_request_wrong_group_id(
     user: User,
@@ -487,7 +582,7 @@ async def test_update_group_request_accepted(
         update_schema,
     )
 
-    members = await group_service.get_group_members(user.id, group.id)
+    members = (await group_service.get_group_members(user.id, group.id)).items
 
     assert len(members) == 2
 
@@ -510,12 +605,36 @@ async def test_update_group_request_declined(
         update_schema,
     )
 
-    members = await group_service.get_group_members(user.id, group.id)
+    members = (await group_service.get_group_members(user.id, group.id)).items
 
     assert len(members) == 1
     assert members[0].user_id == user.id
 
 
+@pytest.mark.asyncio
+async def test_update_group_request_accepted_already_member(
+    user: User,
+    other_user: User,
+    group: Group,
+    other_user_group_request: GroupRequest,
+    group_service: GroupService,
+) -> None:
+    await group_service.member_repository.persist(
+        GroupMember(user_id=other_user.id, group_id=group.id),
+    )
+    update_schema = UpdateGroupRequestSchema(
+        status=GroupRequestStatus.ACCEPTED,
+    )
+
+    with pytest.raises(AlreadyAGroupMemberError):
+        await group_service.update_group_request(
+            user.id,
+            group.id,
+            other_user_group_request.id,
+            update_schema,
+        )
+
+
 @pytest.mark.asyncio
 async def test_delete_group_request(
     other_user: User,
@@ -643,9 +762,10 @@ async def test_get_group_requests_for_user(
     other_user_group_request: GroupRequest,
     group_service: GroupService,
 ) -> None:
-    requests = await group_service.get_group_requests_for_user(
+    page = await group_service.get_group_requests_for_user(
         other_user.id,
     )
+    requests = page.items
 
     assert len(requests) == 1
     assert requests[0].id == other_user_group_request.id
@@ -707,7 +827,8 @@ async def test_get_group_requests_for_group_by_admin_or_owner(
     other_user_group_request: GroupRequest,
     group_service: GroupService,
 ) -> None:
-    requests = await group_service.get_group_requests_for_group(user.id, group.id)
+    page = await group_service.get_group_requests_for_group(user.id, group.id)
+    requests = page.items
 
     assert len(requests) == 1
     assert requests[0].id == other_user_group_request.id
@@ -720,7 +841,8 @@ async def test_get_group_requests_for_group_wrong_group_id(
     other_user_group_request: GroupRequest,
     group_service: GroupService,
 ) -> None:
-    requests = await group_service.get_group_requests_for_group(user.id, uuid4())
+    page = await group_service.get_group_requests_for_group(user.id, uuid4())
+    requests = page.items
 
     assert requests == []
 
@@ -732,7 +854,8 @@ async def test_get_group_requests_for_group_by_requesting_user(
     other_user_group_request: GroupRequest,
     group_service: GroupService,
 ) -> None:
-    requests = await group_service.get_group_requests_for_group(other_user.id, group.id)
+    page = await group_service.get_group_requests_for_group(other_user.id, group.id)
+    requests = page.items
 
     assert len(requests) == 1
     assert requests[0].id == other_user_group_request.id
@@ -773,10 +896,11 @@ async def test_get_group_requests_for_group_by_non_member(
         date_of_birth=date(1990, 1, 1),
     )
 
-    results = await group_service.get_group_requests_for_group(
+    page = await group_service.get_group_requests_for_group(
         request_user.id,
         group.id,
     )
+    results = page.items
 
     assert results == []
 
@@ -958,7 +1082,7 @@ async def test_update_group_member_owner(
     other_user_group_member: GroupMember,
     group_service: GroupService,
 ) -> None:
-    members = await group_service.get_group_members(user.id, group.id)
+    members = (await group_service.get_group_members(user.id, group.id)).items
     owner = next(member for member in members if member.is_owner)
 
     schema = UpdateGroupMemberSchema(
@@ -1014,7 +1138,7 @@ async def test_change_group_owner(
     other_user_group_member: GroupMember,
     group_service: GroupService,
 ) -> None:
-    members = await group_service.get_group_members(user.id, group.id)
+    members = (await group_service.get_group_members(user.id, group.id)).items
     owner = next(member for member in members if member.is_owner)
 
     await group_service.change_group_owner(
@@ -1113,7 +1237,7 @@ async def test_change_group_owner_to_existing_owner(
     group: Group,
     group_service: GroupService,
 ) -> None:
-    members = await group_service.get_group_members(user.id, group.id)
+    members = (await group_service.get_group_members(user.id, group.id)).items
     owner = next(member for member in members if member.is_owner)
 
     with pytest.raises(AlreadyAGroupOwnerError):
@@ -1145,6 +1269,30 @@ async def test_delete_group_member(
         )
 
 
+@pytest.mark.asyncio
+async def test_delete_group_members(
+    user: User,
+    group: Group,
+    other_user_group_member: GroupMember,
+    group_service: GroupService,
+) -> None:
+    owner = (await group_service.get_group_members(user.id, group.id)).items[0]
+    schema = BulkDeleteGroupMembersSchema(ids=[other_user_group_member.id, owner.id])
+
+    results = await group_service.delete_group_members(user.id, group.id, schema)
+
+    assert results == {
+        other_user_group_member.id: RemoveGroupMemberResult.REMOVED,
+        owner.id: RemoveGroupMemberResult.CANNOT_DELETE_A_GROUP_OWNER,
+    }
+    with pytest.raises(DoesNotExistError):
+        await group_service.get_group_member(
+            request_user_id=user.id,
+            group_id=group.id,
+            member_id=other_user_group_member.id,
+        )
+
+
 @pytest.mark.asyncio
 async def test_delete_group_member_wrong_group_id(
     user: User,
@@ -1226,7 +1374,7 @@ async def test_delete_group_member_owner(
     group: Group,
     group_service: GroupService,
 ) -> None:
-    members = await group_service.get_group_members(user.id, group.id)
+    members = (await group_service.get_group_members(user.id, group.id)).items
     owner = next(member for member in members if member.is_owner)
 
     with pytest.raises(CannotDeleteAGroupOwnerError):
@@ -1414,16 +1562,37 @@ async def test_get_group_members(
     other_user_group_member: GroupMember,
     group_service: GroupService,
 ) -> None:
-    members = await group_service.get_group_members(
+    page = await group_service.get_group_members(
         request_user_id=user.id,
         group_id=group.id,
     )
+    members = page.items
 
     assert len(members) == 2
     assert members[0].user_id == user.id
     assert members[1].user_id == other_user_group_member.user_id
 
 
+@pytest.mark.asyncio
+async def test_get_group_members_hides_deleting_users(
+    user: User,
+    other_user: User,
+    group: Group,
+    other_user_group_member: GroupMember,
+    group_service: GroupService,
+    user_repository: UserRepository,
+) -> None:
+    await user_repository.persist(other_user)
+    await user_repository.mark_deleting(other_user.id)
+
+    page = await group_service.get_group_members(
+        request_user_id=user.id,
+        group_id=group.id,
+    )
+
+    assert [member.user_id for member in page.items] == [user.id]
+
+
 @pytest.mark.asyncio
 async def test_get_group_members_invalid_group_id(
     user: User,
@@ -1444,10 +1613,11 @@ async def test_get_group_members_by_non_member(
     other_user_group_member: GroupMember,
     group_service: GroupService,
 ) -> None:
-    members = await group_service.get_group_members(
+    page = await group_service.get_group_members(
         request_user_id=uuid4(),
         group_id=group.id,
     )
+    members = page.items
 
     assert len(members) == 2
     assert members[0].user_id == user.id
@@ -1481,10 +1651,11 @@ async def test_get_group_members_by_member_private_group(
     group_schema = UpdateGroupSchema(is_private=True)  # type: ignore
     await group_service.update_group(user.id, group.id, group_schema)
 
-    members = await group_service.get_group_members(
+    page = await group_service.get_group_members(
         request_user_id=user.id,
         group_id=group.id,
     )
+    members = page.items
 
     assert len(members) == 2
     assert members[0].user_id == user.id
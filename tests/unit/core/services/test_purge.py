@@ -0,0 +1,123 @@
+from datetime import date
+
+import pytest
+import pytest_asyncio
+
+from src.core.enums.purge import PurgeEntity, PurgeStatus
+from src.core.interfaces.repositories.group import (
+    GroupMemberRepository,
+    GroupRepository,
+    GroupRequestRepository,
+)
+from src.core.interfaces.repositories.purge import PurgeJobRepository
+from src.core.interfaces.repositories.user import UserRepository
+from src.core.models.group import Group, GroupMember, GroupRequest
+from src.core.models.user import User
+from src.core.services.purge import PurgeJobRunner, PurgeService
+
+
+@pytest.fixture
+def runner(
+    purge_job_repository: PurgeJobRepository,
+    user_repository: UserRepository,
+    group_repository: GroupRepository,
+    group_member_repository: GroupMemberRepository,
+    group_request_repository: GroupRequestRepository,
+) -> PurgeJobRunner:
+    return PurgeJobRunner(
+        purge_job_repository,
+        user_repository,
+        group_repository,
+        group_member_repository,
+        group_request_repository,
+        batch_size=2,
+    )
+
+
+@pytest_asyncio.fixture
+async def owner(user_repository: UserRepository) -> User:
+    user = User(
+        email="owner@example.com",
+        password_hash="password",
+        date_of_birth=date(1990, 1, 1),
+    )
+    await user_repository.persist(user)
+    return user
+
+
+@pytest_asyncio.fixture
+async def group(
+    owner: User,
+    group_repository: GroupRepository,
+    group_member_repository: GroupMemberRepository,
+    group_request_repository: GroupRequestRepository,
+) -> Group:
+    group = Group(name="Test group")
+    await group_repository.persist(group)
+    await group_member_repository.persist(
+        GroupMember(user_id=owner.id, group_id=group.id, is_owner=True),
+    )
+    await group_member_repository.persist_many(
+        [GroupMember(user_id=owner.id, group_id=group.id) for _ in range(3)],
+    )
+    await group_request_repository.persist_many(
+        [GroupRequest(user_id=owner.id, group_id=group.id) for _ in range(2)],
+    )
+    return group
+
+
+@pytest.mark.asyncio
+async def test_run_group(
+    runner: PurgeJobRunner,
+    purge_service: PurgeService,
+    group: Group,
+    group_repository: GroupRepository,
+    group_member_repository: GroupMemberRepository,
+    group_request_repository: GroupRequestRepository,
+) -> None:
+    await group_repository.mark_deleting(group.id)
+    job = await purge_service.schedule(PurgeEntity.GROUP, group.id)
+
+    job = await runner.run(job.id)
+
+    assert job.status == PurgeStatus.DONE
+    assert job.deleted_rows == 6
+    assert job.finished_at is not None
+    assert await group_member_repository.get_many() == []
+    assert await group_request_repository.get_many() == []
+
+
+@pytest.mark.asyncio
+async def test_run_user_purges_owned_groups(
+    runner: PurgeJobRunner,
+    purge_service: PurgeService,
+    owner: User,
+    group: Group,
+    user_repository: UserRepository,
+    group_repository: GroupRepository,
+    group_member_repository: GroupMemberRepository,
+) -> None:
+    await user_repository.mark_deleting(owner.id)
+    job = await purge_service.schedule(PurgeEntity.USER, owner.id)
+
+    job = await runner.run(job.id)
+
+    assert job.status == PurgeStatus.DONE
+    assert await group_repository.get_many() == []
+    assert await group_member_repository.get_many() == []
+
+
+@pytest.mark.asyncio
+async def test_run_done_job(
+    runner: PurgeJobRunner,
+    purge_service: PurgeService,
+    group: Group,
+    group_repository: GroupRepository,
+) -> None:
+    await group_repository.mark_deleting(group.id)
+    job = await purge_service.schedule(PurgeEntity.GROUP, group.id)
+    await runner.run(job.id)
+
+    job = await runner.run(job.id)
+
+    assert job.deleted_rows == 6
@@ -4,16 +4,22 @@ from uuid import uuid4
 import pytest
 import pytest_asyncio
 from pytest_mock import MockerFixture
+from tests.fakes.purge import FakePurgeScheduler
 
+from src.core.enums.purge import PurgeEntity
 from src.core.exceptions import (
     AlreadyActiveError,
     AlreadyExistsError,
     DoesNotExistError,
     InvalidTokenError,
+    UserNotActiveError,
 )
 from src.core.models.user import User
+from src.core.pagination import Pagination
 from src.core.schemas.email import EmailSchema
+from src.core.schemas.group import CreateGroupSchema
 from src.core.schemas.user import CreateUserSchema, UpdateUserSchema
+from src.core.services.group import GroupService
 from src.core.services.user import UserService
 
 
@@ -82,11 +88,50 @@ async def test_get_user_does_not_exist(user_service: UserService) -> None:
 
 @pytest.mark.asyncio
 async def test_get_users(user_service: UserService, user: User) -> None:
-    users = await user_service.get_users()
+    users = (await user_service.get_users()).items
 
     assert users == [user]
 
 
+@pytest.mark.asyncio
+async def test_get_users_paginated(user_service: UserService) -> None:
+    users = [
+        await user_service.create_user(
+            CreateUserSchema(
+                email=f"test{index}@example.com",
+                password="password",
+                repeat_password="password",
+                date_of_birth=date(1990, 1, 1),
+            ),
+        )
+        for index in range(3)
+    ]
+
+    first_page = await user_service.get_users(Pagination(limit=2))
+    second_page = await user_service.get_users(
+        Pagination(limit=2, cursor=first_page.next_cursor),
+    )
+
+    assert first_page.items == users[:2]
+    assert first_page.next_cursor is not None
+    assert second_page.items == users[2:]
+    assert second_page.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_get_users_projected(user_service: UserService, user: User) -> None:
+    page = await user_service.get_users_projected(["email"])
+
+    assert len(page.items) == 1
+    projected = page.items[0]
+    assert projected.model_dump() == {
+        "id": user.id,
+        "created_at": user.created_at,
+        "updated_at": user.updated_at,
+        "email": user.email,
+    }
+
+
 @pytest.mark.asyncio
 async def test_update_user(
     user_service: UserService,
@@ -103,11 +148,38 @@ async def test_update_user(
 
 
 @pytest.mark.asyncio
-async def test_delete_user(user_service: UserService, user: User) -> None:
+async def test_delete_user(
+    user_service: UserService,
+    user: User,
+    purge_scheduler: FakePurgeScheduler,
+) -> None:
     await user_service.delete_user(user)
 
     with pytest.raises(DoesNotExistError):
         await user_service.get_user(user.id)
+    assert await user_service.repository.get_by_email(user.email) is None
+
+    assert len(purge_scheduler.scheduled) == 1
+    job = purge_scheduler.scheduled[0]
+    assert job.entity == PurgeEntity.USER
+    assert job.entity_id == user.id
+
+
+@pytest.mark.asyncio
+async def test_delete_user_hides_owned_groups(
+    user_service: UserService,
+    group_service: GroupService,
+    user: User,
+) -> None:
+    group = await group_service.create_group(
+        user.id,
+        CreateGroupSchema(name="Group", description="Description"),
+    )
+
+    await user_service.delete_user(user)
+
+    with pytest.raises(DoesNotExistError):
+        await group_service.get_group(group.id)
 
 
 @pytest.mark.asyncio
@@ -258,3 +330,22 @@ async def test_reset_password_invalid_token(
 
     assert user.password_reset_token is not None
     assert user.password_hash is not None
+
+
+@pytest.mark.asyncio
+async def test_deactivate_user(user_service: UserService, user: User) -> None:
+    user.activate()
+
+    await user_service.deactivate_user(user.id)
+
+    user = await user_service.get_user(user.id)
+    assert not user.is_active
+
+
+@pytest.mark.asyncio
+async def test_deactivate_user_already_inactive(
+    user_service: UserService,
+    user: User,
+) -> None:
+    with pytest.raises(UserNotActiveError):
+        await user_service.deactivate_user(user.id)
@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from src.core.admission import AdmissionController
+from src.core.exceptions import LoginThrottledError
+
+
+@pytest.mark.asyncio
+async def test_admit():
+    controller = AdmissionController(max_concurrency=1, max_queue=1, queue_timeout=1)
+
+    async with controller.admit():
+        assert controller.active == 1
+
+    assert controller.active == 0
+    assert controller.admitted == 1
+
+
+@pytest.mark.asyncio
+async def test_admit_waits_for_free_slot():
+    controller = AdmissionController(max_concurrency=1, max_queue=1, queue_timeout=1)
+    release = asyncio.Event()
+
+    async def hold_slot() -> None:
+        async with controller.admit():
+            await release.wait()
+
+    holder = asyncio.create_task(hold_slot())
+    await asyncio.sleep(0)
+
+    async def wait_for_slot() -> None:
+        async with controller.admit():
+            assert controller.active == 1
+
+    waiter = asyncio.create_task(wait_for_slot())
+    await asyncio.sleep(0)
+    assert controller.queue_depth == 1
+
+    release.set()
+    await asyncio.gather(holder, waiter)
+
+    assert controller.active == 0
+    assert controller.queue_depth == 0
+    assert controller.admitted == 2
+    assert controller.stats()["wait_time"]["count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_admit_queue_full():
+    controller = AdmissionController(max_concurrency=1, max_queue=0, queue_timeout=1)
+
+    async with controller.admit():
+        with pytest.raises(LoginThrottledError):
+            async with controller.admit():  # noqa: WPS328
+                pass  # noqa: WPS420
+
+    assert controller.rejected == 1
+    assert controller.active == 0
+
+
+@pytest.mark.asyncio
+async def test_admit_queue_timeout():
+    controller = AdmissionController(
+        max_concurrency=1,
+        max_queue=1,
+        queue_timeout=0.01,
+    )
+
+    async with controller.admit():
+        with pytest.raises(LoginThrottledError):
+            async with controller.admit():  # noqa: WPS328
+                pass  # noqa: WPS420
+
+        assert controller.queue_depth == 0
+
+    assert controller.rejected == 1
+    assert controller.active == 0
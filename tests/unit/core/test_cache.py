@@ -0,0 +1,105 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.core.cache import AccessTokenCache, TTLCache
+from src.core.models.user import User
+from src.core.schemas.jwt import JWTPayload
+
+
+class FakeTimer:
+    def __init__(self) -> None:
+        self.now: float = 0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def timer() -> FakeTimer:
+    return FakeTimer()
+
+
+@pytest.fixture
+def user() -> User:
+    return User(email="test@example.com", password_hash="password_hash")
+
+
+def test_ttl_cache_get_and_set(timer: FakeTimer):
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=10, timer=timer)
+
+    assert cache.get("key") is None
+    cache.set("key", 1)
+
+    assert cache.get("key") == 1
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_ttl_cache_expires_entries(timer: FakeTimer):
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=10, timer=timer)
+    cache.set("key", 1)
+    cache.set("short", 2, ttl=1)
+
+    timer.now = 5
+    assert cache.get("short") is None
+    assert cache.get("key") == 1
+
+    timer.now = 10
+    assert cache.get("key") is None
+    assert not cache
+
+
+def test_ttl_cache_evicts_least_recently_used(timer: FakeTimer):
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=10, timer=timer)
+    cache.set("first", 1)
+    cache.set("second", 2)
+    cache.get("first")
+
+    cache.set("third", 3)
+
+    assert cache.get("second") is None
+    assert cache.get("first") == 1
+    assert cache.get("third") == 3
+
+
+def test_ttl_cache_disabled():
+    cache: TTLCache[str, int] = TTLCache(maxsize=0, ttl=10)
+    cache.set("key", 1)
+
+    assert cache.get("key") is None
+
+
+def test_access_token_cache_returns_user_snapshot(user: User):
+    cache = AccessTokenCache(maxsize=10, ttl=10)
+    payload = JWTPayload(sub=user.id)
+    cache.set("token", payload, user)
+
+    user.first_name = "John"
+    cached = cache.get("token")
+
+    assert cached is not None
+    assert cached.payload == payload
+    assert cached.user.id == user.id
+    assert cached.user.first_name is None
+
+
+def test_access_token_cache_skips_expired_tokens(user: User):
+    cache = AccessTokenCache(maxsize=10, ttl=10)
+    payload = JWTPayload(sub=user.id, exp=datetime.utcnow() - timedelta(seconds=1))
+    cache.set("token", payload, user)
+
+    assert cache.get("token") is None
+
+
+def test_access_token_cache_invalidate_user(user: User):
+    cache = AccessTokenCache(maxsize=10, ttl=10)
+    other_user = User(email="other@example.com", password_hash="password_hash")
+    cache.set("token", JWTPayload(sub=user.id), user)
+    cache.set("other_token", JWTPayload(sub=other_user.id), other_user)
+
+    cache.invalidate_user(user.id)
+
+    assert cache.get("token") is None
+    assert cache.get("other_token") is not None
+    assert cache.stats() == {"size": 1, "maxsize": 10, "hits": 1, "misses": 1}
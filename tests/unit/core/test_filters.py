@@ -1,6 +1,7 @@
 import operator
 
 import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table
 
 from src.core.filters.base import Filter, FilterSet, SQLAlchemyFilter
 
@@ -67,3 +68,98 @@ def test_sqlalchemy_filter_from_filter():
     assert sqlalchemy_filter.field == filter_.field
     assert sqlalchemy_filter.operator == filter_.operator
     assert sqlalchemy_filter.value == filter_.value
+
+
+class RangeFilterSetTest(FilterSet):
+    name__ilike: str | None = None
+    name__prefix: str | None = None
+    age__in: list[int] | None = None
+    age__between: tuple[int, int] | None = None
+    email__isnull: bool | None = None
+
+
+@pytest.fixture
+def table():
+    return Table(
+        "item",
+        MetaData(),
+        Column("name", String),
+        Column("age", Integer),
+        Column("email", String),
+    )
+
+
+def _item(**kwargs):
+    return type("Item", (), {"name": "Alice", "age": 30, "email": None, **kwargs})()
+
+
+def test_get_filters_in_field_order():
+    filter_set = RangeFilterSetTest(age__in=[30], name__prefix="Al", email__isnull=None)
+
+    filters = filter_set.get_filters()
+
+    assert [(filter_.field, filter_.value) for filter_ in filters] == [
+        ("name", "Al"),
+        ("age", [30]),
+    ]
+    assert all(filter_(_item()) for filter_ in filters)
+
+
+def test_invalid_operator_is_rejected_on_class_definition():
+    with pytest.raises(ValueError, match="Invalid operator: like"):
+
+        class InvalidFilterSet(FilterSet):
+            name__like: str | None = None
+
+
+MATCH_CASES = [
+    ({"name__ilike": "LIC"}, _item(), True),
+    ({"name__ilike": "bob"}, _item(), False),
+    ({"name__ilike": "a%"}, _item(), False),
+    ({"name__prefix": "Al"}, _item(), True),
+    ({"name__prefix": "al"}, _item(), False),
+    ({"age__in": [10, 30]}, _item(), True),
+    ({"age__in": [10]}, _item(), False),
+    ({"age__between": (30, 40)}, _item(), True),
+    ({"age__between": (31, 40)}, _item(), False),
+    ({"age__between": (31, 40)}, _item(age=None), False),
+    ({"email__isnull": True}, _item(), True),
+    ({"email__isnull": False}, _item(), False),
+    ({"email__isnull": False, "age__in": [30]}, _item(email="a@b.c"), True),
+]
+
+
+@pytest.mark.parametrize(("filters", "item", "expected"), MATCH_CASES)
+def test_matches(filters, item, expected):
+    assert RangeFilterSetTest(**filters).matches(item) is expected
+
+
+def test_matches_skips_unset_and_none_filters():
+    assert RangeFilterSetTest(name__prefix=None).matches(_item()) is True
+
+
+def test_get_expressions(table: Table):
+    filter_set = RangeFilterSetTest(
+        name__ilike="a%",
+        name__prefix="Al",
+        age__in=[1, 2],
+        age__between=(1, 2),
+        email__isnull=False,
+    )
+
+    expressions = filter_set.get_expressions(table)
+
+    assert [str(expression) for expression in expressions] == [
+        "lower(item.name) LIKE '%' || lower(:name_1) || '%' ESCAPE '/'",
+        "item.name LIKE :name_1 || '%' ESCAPE '/'",
+        "item.age IN (__[POSTCOMPILE_age_1])",
+        "item.age BETWEEN :age_1 AND :age_2",
+        "item.email IS NOT NULL",
+    ]
+    assert expressions[0].compile().params["name_1"] == "a/%"
+
+
+def test_is_empty():
+    assert RangeFilterSetTest().is_empty()
+    assert RangeFilterSetTest(name__prefix=None).is_empty()
+    assert not RangeFilterSetTest(email__isnull=False).is_empty()
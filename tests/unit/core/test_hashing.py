@@ -0,0 +1,37 @@
+import asyncio
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+
+from src.core.exceptions import PasswordHashingOverloadedError
+from src.core.hashing import PasswordHasher
+
+
+@pytest_asyncio.fixture
+async def password_hasher() -> AsyncGenerator[PasswordHasher, None]:
+    hasher = PasswordHasher(max_workers=1, max_pending=1)
+    yield hasher
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify(password_hasher: PasswordHasher):
+    password_hash = await password_hasher.hash("password123")
+
+    assert password_hash != "password123"  # noqa: S105
+    assert await password_hasher.verify("password123", password_hash)
+    assert not await password_hasher.verify("invalid_password", password_hash)
+    assert password_hasher.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_hash_queue_full(password_hasher: PasswordHasher):
+    pending_hash = asyncio.create_task(password_hasher.hash("password123"))
+    await asyncio.sleep(0)
+
+    with pytest.raises(PasswordHashingOverloadedError):
+        await password_hasher.hash("password123")
+
+    await pending_hash
+    assert password_hasher.pending == 0
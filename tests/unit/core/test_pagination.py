@@ -0,0 +1,46 @@
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from src.core.exceptions import InvalidCursorError
+from src.core.models.group import Group
+from src.core.pagination import Cursor, Page, Pagination
+
+
+@pytest.fixture
+def groups() -> list[Group]:
+    return [Group(name=f"Group {index}") for index in range(3)]
+
+
+def test_cursor_encode_decode():
+    cursor = Cursor(created_at=datetime.now(), id=uuid4())
+
+    assert Cursor.decode(cursor.encode()) == cursor
+
+
+@pytest.mark.parametrize("value", ["", "not-a-cursor", "eyJmb28iOiAxfQ=="])
+def test_cursor_decode_invalid(value: str):
+    with pytest.raises(InvalidCursorError):
+        Cursor.decode(value)
+
+
+def test_pagination_after():
+    cursor = Cursor(created_at=datetime.now(), id=uuid4())
+
+    assert Pagination().after is None
+    assert Pagination(cursor=cursor.encode()).after == cursor
+
+
+def test_page_from_items_last_page(groups: list[Group]):
+    page = Page.from_items(groups, limit=3)
+
+    assert page.items == groups
+    assert page.next_cursor is None
+
+
+def test_page_from_items_with_next_page(groups: list[Group]):
+    page = Page.from_items(groups, limit=2)
+
+    assert page.items == groups[:2]
+    assert page.next_cursor == Cursor.from_model(groups[1]).encode()
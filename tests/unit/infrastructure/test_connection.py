@@ -0,0 +1,124 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+from sqlalchemy import select, text
+
+from src.infrastructure.database.connection import RequestConnection
+
+
+@pytest.fixture
+def async_connection(mocker: MockerFixture) -> AsyncMock:
+    conn = mocker.AsyncMock()
+    conn.in_transaction = MagicMock(return_value=True)
+    return conn
+
+
+@pytest.fixture
+def async_engine(mocker: MockerFixture, async_connection: AsyncMock) -> MagicMock:
+    engine = mocker.MagicMock()
+    engine.connect = mocker.AsyncMock(return_value=async_connection)
+    return engine
+
+
+@pytest.mark.asyncio
+async def test_connects_on_first_statement(
+    async_engine: MagicMock,
+    async_connection: AsyncMock,
+) -> None:
+    conn = RequestConnection(async_engine)
+
+    assert not conn.checked_out
+    async_engine.connect.assert_not_called()
+
+    await conn.execute(select(text("1")))
+    await conn.execute(select(text("1")))
+
+    assert conn.checked_out
+    async_engine.connect.assert_awaited_once()
+    async_connection.begin.assert_awaited_once()
+    assert async_connection.execute.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_read_only_uses_autocommit(
+    async_engine: MagicMock,
+    async_connection: AsyncMock,
+) -> None:
+    conn = RequestConnection(async_engine, read_only=True)
+
+    await conn.execute(select(text("1")))
+
+    async_connection.execution_options.assert_awaited_once_with(
+        isolation_level="AUTOCOMMIT",
+    )
+    async_connection.begin.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_release_commits(
+    async_engine: MagicMock,
+    async_connection: AsyncMock,
+) -> None:
+    conn = RequestConnection(async_engine)
+    await conn.execute(select(text("1")))
+
+    await conn.release()
+    await conn.release()
+
+    assert not conn.checked_out
+    async_connection.commit.assert_awaited_once()
+    async_connection.rollback.assert_not_called()
+    async_connection.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_release_rolls_back(
+    async_engine: MagicMock,
+    async_connection: AsyncMock,
+) -> None:
+    conn = RequestConnection(async_engine)
+    await conn.execute(select(text("1")))
+
+    await conn.release(commit=False)
+
+    async_connection.rollback.assert_awaited_once()
+    async_connection.commit.assert_not_called()
+    async_connection.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_release_without_statements(async_engine: MagicMock) -> None:
+    conn = RequestConnection(async_engine)
+
+    await conn.release()
+
+    async_engine.connect.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_after_commit_runs_once_committed(async_engine: MagicMock) -> None:
+    conn = RequestConnection(async_engine)
+    callback = MagicMock()
+    await conn.execute(select(text("1")))
+
+    conn.after_commit(callback)
+    callback.assert_not_called()
+    await conn.release()
+    await conn.release()
+
+    callback.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_after_commit_dropped_on_rollback(async_engine: MagicMock) -> None:
+    conn = RequestConnection(async_engine)
+    callback = MagicMock()
+    await conn.execute(select(text("1")))
+
+    conn.after_commit(callback)
+    await conn.release(commit=False)
+    await conn.execute(select(text("1")))
+    await conn.release()
+
+    callback.assert_not_called()
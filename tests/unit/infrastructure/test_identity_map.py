@@ -0,0 +1,44 @@
+from src.core.models.group import Group
+from src.infrastructure.database.identity_map import IdentityMap
+from src.infrastructure.database.tables.group import group_member_table, group_table
+
+
+def test_add_keeps_first_model() -> None:
+    identity_map = IdentityMap()
+    group = Group(name="Test group")
+    copy = group.model_copy()
+
+    assert identity_map.add(group_table, group.id, group) is group
+    assert identity_map.add(group_table, group.id, copy) is group
+    assert identity_map.get(group_table, group.id) is group
+
+
+def test_set_replaces_model() -> None:
+    identity_map = IdentityMap()
+    group = Group(name="Test group")
+    copy = group.model_copy()
+    identity_map.add(group_table, group.id, group)
+
+    identity_map.set(group_table, group.id, copy)
+
+    assert identity_map.get(group_table, group.id) is copy
+
+
+def test_keys_are_per_table() -> None:
+    identity_map = IdentityMap()
+    group = Group(name="Test group")
+    identity_map.add(group_table, group.id, group)
+
+    assert identity_map.get(group_member_table, group.id) is None
+
+
+def test_remove_all() -> None:
+    identity_map = IdentityMap()
+    groups = [Group(name="Test group") for _ in range(2)]
+    for group in groups:
+        identity_map.add(group_table, group.id, group)
+    identity_map.add(group_member_table, groups[0].id, groups[0])
+
+    identity_map.remove_all(group_table)
+
+    assert len(identity_map) == 1
@@ -0,0 +1,47 @@
+import asyncio
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.infrastructure.database.loader import BatchLoader
+
+
+@pytest.mark.asyncio
+async def test_load_batches_keys(mocker: MockerFixture) -> None:
+    load_many = mocker.AsyncMock(return_value={1: "one", 2: "two"})
+    loader = BatchLoader(load_many)
+
+    results = await asyncio.gather(
+        loader.load(2),
+        loader.load(1),
+        loader.load(3),
+        loader.load(2),
+    )
+
+    assert results == ["two", "one", None, "two"]
+    load_many.assert_awaited_once_with([2, 1, 3])
+
+
+@pytest.mark.asyncio
+async def test_load_starts_new_batch_after_dispatch(mocker: MockerFixture) -> None:
+    load_many = mocker.AsyncMock(return_value={1: "one"})
+    loader = BatchLoader(load_many)
+
+    await loader.load(1)
+    await loader.load(1)
+
+    assert load_many.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_load_propagates_errors(mocker: MockerFixture) -> None:
+    load_many = mocker.AsyncMock(side_effect=RuntimeError)
+    loader = BatchLoader(load_many)
+
+    results = await asyncio.gather(
+        loader.load(1),
+        loader.load(2),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
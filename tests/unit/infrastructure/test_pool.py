@@ -0,0 +1,39 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from src.infrastructure.database.pool import InstrumentedAsyncAdaptedQueuePool
+
+
+@pytest.fixture
+def pool(mocker: MockerFixture) -> InstrumentedAsyncAdaptedQueuePool:
+    return InstrumentedAsyncAdaptedQueuePool(
+        mocker.Mock,
+        pool_size=1,
+        max_overflow=1,
+    )
+
+
+def test_stats_empty(pool: InstrumentedAsyncAdaptedQueuePool) -> None:
+    stats = pool.stats()
+
+    assert stats["size"] == 1
+    assert stats["checked_out"] == 0
+    assert stats["waiters"] == 0
+    assert stats["checkout_latency"]["count"] == 0
+
+
+def test_stats_checkout(pool: InstrumentedAsyncAdaptedQueuePool) -> None:
+    first = pool.connect()
+    second = pool.connect()
+
+    stats = pool.stats()
+
+    assert stats["checked_out"] == 2
+    assert stats["overflow"] == 1
+    assert stats["waiters"] == 0
+    assert stats["checkout_latency"]["count"] == 2
+
+    first.close()
+    second.close()
+
+    assert pool.stats()["checked_out"] == 0
@@ -0,0 +1,88 @@
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.infrastructure.database.replicas import EngineRouter
+
+
+def _engine(mocker: MockerFixture, checked_out: int = 0) -> MagicMock:
+    engine = mocker.MagicMock()
+    engine.pool.checkedout.return_value = checked_out
+    return engine
+
+
+def _unreachable_engine(mocker: MockerFixture) -> MagicMock:
+    engine = _engine(mocker)
+    engine.connect.side_effect = OSError("connection refused")
+    return engine
+
+
+def test_reader_without_replicas(mocker: MockerFixture) -> None:
+    primary = _engine(mocker)
+    router = EngineRouter(primary)
+
+    assert router.reader() is primary
+
+
+def test_reader_round_robin(mocker: MockerFixture) -> None:
+    primary = _engine(mocker)
+    replicas = [_engine(mocker), _engine(mocker)]
+    router = EngineRouter(primary, replicas)
+
+    readers = [router.reader() for _ in range(4)]
+
+    assert readers == [*replicas, *replicas]
+
+
+def test_reader_least_connections(mocker: MockerFixture) -> None:
+    primary = _engine(mocker)
+    replicas = [_engine(mocker, checked_out=3), _engine(mocker, checked_out=1)]
+    router = EngineRouter(primary, replicas, selection="least_connections")
+
+    assert router.reader() is replicas[1]
+
+
+def test_reader_skips_unhealthy(mocker: MockerFixture) -> None:
+    primary = _engine(mocker)
+    replicas = [_engine(mocker), _engine(mocker)]
+    router = EngineRouter(primary, replicas)
+
+    router.mark_unhealthy(replicas[0])
+
+    assert all(router.reader() is replicas[1] for _ in range(3))
+
+
+def test_reader_falls_back_to_primary(mocker: MockerFixture) -> None:
+    primary = _engine(mocker)
+    replica = _engine(mocker)
+    router = EngineRouter(primary, [replica])
+
+    router.mark_unhealthy(replica)
+
+    assert router.reader() is primary
+
+
+@pytest.mark.asyncio
+async def test_check_health(mocker: MockerFixture) -> None:
+    primary = _engine(mocker)
+    healthy = _engine(mocker)
+    unreachable = _unreachable_engine(mocker)
+    router = EngineRouter(primary, [healthy, unreachable])
+
+    await router.check_health()
+
+    assert router.healthy_replicas == [healthy]
+    assert [replica["healthy"] for replica in router.stats()] == [True, False]
+
+
+@pytest.mark.asyncio
+async def test_check_health_recovers(mocker: MockerFixture) -> None:
+    primary = _engine(mocker)
+    replica = _engine(mocker)
+    router = EngineRouter(primary, [replica])
+    router.mark_unhealthy(replica)
+
+    await router.check_health()
+
+    assert router.healthy_replicas == [replica]
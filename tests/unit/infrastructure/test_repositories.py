@@ -0,0 +1,397 @@
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from asyncpg import ForeignKeyViolationError, UniqueViolationError
+from pytest_mock import MockerFixture
+from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
+from sqlalchemy.dialects.postgresql.psycopg2 import PGDialect_psycopg2
+from sqlalchemy.engine.result import IteratorResult, SimpleResultMetaData
+
+from src.core.exceptions import AlreadyExistsError, DoesNotExistError
+from src.core.filters.group import GroupFilterSet
+from src.core.models.group import Group, GroupMember, GroupRequest
+from src.core.models.user import User
+from src.infrastructure.database.connection import RequestConnection
+from src.infrastructure.database.tables.group import group_table
+from src.infrastructure.repositories.group import (
+    GroupRepository,
+    GroupRequestRepository,
+)
+from src.infrastructure.repositories.raw import (
+    RawGroupMemberRepository,
+    RawUserRepository,
+)
+
+
+@pytest.fixture
+def async_connection(mocker: MockerFixture) -> AsyncMock:
+    return mocker.AsyncMock()
+
+
+def _returning(async_connection: AsyncMock, mocker: MockerFixture, **row) -> None:
+    returned = IteratorResult(
+        SimpleResultMetaData(list(row)),
+        iter([tuple(row.values())]),
+    ).one()
+    result = mocker.MagicMock(__iter__=lambda _: iter([returned]))
+    result.first.return_value = returned
+    result.one.return_value = returned
+    async_connection.execute.return_value = result
+
+
+@pytest.mark.asyncio
+async def test_update_writes_changed_fields(
+    async_connection: AsyncMock,
+    mocker: MockerFixture,
+) -> None:
+    group = Group(name="Test group")
+    group.name = "New name"
+    updated_at = datetime(2030, 1, 1)
+    _returning(async_connection, mocker, name="New name", updated_at=updated_at)
+
+    await GroupRepository(async_connection).update(group)
+
+    stmt = async_connection.execute.await_args.args[0]
+    assert set(stmt.compile().params) == {"name", "id_1"}
+    assert group.updated_at == updated_at
+    assert group.changed_fields == frozenset()
+
+
+@pytest.mark.asyncio
+async def test_update_without_changes(async_connection: AsyncMock) -> None:
+    group = Group(name="Test group")
+
+    await GroupRepository(async_connection).update(group)
+
+    async_connection.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_update_selected_fields(
+    async_connection: AsyncMock,
+    mocker: MockerFixture,
+) -> None:
+    group = Group(name="Test group")
+    group.name = "New name"
+    group.description = "Description"
+    _returning(async_connection, mocker, name="New name", description=None)
+
+    await GroupRepository(async_connection).update(group, fields_to_update=["name"])
+
+    stmt = async_connection.execute.await_args.args[0]
+    assert set(stmt.compile().params) == {"name", "id_1"}
+    assert group.description == "Description"
+    assert group.changed_fields == {"description"}
+
+
+@pytest.mark.asyncio
+async def test_persist_refreshes_model(
+    async_connection: AsyncMock,
+    mocker: MockerFixture,
+) -> None:
+    group = Group(name="Test group")
+    created_at = datetime(2030, 1, 1)
+    _returning(async_connection, mocker, created_at=created_at)
+
+    await GroupRepository(async_connection).persist(group)
+
+    assert group.created_at == created_at
+    assert group.changed_fields == frozenset()
+
+
+@pytest.fixture
+def request_connection(
+    mocker: MockerFixture,
+    async_connection: AsyncMock,
+) -> RequestConnection:
+    async_engine = mocker.MagicMock()
+    async_engine.connect = mocker.AsyncMock(return_value=async_connection)
+    return RequestConnection(async_engine)
+
+
+@pytest.mark.asyncio
+async def test_get_returns_mapped_model(
+    request_connection: RequestConnection,
+    async_connection: AsyncMock,
+) -> None:
+    group = Group(name="Test group")
+    repository = GroupRepository(request_connection)
+    request_connection.identity_map.add(group_table, group.id, group)
+
+    assert await repository.get(group.id) is group
+    async_connection.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_maps_loaded_model(
+    request_connection: RequestConnection,
+    async_connection: AsyncMock,
+    mocker: MockerFixture,
+) -> None:
+    group = Group(name="Test group")
+    _returning(async_connection, mocker, **group.model_dump())
+    repository = GroupRepository(request_connection)
+
+    loaded = await repository.get(group.id)
+
+    assert await repository.get(group.id) is loaded
+    assert async_connection.execute.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_release_clears_identity_map(
+    request_connection: RequestConnection,
+) -> None:
+    group = Group(name="Test group")
+    request_connection.identity_map.add(group_table, group.id, group)
+
+    await request_connection.release()
+
+    assert request_connection.identity_map.get(group_table, group.id) is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_gets_share_one_query(
+    request_connection: RequestConnection,
+    async_connection: AsyncMock,
+    mocker: MockerFixture,
+) -> None:
+    group = Group(name="Test group")
+    missing_id = uuid4()
+    _returning(async_connection, mocker, **group.model_dump())
+
+    found, missing = await asyncio.gather(
+        GroupRepository(request_connection).get(group.id),
+        GroupRepository(request_connection).get(missing_id),
+        return_exceptions=True,
+    )
+
+    assert isinstance(found, Group)
+    assert found.id == group.id
+    assert isinstance(missing, DoesNotExistError)
+    _, params = async_connection.execute.await_args.args
+    assert params == {"ids": [group.id, missing_id]}
+    assert async_connection.execute.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_hot_queries_reuse_statements(
+    async_connection: AsyncMock,
+    mocker: MockerFixture,
+) -> None:
+    group = Group(name="Test group")
+    _returning(async_connection, mocker, **group.model_dump())
+
+    await GroupRepository(async_connection).get(group.id)
+    await GroupRepository(async_connection).get(group.id)
+
+    first, second = async_connection.execute.await_args_list
+    assert first.args[0] is second.args[0]
+    assert second.args[1] == {"ids": [group.id]}
+
+
+@pytest.mark.asyncio
+async def test_get_many_projected(
+    request_connection: RequestConnection,
+    async_connection: AsyncMock,
+    mocker: MockerFixture,
+) -> None:
+    group = Group(name="Test group", description="Description")
+    _returning(
+        async_connection,
+        mocker,
+        **group.model_dump(include={"id", "created_at", "updated_at", "name"}),
+    )
+
+    repository = GroupRepository(request_connection)
+    projections = await repository.get_many_projected(["name"])
+
+    stmt = async_connection.execute.await_args.args[0]
+    column_names = [column.name for column in stmt.selected_columns]
+    assert column_names == ["id", "created_at", "updated_at", "name"]
+    assert len(projections) == 1
+    projected = projections[0]
+    assert isinstance(projected, Group.projection(["name"]))
+    assert projected.name == group.name
+    assert not request_connection.identity_map
+
+
+def _driver(async_connection: AsyncMock, mocker: MockerFixture):
+    driver = mocker.MagicMock()
+    driver.copy_records_to_table = mocker.AsyncMock()
+    driver.is_in_transaction = mocker.MagicMock(return_value=True)
+    async_connection.get_raw_connection.return_value = mocker.MagicMock(
+        driver_connection=driver,
+    )
+    async_connection.dialect = PGDialect_asyncpg()
+    return driver
+
+
+@pytest.mark.asyncio
+async def test_bulk_persist_copies_chunks(
+    async_connection: AsyncMock,
+    mocker: MockerFixture,
+) -> None:
+    driver = _driver(async_connection, mocker)
+    requests = [GroupRequest(user_id=uuid4(), group_id=uuid4()) for _ in range(3)]
+
+    count = await GroupRequestRepository(async_connection).bulk_persist(
+        iter(requests),
+        chunk_size=2,
+    )
+
+    assert count == 3
+    first, second = driver.copy_records_to_table.await_args_list
+    assert first.args == ("group_request",)
+    columns = first.kwargs["columns"]
+    assert set(columns) == set(GroupRequest.model_fields)
+    assert len(first.kwargs["records"]) == 2
+    assert len(second.kwargs["records"]) == 1
+    record = dict(zip(columns, first.kwargs["records"][0]))
+    assert record["id"] == requests[0].id
+    assert record["status"] == "PENDING"
+    async_connection.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("error", [UniqueViolationError, ForeignKeyViolationError])
+async def test_bulk_persist_already_exists(
+    async_connection: AsyncMock,
+    mocker: MockerFixture,
+    error: type[Exception],
+) -> None:
+    driver = _driver(async_connection, mocker)
+    driver.copy_records_to_table.side_effect = error
+
+    with pytest.raises(AlreadyExistsError):
+        await GroupRepository(async_connection).bulk_persist([Group(name="Test")])
+
+
+@pytest.mark.asyncio
+async def test_bulk_persist_falls_back_to_executemany(
+    async_connection: AsyncMock,
+    mocker: MockerFixture,
+) -> None:
+    async_connection.dialect = PGDialect_psycopg2()
+    groups = [Group(name=f"Test {index}") for index in range(3)]
+
+    count = await GroupRepository(async_connection).bulk_persist(groups, chunk_size=2)
+
+    assert count == 3
+    async_connection.get_raw_connection.assert_not_awaited()
+    first, second = async_connection.execute.await_args_list
+    assert first.args[1] == [group.model_dump() for group in groups[:2]]
+    assert second.args[1] == [groups[2].model_dump()]
+
+
+@pytest.mark.asyncio
+async def test_update_many(
+    request_connection: RequestConnection,
+    async_connection: AsyncMock,
+    mocker: MockerFixture,
+) -> None:
+    group = Group(name="Test group")
+    request_connection.identity_map.add(group_table, group.id, group)
+    async_connection.execute.return_value = mocker.MagicMock(rowcount=2)
+
+    count = await GroupRepository(request_connection).update_many(
+        GroupFilterSet(is_private__eq=True),
+        {"is_private": False},
+    )
+
+    assert count == 2
+    stmt = async_connection.execute.await_args.args[0]
+    assert str(stmt) == (
+        'UPDATE "group" SET is_private=:is_private, updated_at=now() '
+        'WHERE "group".is_private = true AND "group".deleting_at IS NULL'
+    )
+    assert not request_connection.identity_map
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("values", [{}, {"id": uuid4()}, {"unknown": 1}])
+async def test_update_many_invalid_values(
+    async_connection: AsyncMock,
+    values: dict,
+) -> None:
+    with pytest.raises(ValueError):
+        await GroupRepository(async_connection).update_many(GroupFilterSet(), values)
+    async_connection.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_delete_many(
+    async_connection: AsyncMock,
+    mocker: MockerFixture,
+) -> None:
+    async_connection.execute.return_value = mocker.MagicMock(rowcount=3)
+
+    count = await GroupRepository(async_connection).delete_many(
+        GroupFilterSet(name__eq="Test group"),
+    )
+
+    assert count == 3
+    stmt = async_connection.execute.await_args.args[0]
+    assert str(stmt) == (
+        'DELETE FROM "group" WHERE "group".name = :name_1 '
+        'AND "group".deleting_at IS NULL'
+    )
+
+
+@pytest.mark.asyncio
+async def test_delete_many_requires_filter(async_connection: AsyncMock) -> None:
+    with pytest.raises(ValueError):
+        await GroupRepository(async_connection).delete_many(GroupFilterSet())
+    async_connection.execute.assert_not_awaited()
+
+
+def _fetching(async_connection: AsyncMock, mocker: MockerFixture, *records):
+    driver = mocker.MagicMock()
+    driver.fetch = mocker.AsyncMock(return_value=list(records))
+    async_connection.get_raw_connection.return_value = mocker.MagicMock(
+        driver_connection=driver,
+    )
+    async_connection.dialect = PGDialect_asyncpg()
+    return driver
+
+
+@pytest.mark.asyncio
+async def test_raw_user_repository_get(
+    async_connection: AsyncMock,
+    mocker: MockerFixture,
+) -> None:
+    user = User(email="user@example.com", password_hash="hash")
+    driver = _fetching(async_connection, mocker, user.model_dump())
+
+    assert await RawUserRepository(async_connection).get(user.id) == user
+
+    sql, ids = driver.fetch.await_args.args
+    assert 'WHERE "user".id = ANY ($1::UUID[]) AND "user".deleting_at IS NULL' in sql
+    assert ids == [user.id]
+    async_connection.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_raw_group_member_repository_get_by_user_and_group_id(
+    async_connection: AsyncMock,
+    mocker: MockerFixture,
+) -> None:
+    member = GroupMember(user_id=uuid4(), group_id=uuid4())
+    driver = _fetching(async_connection, mocker, member.model_dump())
+    repository = RawGroupMemberRepository(async_connection)
+
+    result = await repository.get_by_user_and_group_id(
+        member.user_id,
+        member.group_id,
+    )
+
+    assert result == member
+    _, *args = driver.fetch.await_args.args
+    assert args == [member.user_id, member.group_id, 1]
+
+    driver.fetch.return_value = []
+    with pytest.raises(DoesNotExistError):
+        await repository.get_by_user_and_group_id(member.user_id, member.group_id)